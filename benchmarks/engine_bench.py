@@ -0,0 +1,273 @@
+"""
+Benchmark del motor de pasos (StepEngine).
+
+Resuelve un corpus de ecuaciones de todos los tipos que reconoce
+identify_type y mide por separado cada etapa: parseo, clasificación,
+extracción de coeficientes, integrate, simplify y LaTeX. Reporta
+p50/p95/p99 por etapa y guarda los resultados en JSON para comparar
+ejecuciones entre commits.
+
+Uso:
+    python benchmarks/engine_bench.py -o bench.json
+    python benchmarks/engine_bench.py --limit 50 --compare bench.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+# Permitir importaciones absolutas desde src al ejecutar el script directamente
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import sympy
+
+from src.engine.expr_memo import ExpressionMemo
+from src.engine.step_engine import StepEngine, ENGINE_VERSION
+
+
+STAGES = ("parse", "classify", "coefficients", "integrate", "simplify", "latex", "total")
+PERCENTILES = (50, 95, 99)
+
+
+def build_corpus() -> List[str]:
+    """
+    Corpus fijo de ecuaciones, agrupado por el tipo que debería identificarse.
+
+    Se genera combinando plantillas, así que es reproducible sin archivos
+    externos y cubre cada rama del motor.
+    """
+    corpus = []
+
+    # Lineales de primer orden: y' + P(x) y = Q(x). Las combinaciones con
+    # P variable se eligen para que las integrales sean elementales; con
+    # Q arbitraria aparecen erf/Ei y una sola ecuación tarda minutos.
+    p_terms = ["2", "3", "-1", "-2", "4", "1/2", "1/x", "1/(x+1)"]
+    q_terms = ["e^x", "x", "sin(x)", "x^2", "1", "e^(-x)", "cos(x)", "x e^x"]
+    for p, q in itertools.product(p_terms, q_terms):
+        corpus.append(f"y' + ({p})y = {q}")
+    for eq in ("y' + 2xy = x", "y' + 2xy = 2x e^(-x^2)", "y' - 2xy = x",
+               "y' + cos(x)y = cos(x)", "y' + cos(x)y = sin(x)cos(x)",
+               "y' + x^2 y = x^2", "y' + 3x^2 y = x^2", "y' + y/x = x^2",
+               "y' + 2y/x = 1/x^2", "y' - y/x = x e^x"):
+        corpus.append(eq)
+
+    # Variables separables: y' = f(x) g(y)
+    f_terms = ["x", "x^2", "e^x", "sin(x)", "1/x", "(1+x)", "cos(x)", "2x"]
+    g_terms = ["y^2", "1/y", "e^y", "y^3", "y^4", "1/y^2", "(1+y^2)", "sqrt(y)"]
+    for f, g in itertools.product(f_terms, g_terms):
+        corpus.append(f"y' = {f}*{g}")
+
+    # Segundo orden homogénea con coeficientes constantes: y'' + b y' + c y = 0
+    for b, c in itertools.product(range(-3, 4), range(-3, 5)):
+        corpus.append(f"y'' + ({b})y' + ({c})y = 0")
+
+    # Segundo orden no homogénea con coeficientes constantes
+    for (b, c), g in itertools.product([(0, 1), (3, 2), (2, 1), (0, -1), (1, 1), (0, 4)],
+                                       ["e^(2x)", "x", "sin(x)", "x^2", "e^x", "1", "cos(2x)", "x e^x"]):
+        corpus.append(f"y'' + ({b})y' + ({c})y = {g}")
+
+    # Primer orden no clasificadas (Riccati, Bernoulli, no lineales)
+    for a, b in itertools.product(["", "2", "x"], ["x^2", "x", "1", "e^x"]):
+        corpus.append(f"y' = {a}y^2 + {b}" if a else f"y' = y^2 + {b}")
+    for n in (2, 3):
+        for p in ("1", "x", "1/x"):
+            corpus.append(f"y' + ({p})y = x y^{n}")
+
+    # Segundo orden con coeficientes variables y órdenes superiores
+    for eq in ("x^2 y'' + x y' - y = 0", "x^2 y'' - 2y = 0", "y'' + x y' = 0",
+               "y'' = x y'", "y''' - y = 0", "y''' + y' = 0", "y''' - 3y'' + 3y' - y = 0"):
+        corpus.append(eq)
+
+    # No diferenciales
+    for eq in ("x^2 + 1 = 0", "y + x = 2", "sin(x) = 0", "2x + 3 = 7"):
+        corpus.append(eq)
+
+    return corpus
+
+
+class _TimedMemo(ExpressionMemo):
+    """ExpressionMemo que acumula el tiempo de cada operación."""
+
+    def __init__(self):
+        super().__init__()
+        self.elapsed: Dict[str, float] = defaultdict(float)
+
+    def _timed(self, stage: str, method, *args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self.elapsed[stage] += time.perf_counter() - start
+
+    def integrate(self, expr, var):
+        return self._timed("integrate", super().integrate, expr, var)
+
+    def simplify(self, expr):
+        return self._timed("simplify", super().simplify, expr)
+
+    def latex(self, expr) -> str:
+        return self._timed("latex", super().latex, expr)
+
+
+def _extract_coefficients(engine: StepEngine, analysis):
+    """Ejecuta la extracción de coeficientes que corresponde al tipo."""
+    if analysis.order == 1:
+        if analysis.eq_type == "Lineal de Primer Orden":
+            return engine._extract_linear_coefficients(analysis.expr)
+        return engine._separate_variables(analysis.expr)
+    if analysis.order == 2:
+        return engine._extract_second_order_coefficients(analysis.expr)
+    return None
+
+
+def measure(equation: str) -> Dict:
+    """
+    Resuelve una ecuación con un motor nuevo (cachés frías) y mide cada etapa.
+
+    Returns:
+        Dict con la ecuación, su tipo y los segundos de cada etapa
+    """
+    memo = _TimedMemo()
+    engine = StepEngine(memo=memo)
+    timings = {}
+
+    start = time.perf_counter()
+    lhs, rhs = engine._parse_equation(equation)
+    timings["parse"] = time.perf_counter() - start
+
+    t = time.perf_counter()
+    analysis = engine.analyze(equation)
+    # analyze reutiliza el parseo ya cacheado: lo que mide es la clasificación
+    timings["classify"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    _extract_coefficients(engine, analysis)
+    timings["coefficients"] = time.perf_counter() - t
+
+    memo.elapsed.clear()
+    steps = list(engine._solution_body(analysis))
+    timings["total"] = time.perf_counter() - start
+    for stage in ("integrate", "simplify", "latex"):
+        timings[stage] = memo.elapsed.get(stage, 0.0)
+
+    return {
+        "equation": equation,
+        "type": analysis.eq_type,
+        "steps": len(steps),
+        "final_step": steps[-1].step_type if steps else None,
+        "timings": timings,
+    }
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentil q (0-100) por interpolación lineal."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(results: List[Dict]) -> Dict[str, Dict[str, float]]:
+    """p50/p95/p99 y total (en milisegundos) de cada etapa."""
+    summary = {}
+    for stage in STAGES:
+        values = [r["timings"][stage] * 1000 for r in results]
+        summary[stage] = {f"p{q}": round(percentile(values, q), 3) for q in PERCENTILES}
+        summary[stage]["sum"] = round(sum(values), 3)
+    return summary
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def print_summary(summary: Dict, baseline: Dict = None):
+    header = f"{'etapa':<14}" + "".join(f"{f'p{q} (ms)':>12}" for q in PERCENTILES)
+    if baseline:
+        header += f"{'Δ p50':>10}{'Δ p95':>10}"
+    print(header)
+    for stage in STAGES:
+        row = f"{stage:<14}" + "".join(f"{summary[stage][f'p{q}']:>12.3f}" for q in PERCENTILES)
+        if baseline and stage in baseline:
+            for q in (50, 95):
+                old = baseline[stage][f"p{q}"]
+                new = summary[stage][f"p{q}"]
+                delta = (new - old) / old * 100 if old else 0.0
+                row += f"{delta:>+9.1f}%"
+        print(row)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python benchmarks/engine_bench.py",
+        description="Mide el tiempo de cada etapa del motor sobre un corpus de EDOs."
+    )
+    parser.add_argument("-o", "--output", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="Usar solo las primeras N ecuaciones del corpus")
+    parser.add_argument("--compare", help="JSON de una ejecución anterior para comparar")
+    args = parser.parse_args(argv)
+
+    corpus = build_corpus()
+    if args.limit:
+        corpus = corpus[:args.limit]
+
+    # Calentar imports y cachés internas de SymPy para no medirlos en la primera ecuación
+    measure("y' + y = x")
+
+    results = []
+    for index, equation in enumerate(corpus, 1):
+        results.append(measure(equation))
+        print(f"\r⏱️ {index}/{len(corpus)}", end="", file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+
+    summary = summarize(results)
+    by_type = defaultdict(int)
+    for r in results:
+        by_type[r["type"]] += 1
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["summary"]
+
+    print_summary(summary, baseline)
+    print()
+    for eq_type, count in sorted(by_type.items()):
+        print(f"  {count:>4}  {eq_type}")
+
+    if args.output:
+        report = {
+            "commit": _git_commit(),
+            "engine_version": ENGINE_VERSION,
+            "python": platform.python_version(),
+            "sympy": sympy.__version__,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "equations": len(results),
+            "summary": summary,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ Resultados guardados en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
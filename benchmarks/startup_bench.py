@@ -0,0 +1,169 @@
+"""
+Benchmark de arranque de la aplicación.
+
+Mide, en procesos nuevos (arranque en frío de Python), el tiempo hasta que
+la ventana principal se pinta por primera vez, e indica qué módulos
+pesados (SymPy, NumPy, Matplotlib) ya estaban importados en ese momento.
+
+Uso:
+    python benchmarks/startup_bench.py --runs 10 -o startup.json
+    python benchmarks/startup_bench.py --compare startup.json
+"""
+
+import time
+
+# Marca lo más temprana posible del proceso hijo (antes de importar Qt)
+_PROCESS_START = time.perf_counter()
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Dict, List
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+HEAVY_MODULES = ("sympy", "numpy", "matplotlib")
+PERCENTILES = (50, 95)
+METRICS = ("imports", "window", "first_paint", "process")
+
+
+def measure_child() -> Dict:
+    """
+    Abre la ventana principal en este proceso y mide hasta el primer pintado.
+
+    Returns:
+        Dict con los segundos desde el inicio del proceso hasta cada hito y
+        los módulos pesados cargados al pintar
+    """
+    # Permitir importaciones absolutas desde src al ejecutar el script directamente
+    sys.path.append(ROOT)
+
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+    from src.ui.main_window import MainWindow
+    timings = {"imports": time.perf_counter() - _PROCESS_START}
+
+    app = QApplication(sys.argv[:1])
+    window = MainWindow(db=None, user_id=None)
+    timings["window"] = time.perf_counter() - _PROCESS_START
+    loaded = {}
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and "first_paint" not in timings:
+                timings["first_paint"] = time.perf_counter() - _PROCESS_START
+                loaded.update({name: name in sys.modules for name in HEAVY_MODULES})
+                QTimer.singleShot(0, app.quit)
+            return False
+
+    paint_filter = FirstPaint()
+    window.installEventFilter(paint_filter)
+    window.show()
+    # Sin pintado (p. ej. plataforma sin pantalla) no se espera indefinidamente
+    QTimer.singleShot(10000, app.quit)
+    app.exec()
+
+    return {"timings": timings, "loaded": loaded}
+
+
+def run_once() -> Dict:
+    """Lanza un proceso nuevo que mide el arranque y devuelve su resultado."""
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child"],
+        capture_output=True, text=True, cwd=ROOT, check=True
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    # Incluye el arranque del intérprete, que el hijo no puede medir
+    result["timings"]["process"] = time.perf_counter() - start
+    return result
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentil q (0-100) por interpolación lineal."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(results: List[Dict]) -> Dict[str, Dict[str, float]]:
+    """p50/p95 y mínimo (en milisegundos) de cada hito."""
+    summary = {}
+    for metric in METRICS:
+        values = [r["timings"][metric] * 1000 for r in results if metric in r["timings"]]
+        summary[metric] = {f"p{q}": round(percentile(values, q), 1) for q in PERCENTILES}
+        summary[metric]["min"] = round(min(values), 1) if values else 0.0
+    return summary
+
+
+def print_summary(summary: Dict, baseline: Dict = None):
+    header = f"{'hito':<14}" + "".join(f"{f'p{q} (ms)':>12}" for q in PERCENTILES) + f"{'min (ms)':>12}"
+    if baseline:
+        header += f"{'Δ p50':>10}"
+    print(header)
+    for metric in METRICS:
+        row = f"{metric:<14}" + "".join(f"{summary[metric][f'p{q}']:>12.1f}" for q in PERCENTILES)
+        row += f"{summary[metric]['min']:>12.1f}"
+        if baseline and metric in baseline:
+            old = baseline[metric]["p50"]
+            new = summary[metric]["p50"]
+            delta = (new - old) / old * 100 if old else 0.0
+            row += f"{delta:>+9.1f}%"
+        print(row)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python benchmarks/startup_bench.py",
+        description="Mide el tiempo hasta el primer pintado de la ventana principal."
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Número de arranques a medir")
+    parser.add_argument("-o", "--output", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--compare", help="JSON de una ejecución anterior para comparar")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_child()))
+        return 0
+
+    results = []
+    for index in range(1, args.runs + 1):
+        results.append(run_once())
+        print(f"\r⏱️ {index}/{args.runs}", end="", file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+
+    summary = summarize(results)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["summary"]
+
+    print_summary(summary, baseline)
+    loaded = [name for name in HEAVY_MODULES if any(r["loaded"].get(name) for r in results)]
+    print(f"\nMódulos pesados cargados al primer pintado: {', '.join(loaded) or 'ninguno'}")
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "runs": len(results),
+            "summary": summary,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ Resultados guardados en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
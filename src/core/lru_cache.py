@@ -0,0 +1,100 @@
+"""
+Caché LRU genérica para CalcQuest.
+Acotada, segura para hilos y con contadores de aciertos, fallos y desalojos.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Caché LRU (Least Recently Used) acotada y segura para hilos.
+
+    Cuando se supera el tamaño máximo se desaloja la entrada usada
+    hace más tiempo. Con una función de peso (p. ej. los bytes de una
+    imagen), el límite se aplica a la suma de los pesos en lugar de al
+    número de entradas.
+
+    Attributes:
+        maxsize: Número máximo de entradas, o peso total máximo si hay weigher
+        hits: Número de consultas que encontraron la clave
+        misses: Número de consultas que no la encontraron
+        evictions: Número de entradas desalojadas por falta de espacio
+    """
+
+    def __init__(self, maxsize: int = 256, weigher: Optional[Callable[[Any], int]] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize debe ser mayor que 0")
+        self.maxsize = maxsize
+        self.weigher = weigher
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._weights: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retorna el valor asociado a la clave y lo marca como reciente."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Guarda un valor, desalojando las entradas más antiguas si hace falta.
+
+        Un valor que por sí solo pesa más que maxsize no se guarda.
+        """
+        weight = self.weigher(value) if self.weigher else 1
+        with self._lock:
+            if key in self._data:
+                self.weight -= self._weights.pop(key)
+                del self._data[key]
+            if weight > self.maxsize:
+                return
+            self._data[key] = value
+            self._weights[key] = weight
+            self.weight += weight
+            while self.weight > self.maxsize:
+                old_key, _ = self._data.popitem(last=False)
+                self.weight -= self._weights.pop(old_key)
+                self.evictions += 1
+
+    def clear(self):
+        """Elimina todas las entradas (los contadores se conservan)."""
+        with self._lock:
+            self._data.clear()
+            self._weights.clear()
+            self.weight = 0
+
+    def stats(self) -> Dict:
+        """Retorna los contadores de la caché."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'weight': self.weight,
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
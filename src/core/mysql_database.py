@@ -977,6 +977,13 @@ class MySQLDatabase:
                 respuesta_normalizada == ans.lower().replace(" ", "")
                 for ans in exercise.get('respuestas_correctas', [])
             )
+            if not is_correct and exercise.get('tipo_respuesta') == 'ecuacion':
+                # Ecuaciones equivalentes escritas de otra forma (orden, constantes...)
+                from src.engine.equivalence import answers_equivalent
+                is_correct = any(
+                    answers_equivalent(respuesta, ans)
+                    for ans in exercise.get('respuestas_correctas', [])
+                )
         
         # Obtener progreso actual del ejercicio
         cursor.execute("""
@@ -0,0 +1,98 @@
+"""
+Resolución por lotes de ecuaciones diferenciales.
+
+Lee ecuaciones de un archivo de texto (una por línea) o JSONL (un objeto
+por línea con el campo "equation" o "ecuacion") y escribe los pasos de
+cada solución en formato JSONL, usando todos los núcleos disponibles.
+
+Uso:
+    python -m src.engine.batch problemas.txt -o soluciones.jsonl
+    python -m src.engine.batch problemas.jsonl --workers 8 --timeout 60
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List
+
+from src.engine.service import get_engine
+
+
+def read_equations(path: str) -> List[Dict]:
+    """
+    Lee las ecuaciones de entrada.
+
+    Args:
+        path: Archivo .txt (una ecuación por línea, '#' para comentarios) o .jsonl
+
+    Returns:
+        Lista de registros; cada uno tiene al menos el campo 'equation'
+    """
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            if path.endswith(".jsonl"):
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_number}: JSON inválido: {e}")
+                equation = record.get("equation", record.get("ecuacion"))
+                if not equation:
+                    raise ValueError(f"{path}:{line_number}: falta el campo 'equation'")
+                record["equation"] = equation
+            else:
+                record = {"equation": line}
+            records.append(record)
+    return records
+
+
+def write_results(records: List[Dict], results: List[List], out):
+    """Escribe un objeto JSON por ecuación con sus pasos serializados."""
+    for record, steps in zip(records, results):
+        output = dict(record)
+        output["steps"] = [step.to_dict() for step in steps]
+        out.write(json.dumps(output, ensure_ascii=False) + "\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.engine.batch",
+        description="Genera soluciones paso a paso para un lote de ecuaciones."
+    )
+    parser.add_argument("input", help="Archivo de ecuaciones (.txt o .jsonl)")
+    parser.add_argument("-o", "--output", help="Archivo JSONL de salida (por defecto, stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Número de procesos (por defecto, todos los núcleos)")
+    parser.add_argument("-t", "--timeout", type=float, default=None,
+                        help="Tiempo máximo por ecuación en segundos")
+    args = parser.parse_args(argv)
+
+    try:
+        records = read_equations(args.input)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    engine = get_engine()
+    results = engine.solve_many(
+        [record["equation"] for record in records],
+        workers=args.workers,
+        timeout=args.timeout
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            write_results(records, results, out)
+    else:
+        write_results(records, results, sys.stdout)
+
+    print(f"✅ {len(records)} ecuaciones resueltas.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Equivalencia de respuestas simbólicas para los ejercicios.
+
+Dos respuestas como "C1cos(2x)+C2sin(2x)" y "y = C2 sin(2x) + C1 cos(2x)"
+son la misma solución aunque sus textos difieran. Aquí se parsean con el
+parser del motor y se comparan numéricamente en puntos aleatorios
+(vectorizado con NumPy), probando los renombres posibles de las
+constantes. La comparación simbólica solo se usa si la numérica no es
+concluyente.
+"""
+
+import itertools
+import re
+from typing import List, Optional
+
+import numpy as np
+from sympy import Symbol, lambdify, simplify
+
+from src.engine.service import get_engine
+
+
+# Parámetros de la comparación numérica
+_SAMPLES = 24
+_TOLERANCE = 1e-8
+_MIN_VALID_FRACTION = 0.25
+_X_RANGE = (0.1, 2.0)
+_CONSTANT_RANGE = (-2.0, 2.0)
+
+# Con más constantes, los renombres posibles crecen demasiado (n!)
+_MAX_CONSTANTS = 4
+
+# Nombres de constantes arbitrarias: una mayúscula, con o sin subíndice (A, C, C1...)
+_CONSTANT_NAME = re.compile(r"[A-Z]\d*")
+
+
+def _to_expression(text: str):
+    """
+    Convierte una respuesta en una expresión comparable.
+
+    "y = f(x)" (o "f(x) = y") se reduce a f(x); una ecuación implícita
+    F = G se reduce a F - G; una expresión suelta se usa tal cual.
+    """
+    engine = get_engine()
+    lhs, rhs = engine.parse(text)
+    if lhs == engine.y:
+        expr = rhs
+    elif rhs == engine.y:
+        expr = lhs
+    else:
+        expr = lhs - rhs
+    return _normalize_constants(expr, engine.x)
+
+
+def _normalize_constants(expr, x):
+    """
+    Renombra las constantes arbitrarias (A, B, C1, C2...) a C1, C2... en
+    orden alfabético, para que A e^x y C1 e^x se comparen igual.
+    """
+    names = sorted(
+        (s for s in expr.free_symbols - {x} if _CONSTANT_NAME.fullmatch(s.name)),
+        key=lambda s: s.name
+    )
+    renames = {s: Symbol(f"C{index}") for index, s in enumerate(names, start=1)}
+    # Simultáneo: B -> C1 no debe chocar con una C1 que también se renombra
+    return expr.subs(renames, simultaneous=True)
+
+
+def _constants(expr, x) -> List:
+    """Constantes arbitrarias: todo símbolo libre distinto de x, en orden estable."""
+    return sorted(expr.free_symbols - {x}, key=lambda s: s.name)
+
+
+def _numeric_equivalent(answer, expected, x, answer_constants, expected_constants) -> Optional[bool]:
+    """
+    Compara en puntos aleatorios probando cada renombre de constantes.
+
+    Returns:
+        True si algún renombre coincide en todos los puntos, False si
+        ninguno coincide, o None si no se pudo evaluar
+    """
+    try:
+        f_answer = lambdify([x] + answer_constants, answer, modules="numpy")
+        f_expected = lambdify([x] + expected_constants, expected, modules="numpy")
+    except Exception:
+        return None
+
+    rng = np.random.default_rng(0)
+    x_values = rng.uniform(*_X_RANGE, _SAMPLES).astype(complex)
+    constant_values = [
+        rng.uniform(*_CONSTANT_RANGE, _SAMPLES).astype(complex) for _ in expected_constants
+    ]
+
+    with np.errstate(all="ignore"):
+        try:
+            target = np.broadcast_to(
+                np.asarray(f_expected(x_values, *constant_values), dtype=complex), (_SAMPLES,))
+        except Exception:
+            return None
+
+        conclusive = False
+        # La constante i-ésima de la respuesta toma el valor de permutation[i]
+        for permutation in itertools.permutations(constant_values):
+            try:
+                values = np.broadcast_to(
+                    np.asarray(f_answer(x_values, *permutation), dtype=complex), (_SAMPLES,))
+            except Exception:
+                continue
+            valid = np.isfinite(values) & np.isfinite(target)
+            if valid.sum() < max(1, int(_SAMPLES * _MIN_VALID_FRACTION)):
+                continue
+            conclusive = True
+            error = np.abs(values[valid] - target[valid])
+            scale = 1.0 + np.abs(target[valid])
+            if np.all(error <= _TOLERANCE * scale):
+                return True
+
+    return False if conclusive else None
+
+
+def _symbolic_equivalent(answer, expected, answer_constants, expected_constants) -> bool:
+    """Comparación simbólica (lenta), solo para casos no concluyentes."""
+    for permutation in itertools.permutations(expected_constants):
+        renamed = answer.subs(dict(zip(answer_constants, permutation)), simultaneous=True)
+        try:
+            if simplify(renamed - expected) == 0:
+                return True
+        except Exception:
+            continue
+    return False
+
+
+def answers_equivalent(answer: str, expected: str) -> Optional[bool]:
+    """
+    Indica si dos respuestas de tipo ecuación son matemáticamente iguales.
+
+    Las constantes (C, C1, C2...) pueden estar renombradas u ordenadas de
+    otra forma; y = f(x) y f(x) se consideran la misma respuesta.
+
+    Args:
+        answer: Respuesta del estudiante
+        expected: Respuesta correcta
+
+    Returns:
+        True o False, o None si alguna de las dos no se pudo parsear
+        (el llamador debe recurrir a la comparación de texto)
+    """
+    try:
+        answer_expr = _to_expression(answer)
+        expected_expr = _to_expression(expected)
+    except Exception:
+        return None
+
+    x = get_engine().x
+    answer_constants = _constants(answer_expr, x)
+    expected_constants = _constants(expected_expr, x)
+    if len(answer_constants) != len(expected_constants):
+        return False
+    if len(expected_constants) > _MAX_CONSTANTS:
+        return None
+
+    result = _numeric_equivalent(answer_expr, expected_expr, x,
+                                 answer_constants, expected_constants)
+    if result is not None:
+        return result
+    return _symbolic_equivalent(answer_expr, expected_expr,
+                                answer_constants, expected_constants)
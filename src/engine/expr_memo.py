@@ -0,0 +1,91 @@
+"""
+Memoización de operaciones costosas de SymPy para el motor de pasos.
+
+Las soluciones repiten las mismas subexpresiones (el factor integrante,
+μ(x)·Q(x), etc.) tanto dentro de una resolución como entre ecuaciones
+parecidas. Este módulo guarda los resultados de integrate, simplify y
+latex en cachés LRU indexadas por la estructura de la expresión.
+"""
+
+import threading
+from typing import Dict, Optional
+
+from sympy import integrate, latex
+
+from src.core.lru_cache import LRUCache
+from src.engine.simplification import budgeted_simplify
+
+
+class ExpressionMemo:
+    """
+    Cachés acotadas para integrate, simplify y latex.
+
+    Las expresiones de SymPy son inmutables y su hash es estructural, por
+    lo que sirven directamente como claves: dos expresiones iguales
+    comparten entrada aunque se hayan construido por caminos distintos.
+    """
+
+    DEFAULT_MAXSIZE = 1024
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Args:
+            maxsize: Número máximo de resultados guardados por operación
+        """
+        self._integrate = LRUCache(maxsize=maxsize)
+        self._simplify = LRUCache(maxsize=maxsize)
+        self._latex = LRUCache(maxsize=maxsize)
+
+    def integrate(self, expr, var):
+        """Integral indefinida de expr respecto a var (sin constante)."""
+        key = (expr, var)
+        result = self._integrate.get(key)
+        if result is None:
+            result = integrate(expr, var)
+            self._integrate.put(key, result)
+        return result
+
+    def simplify(self, expr):
+        """Forma simplificada de expr (con presupuesto, ver budgeted_simplify)."""
+        result = self._simplify.get(expr)
+        if result is None:
+            result = budgeted_simplify(expr)
+            self._simplify.put(expr, result)
+        return result
+
+    def latex(self, expr) -> str:
+        """Representación LaTeX de expr."""
+        result = self._latex.get(expr)
+        if result is None:
+            result = latex(expr)
+            self._latex.put(expr, result)
+        return result
+
+    def clear(self):
+        """Vacía las tres cachés."""
+        self._integrate.clear()
+        self._simplify.clear()
+        self._latex.clear()
+
+    def stats(self) -> Dict[str, Dict]:
+        """Retorna los contadores de cada caché (aciertos, fallos, tasa de acierto...)."""
+        return {
+            'integrate': self._integrate.stats(),
+            'simplify': self._simplify.stats(),
+            'latex': self._latex.stats()
+        }
+
+
+# Instancia compartida por todos los motores del proceso
+_shared_memo: Optional[ExpressionMemo] = None
+_shared_memo_lock = threading.Lock()
+
+
+def shared_memo() -> ExpressionMemo:
+    """Retorna la memoización compartida del proceso (se crea al primer uso)."""
+    global _shared_memo
+    if _shared_memo is None:
+        with _shared_memo_lock:
+            if _shared_memo is None:
+                _shared_memo = ExpressionMemo()
+    return _shared_memo
@@ -0,0 +1,74 @@
+"""
+Huella canónica de ecuaciones.
+
+"y' + 2y = e^x", "2y + y' - e^x = 0" y "2y' + 4y = 2e^x" son la misma
+ecuación. La forma canónica mueve todo a un lado y divide entre el
+coeficiente numérico del término principal (la derivada de mayor orden),
+de modo que la huella sirve como clave de caché en el motor, el
+renderizado y el banco de ejercicios.
+"""
+
+import hashlib
+
+from sympy import Add, Derivative, S, default_sort_key, srepr
+
+
+def _leading_term(expr):
+    """Término que fija la escala: el de la derivada de mayor orden (o el mayor, si no hay)."""
+    terms = sorted(Add.make_args(expr), key=default_sort_key)
+
+    def derivative_order(term):
+        return max((d.derivative_count for d in term.atoms(Derivative)), default=0)
+
+    top_order = max(derivative_order(term) for term in terms)
+    candidates = [term for term in terms if derivative_order(term) == top_order]
+    return candidates[-1]
+
+
+def leading_coefficient(lhs, rhs=S.Zero):
+    """
+    Coeficiente numérico del término principal de lhs - rhs (con su signo).
+
+    Es el factor entre el que canonical_form divide; junto con la huella
+    identifica la ecuación tal como se escribió (con su escala).
+    """
+    expr = lhs - rhs
+    if expr == 0:
+        return S.One
+    coefficient, _ = _leading_term(expr).as_coeff_Mul()
+    return coefficient if coefficient != 0 else S.One
+
+
+def canonical_form(lhs, rhs=S.Zero):
+    """
+    Forma canónica de la ecuación lhs = rhs.
+
+    El orden de los términos ya es canónico en SymPy; aquí se pasa todo
+    a un lado y se divide entre el coeficiente numérico del término
+    principal, incluido el signo. No se expande la expresión.
+
+    Args:
+        lhs, rhs: Lados de la ecuación (rhs = 0 para una expresión suelta)
+
+    Returns:
+        Expresión E tal que la ecuación equivale a E = 0
+    """
+    expr = lhs - rhs
+    coefficient = leading_coefficient(expr)
+    if coefficient != 1:
+        expr = expr / coefficient
+    return expr
+
+
+def fingerprint(lhs, rhs=S.Zero) -> str:
+    """
+    Huella (hash SHA-256 en hexadecimal) de la forma canónica.
+
+    Args:
+        lhs, rhs: Lados de la ecuación (rhs = 0 para una expresión suelta)
+
+    Returns:
+        Cadena hexadecimal de 64 caracteres
+    """
+    canonical = srepr(canonical_form(lhs, rhs))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,424 @@
+"""
+Parser de ecuaciones de CalcQuest.
+
+Analizador Pratt escrito a mano para la notación que escriben los
+estudiantes (y', y'', dy/dx, e^x, multiplicación implícita como 2xy o
+C1cos(2x)). Construye los árboles de SymPy directamente, sin pasar por
+las transformaciones y el eval de parse_expr, e informa la posición
+exacta de los errores de sintaxis.
+"""
+
+from typing import List, Tuple
+
+import sympy
+from sympy import Derivative, Float, Integer, Symbol, sympify
+
+
+class ParseError(ValueError):
+    """
+    Error de sintaxis en la ecuación.
+
+    Attributes:
+        position: Índice (desde 0) del carácter donde se detectó el error
+        text: Entrada completa
+    """
+
+    def __init__(self, message: str, position: int, text: str = ""):
+        super().__init__(f"{message} (posición {position + 1})")
+        self.message = message
+        self.position = position
+        self.text = text
+
+    def pointer(self) -> str:
+        """Entrada con una marca '^' bajo la posición del error."""
+        return f"{self.text}\n{' ' * self.position}^"
+
+
+# Funciones reconocidas (nombre en la entrada -> función de SymPy)
+FUNCTIONS = {
+    'sin': sympy.sin, 'cos': sympy.cos, 'tan': sympy.tan,
+    'sec': sympy.sec, 'csc': sympy.csc, 'cot': sympy.cot,
+    'asin': sympy.asin, 'acos': sympy.acos, 'atan': sympy.atan,
+    'arcsin': sympy.asin, 'arccos': sympy.acos, 'arctan': sympy.atan,
+    'sinh': sympy.sinh, 'cosh': sympy.cosh, 'tanh': sympy.tanh,
+    'exp': sympy.exp, 'log': sympy.log, 'ln': sympy.log,
+    'sqrt': sympy.sqrt, 'abs': sympy.Abs,
+}
+
+# Constantes con nombre de más de una letra
+CONSTANTS = {
+    'pi': sympy.pi,
+}
+
+# Nombres de varias letras, del más largo al más corto (búsqueda voraz)
+_NAMES = sorted(list(FUNCTIONS) + list(CONSTANTS), key=len, reverse=True)
+
+# Notaciones de Leibniz para la derivada (texto -> orden)
+_LEIBNIZ = (
+    ("d^2y/dx^2", 2), ("d²y/dx²", 2), ("dy/dx", 1),
+)
+
+# Caracteres alternativos que se aceptan
+_ALIASES = {'·': '*', '×': '*', '−': '-', '÷': '/'}
+_SUPERSCRIPTS = {'²': '2', '³': '3'}
+
+# Potencias de enlace (binding power) de los operadores infijos
+_BP_ADD = 10
+_BP_MUL = 20
+_BP_UNARY = 25
+_BP_POW = 30
+
+
+class _Token:
+    __slots__ = ("kind", "value", "pos")
+
+    def __init__(self, kind: str, value, pos: int):
+        self.kind = kind    # num, var, y, func, deriv, op, (, ), =, end
+        self.value = value
+        self.pos = pos
+
+
+class EquationParser:
+    """
+    Convierte texto en expresiones de SymPy.
+
+    Uso:
+        parser = EquationParser(x, Function('y'))
+        lhs, rhs = parser.parse("y' + 2y = e^x")
+    """
+
+    def __init__(self, x: Symbol, y_func):
+        self.x = x
+        self.y_func = y_func
+        self.y = y_func(x)
+        self._symbols = {'x': x}
+
+    # ------------------------------------------------------------------
+    # Análisis léxico
+    # ------------------------------------------------------------------
+
+    def _tokenize(self, text: str) -> List[_Token]:
+        tokens = []
+        i = 0
+        n = len(text)
+        while i < n:
+            ch = _ALIASES.get(text[i], text[i])
+
+            if ch.isspace():
+                i += 1
+                continue
+
+            if ch.isdigit() or (ch == '.' and i + 1 < n and text[i + 1].isdigit()):
+                start = i
+                while i < n and text[i].isdigit():
+                    i += 1
+                if i < n and text[i] == '.':
+                    i += 1
+                    while i < n and text[i].isdigit():
+                        i += 1
+                    tokens.append(_Token("num", Float(text[start:i]), start))
+                else:
+                    tokens.append(_Token("num", Integer(text[start:i]), start))
+                continue
+
+            if ch in _SUPERSCRIPTS:
+                tokens.append(_Token("op", "^", i))
+                tokens.append(_Token("num", Integer(_SUPERSCRIPTS[ch]), i))
+                i += 1
+                continue
+
+            if ch == 'd':
+                leibniz = next(((s, o) for s, o in _LEIBNIZ if text.startswith(s, i)), None)
+                if leibniz is not None:
+                    tokens.append(_Token("deriv", leibniz[1], i))
+                    i += len(leibniz[0])
+                    continue
+
+            if ch.isalpha():
+                i = self._tokenize_name(text, i, tokens)
+                continue
+
+            if ch == '*' and text.startswith('**', i):
+                tokens.append(_Token("op", "^", i))
+                i += 2
+                continue
+            if ch in '+-*/^':
+                tokens.append(_Token("op", ch, i))
+                i += 1
+                continue
+            if ch in '([{':
+                tokens.append(_Token("(", ch, i))
+                i += 1
+                continue
+            if ch in ')]}':
+                tokens.append(_Token(")", ch, i))
+                i += 1
+                continue
+            if ch == '=':
+                tokens.append(_Token("=", ch, i))
+                i += 1
+                continue
+
+            raise ParseError(f"Carácter inesperado '{text[i]}'", i, text)
+
+        tokens.append(_Token("end", None, n))
+        return tokens
+
+    def _tokenize_name(self, text: str, i: int, tokens: List[_Token]) -> int:
+        """
+        Parte una secuencia de letras en nombres: funciones y constantes
+        conocidas (voraz, la más larga primero) o variables de una letra.
+        Así 'xy' es x·y y 'xsin' es x·sin.
+        """
+        n = len(text)
+        end = i
+        while end < n and text[end].isalpha():
+            end += 1
+        for j in range(i, end):
+            if text[j].isupper() and self._is_capitalized_word(text, j, end):
+                # Nombres como Derivative o Integral no son notación de CalcQuest;
+                # una mayúscula suelta es una constante (A, B, Ae^x = A·e^x)
+                raise ParseError(f"Nombre desconocido '{text[i:end]}'", i, text)
+        
+        while i < n and text[i].isalpha():
+            name = next((nm for nm in _NAMES if text.startswith(nm, i)), None)
+            if name is not None:
+                kind = "func" if name in FUNCTIONS else "var"
+                value = FUNCTIONS[name] if kind == "func" else CONSTANTS[name]
+                tokens.append(_Token(kind, value, i))
+                i += len(name)
+                continue
+
+            letter = text[i]
+            start = i
+            i += 1
+            if letter == 'y':
+                # y, y', y'', y'''...
+                order = 0
+                while i < n and text[i] == "'":
+                    order += 1
+                    i += 1
+                tokens.append(_Token("y", order, start))
+                continue
+            if letter == 'C':
+                # Constantes de integración: C, C1, C2...
+                while i < n and text[i].isdigit():
+                    i += 1
+                tokens.append(_Token("var", self._symbol(text[start:i]), start))
+                continue
+            if letter == 'e':
+                tokens.append(_Token("var", sympy.E, start))
+                continue
+            tokens.append(_Token("var", self._symbol(letter), start))
+        return i
+
+    @staticmethod
+    def _is_capitalized_word(text: str, start: int, end: int) -> bool:
+        """
+        Indica si la mayúscula de text[start] empieza una palabra (p. ej.
+        Derivative): la siguen tres o más minúsculas que no empiezan por
+        una función conocida (Asin(x) sí es A·sin(x)).
+        """
+        tail_end = start + 1
+        while tail_end < end and text[tail_end].islower():
+            tail_end += 1
+        tail = text[start + 1:tail_end]
+        return len(tail) >= 3 and not any(tail.startswith(name) for name in _NAMES)
+
+    def _symbol(self, name: str) -> Symbol:
+        symbol = self._symbols.get(name)
+        if symbol is None:
+            symbol = self._symbols[name] = Symbol(name)
+        return symbol
+
+    # ------------------------------------------------------------------
+    # Análisis sintáctico (Pratt)
+    # ------------------------------------------------------------------
+
+    def parse(self, text: str) -> Tuple:
+        """
+        Parsea una ecuación o expresión.
+
+        Args:
+            text: Entrada del usuario
+
+        Returns:
+            Tuple (lhs, rhs) si hay '=', o (expr, 0) si no hay
+
+        Raises:
+            ParseError: Si la entrada no es válida
+        """
+        return _PrattParse(self, text).run()
+
+
+class _PrattParse:
+    """Estado de un único parseo (el EquationParser se puede compartir entre hilos)."""
+
+    def __init__(self, parser: EquationParser, text: str):
+        self.parser = parser
+        self._text = text
+        self._tokens = parser._tokenize(text)
+        self._index = 0
+
+    def run(self) -> Tuple:
+        text = self._text
+        if self._peek().kind == "end":
+            raise ParseError("La ecuación está vacía", 0, text)
+
+        lhs = self._expression(0)
+        rhs = sympify(0)
+        if self._peek().kind == "=":
+            self._advance()
+            rhs = self._expression(0)
+        token = self._peek()
+        if token.kind != "end":
+            raise ParseError(f"Símbolo inesperado '{self._text_of(token)}'", token.pos, text)
+        return lhs, rhs
+
+    def _peek(self) -> _Token:
+        return self._tokens[self._index]
+
+    def _advance(self) -> _Token:
+        token = self._tokens[self._index]
+        self._index += 1
+        return token
+
+    def _text_of(self, token: _Token) -> str:
+        if token.kind == "end":
+            return "fin de la entrada"
+        return self._text[token.pos]
+
+    def _expect(self, kind: str, description: str) -> _Token:
+        token = self._peek()
+        if token.kind != kind:
+            found = "el final de la entrada" if token.kind == "end" else f"'{self._text_of(token)}'"
+            raise ParseError(f"Se esperaba {description} y se encontró {found}", token.pos, self._text)
+        return self._advance()
+
+    def _expression(self, min_bp: int):
+        left = self._prefix()
+        while True:
+            token = self._peek()
+            if token.kind == "op":
+                op = token.value
+                if op in "+-":
+                    bp = _BP_ADD
+                elif op in "*/":
+                    bp = _BP_MUL
+                else:
+                    bp = _BP_POW
+                if bp <= min_bp:
+                    break
+                op_token = self._advance()
+                if op == "^" and left == sympy.E and self._text[op_token.pos] == "^":
+                    right = self._glued_exponent()
+                else:
+                    # '^' asocia a la derecha: 2^3^2 = 2^(3^2)
+                    right = self._expression(bp - 1 if op == "^" else bp)
+                if op == "+":
+                    left = left + right
+                elif op == "-":
+                    left = left - right
+                elif op == "*":
+                    left = left * right
+                elif op == "/":
+                    left = left / right
+                else:
+                    left = left ** right
+            elif token.kind in ("num", "var", "y", "func", "deriv", "("):
+                # Multiplicación implícita: 2x, x(x+1), 3y', 2sin(x)
+                if _BP_MUL <= min_bp:
+                    break
+                right = self._expression(_BP_MUL)
+                left = left * right
+            else:
+                break
+        return left
+
+    def _is_explicit_call(self) -> bool:
+        """Indica si siguen exactamente '(' x ')', es decir, y(x)."""
+        tokens = self._tokens[self._index:self._index + 3]
+        return (
+            len(tokens) == 3
+            and [t.kind for t in tokens] == ["(", "var", ")"]
+            and tokens[1].value == self.parser.x
+        )
+
+    def _is_exponent_atom(self, token: _Token) -> bool:
+        return token.kind in ("num", "var") or (token.kind == "y" and token.value == 0)
+
+    def _glued_exponent(self):
+        """
+        Exponente de e^ escrito sin paréntesis.
+
+        Los números y letras pegados forman un solo exponente, como siempre
+        se leyó: e^2x = e^(2x) y e^xy = e^(xy), pero e^2 x = e^2·x. Con
+        paréntesis, signo o función el exponente se parsea como en '^'.
+        """
+        if not self._is_exponent_atom(self._peek()):
+            return self._expression(_BP_POW - 1)
+        exponent = self._prefix()
+        while self._is_exponent_atom(self._peek()) and self._is_glued(self._peek()):
+            exponent = exponent * self._prefix()
+        return exponent
+
+    def _is_glued(self, token: _Token) -> bool:
+        """Indica si el token va pegado (sin espacios) al anterior."""
+        previous = self._tokens[self._index - 1]
+        return not any(ch.isspace() for ch in self._text[previous.pos:token.pos])
+
+    def _implicit_argument(self):
+        """
+        Argumento de una función escrita sin paréntesis.
+
+        Abarca los factores con multiplicación implícita (cos 2x = cos(2x)),
+        pero se detiene en '*', '/', '+', '-' y en otra función, de modo que
+        sin x cos x = sin(x)·cos(x).
+        """
+        argument = self._expression(_BP_UNARY)
+        while self._peek().kind in ("num", "var", "y", "deriv", "("):
+            argument = argument * self._expression(_BP_UNARY)
+        return argument
+
+    def _prefix(self):
+        token = self._advance()
+        kind = token.kind
+
+        if kind in ("num", "var"):
+            return token.value
+
+        if kind == "y":
+            if token.value == 0:
+                if self._is_explicit_call():
+                    # y(x) explícita; con otro argumento, y(1-y) es y·(1-y)
+                    self._index += 3
+                return self.parser.y
+            return Derivative(self.parser.y, (self.parser.x, token.value))
+
+        if kind == "deriv":
+            return Derivative(self.parser.y, (self.parser.x, token.value))
+
+        if kind == "func":
+            if self._peek().kind == "(":
+                self._advance()
+                argument = self._expression(0)
+                self._expect(")", "')'")
+            else:
+                # Aplicación implícita: sin x, cos 2x, sin x^2
+                if self._peek().kind in ("end", ")", "="):
+                    raise ParseError("Falta el argumento de la función", self._peek().pos, self._text)
+                argument = self._implicit_argument()
+            return token.value(argument)
+
+        if kind == "(":
+            inner = self._expression(0)
+            self._expect(")", "')'")
+            return inner
+
+        if kind == "op" and token.value in "+-":
+            operand = self._expression(_BP_UNARY)
+            return -operand if token.value == "-" else operand
+
+        if kind == "end":
+            raise ParseError("La ecuación termina de forma incompleta", token.pos, self._text)
+        raise ParseError(f"Símbolo inesperado '{self._text_of(token)}'", token.pos, self._text)
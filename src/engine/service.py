@@ -0,0 +1,97 @@
+"""
+Servicio de motor compartido por todo el proceso.
+
+Todas las vistas y herramientas usan el mismo StepEngine (con sus cachés
+de parseo, integrales y LaTeX) y el mismo SolveExecutor (con sus procesos
+trabajadores ya calientes), en lugar de crear los suyos. Así lo que una
+vista calienta lo aprovechan las demás, y no se duplican objetos de SymPy.
+"""
+
+import atexit
+import threading
+from typing import Optional
+
+from src.engine.step_engine import StepEngine
+from src.engine.solve_executor import SolveExecutor
+
+
+# Ecuaciones que recorren las ramas principales del motor (parseo,
+# integrate, simplify, dsolve, LaTeX) para calentar SymPy al arrancar
+WARM_UP_EQUATIONS = (
+    "y' + 2y = e^x",
+    "y' = x*y^2",
+    "y'' + 3y' + 2y = 0",
+    "y'' + y = sin(x)",
+    "y' = y^2 + x",
+)
+
+_lock = threading.Lock()
+_engine: Optional[StepEngine] = None
+_executor: Optional[SolveExecutor] = None
+
+
+def get_engine() -> StepEngine:
+    """
+    Motor compartido del proceso (se crea al primer uso).
+
+    Sus cachés son seguras para hilos, así que se puede usar desde
+    cualquier hilo. No se le configura caché persistente: cada proceso
+    trabajador decide si la usa.
+    """
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = StepEngine()
+    return _engine
+
+
+def get_executor() -> SolveExecutor:
+    """
+    Ejecutor compartido de resoluciones con límite de tiempo y memoria.
+
+    Sus procesos trabajadores usan la caché persistente de soluciones (en
+    ~/.calcquest/solutions.db, o donde indique CALCQUEST_SOLUTION_CACHE) y
+    se detienen automáticamente al salir de la aplicación.
+    """
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = SolveExecutor(use_solution_cache=True)
+                atexit.register(shutdown)
+    return _executor
+
+
+def warm_up_engine(engine: StepEngine, equations=WARM_UP_EQUATIONS):
+    """Resuelve el corpus de calentamiento (los errores se ignoran)."""
+    for equation in equations:
+        try:
+            engine.solve_steps(equation)
+        except Exception:
+            pass
+
+
+def warm_up():
+    """
+    Calienta el motor al arrancar la aplicación.
+
+    Las resoluciones corren en los procesos del ejecutor, así que allí se
+    hace el trabajo pesado (en paralelo, sin competir por el GIL con la
+    interfaz). En este proceso solo se calienta lo que usa la interfaz
+    directamente: el parser y la comparación de respuestas.
+    """
+    from src.engine.equivalence import answers_equivalent
+
+    get_executor().prestart()
+    answers_equivalent("C1cos(2x)+C2sin(2x)", "y = C2 sin(2x) + C1 cos(2x)")
+
+
+def shutdown():
+    """Detiene el ejecutor compartido, si se creó (se puede volver a crear después)."""
+    global _executor
+    with _lock:
+        executor = _executor
+        _executor = None
+    if executor is not None:
+        executor.shutdown()
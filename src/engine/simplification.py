@@ -0,0 +1,72 @@
+"""
+Simplificación con presupuesto para el motor de pasos.
+
+simplify() prueba decenas de estrategias y, con mezclas de exponenciales
+y funciones trigonométricas, puede dominar el tiempo de una resolución.
+Aquí se aplican primero reescrituras baratas y dirigidas, y solo se
+recurre a simplify() completo si queda presupuesto.
+"""
+
+import time
+
+from sympy import powsimp, together, cancel, expand_log, simplify, count_ops
+
+
+# Presupuestos por defecto de cada llamada
+DEFAULT_TIME_BUDGET = 0.5  # segundos
+DEFAULT_MAX_OPS = 60       # operaciones de la expresión para escalar a simplify()
+
+# Reescrituras baratas, en el orden en que se aplican
+_CHEAP_REWRITES = (
+    powsimp,
+    together,
+    cancel,
+    expand_log,
+)
+
+
+def budgeted_simplify(expr, time_budget: float = DEFAULT_TIME_BUDGET,
+                      max_ops: int = DEFAULT_MAX_OPS):
+    """
+    Simplifica una expresión respetando un presupuesto de tiempo y tamaño.
+
+    Aplica en cadena powsimp, together, cancel y expand_log quedándose con
+    la forma más corta (según count_ops). Después escala a simplify()
+    solo si no se agotó el tiempo y la mejor forma tiene como mucho
+    max_ops operaciones; simplify() no se puede interrumpir, así que el
+    presupuesto decide si se intenta, no cuándo se detiene.
+
+    Args:
+        expr: Expresión de SymPy
+        time_budget: Segundos disponibles antes de descartar simplify()
+        max_ops: Tamaño máximo (count_ops) para intentar simplify()
+
+    Returns:
+        La forma más simple encontrada (nunca más larga que expr)
+    """
+    start = time.monotonic()
+    best = expr
+    best_ops = count_ops(expr)
+    current = expr
+
+    for rewrite in _CHEAP_REWRITES:
+        if time.monotonic() - start >= time_budget:
+            return best
+        try:
+            current = rewrite(current)
+        except Exception:
+            continue
+        ops = count_ops(current)
+        if ops <= best_ops:
+            best, best_ops = current, ops
+
+    if time.monotonic() - start >= time_budget or best_ops > max_ops:
+        return best
+
+    try:
+        candidate = simplify(best)
+    except Exception:
+        return best
+    if count_ops(candidate) <= best_ops:
+        return candidate
+    return best
@@ -0,0 +1,219 @@
+"""
+Caché persistente de soluciones paso a paso para CalcQuest.
+Guarda en SQLite las listas de pasos ya calculadas por el motor para que
+las ecuaciones repetidas se respondan al instante, incluso tras reiniciar.
+"""
+
+import sqlite3
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, List
+
+
+# Variable de entorno: ruta del archivo SQLite de la caché por defecto
+# (la heredan los procesos trabajadores; las pruebas la apuntan a un temporal)
+CACHE_PATH_ENV = "CALCQUEST_SOLUTION_CACHE"
+
+class SolutionCache:
+    """
+    Caché persistente (SQLite) de pasos de solución.
+
+    Las entradas se indexan por una clave opaca calculada por el motor
+    (hash canónico de la ecuación + versión del motor). Se desalojan por
+    LRU cuando se supera el número máximo de entradas o el tamaño total.
+    """
+
+    DEFAULT_MAX_ENTRIES = 5000
+    DEFAULT_MAX_BYTES = 20 * 1024 * 1024  # 20 MB
+
+    def __init__(self, db_path: Optional[str] = None, engine_version: str = "",
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Inicializa la caché.
+
+        Args:
+            db_path: Ruta al archivo SQLite. Si es None, usa ~/.calcquest/solutions.db
+            engine_version: Versión del motor; las entradas de otras versiones se descartan
+            max_entries: Número máximo de soluciones almacenadas
+            max_bytes: Tamaño máximo total (en bytes) de los pasos almacenados
+        """
+        if db_path is None:
+            app_data = Path.home() / ".calcquest"
+            app_data.mkdir(exist_ok=True)
+            db_path = str(app_data / "solutions.db")
+
+        self.db_path = db_path
+        self.engine_version = engine_version
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        # La caché se comparte entre hilos (UI y trabajadores)
+        self.connection = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+        self._initialize_schema()
+
+    def _initialize_schema(self):
+        """Crea la tabla de soluciones y descarta entradas de otras versiones."""
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS solutions (
+                    key TEXT PRIMARY KEY,
+                    engine_version TEXT NOT NULL,
+                    steps TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_solutions_access ON solutions(last_access)"
+            )
+            cursor.execute(
+                "DELETE FROM solutions WHERE engine_version != ?", (self.engine_version,)
+            )
+            self.connection.commit()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """
+        Busca una solución en la caché.
+
+        Args:
+            key: Clave de la ecuación
+
+        Returns:
+            Lista de pasos serializados (dicts), o None si no está (o si la
+            base de datos no responde, p. ej. bloqueada por otro proceso)
+        """
+        with self._lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute(
+                    "SELECT steps FROM solutions WHERE key = ? AND engine_version = ?",
+                    (key, self.engine_version)
+                )
+                row = cursor.fetchone()
+                if row is not None:
+                    cursor.execute(
+                        "UPDATE solutions SET last_access = ? WHERE key = ?",
+                        (time.time(), key)
+                    )
+                    self.connection.commit()
+            except sqlite3.Error:
+                self._rollback()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+
+    def put(self, key: str, steps: List[Dict]):
+        """
+        Guarda una solución y aplica los límites de tamaño.
+
+        Si la base de datos no responde (p. ej. bloqueada por otro proceso),
+        la solución simplemente no se guarda.
+
+        Args:
+            key: Clave de la ecuación
+            steps: Lista de pasos serializados (dicts)
+        """
+        payload = json.dumps(steps, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute("""
+                    INSERT OR REPLACE INTO solutions (key, engine_version, steps, size_bytes, last_access)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (key, self.engine_version, payload, size, time.time()))
+                self._evict(cursor)
+                self.connection.commit()
+            except sqlite3.Error:
+                self._rollback()
+
+    def _rollback(self):
+        """Descarta la transacción a medias tras un error de SQLite."""
+        try:
+            self.connection.rollback()
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, cursor):
+        """Desaloja las entradas menos usadas hasta cumplir ambos límites."""
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM solutions")
+        count, total_bytes = cursor.fetchone()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+
+        cursor.execute("SELECT key, size_bytes FROM solutions ORDER BY last_access ASC")
+        to_delete = []
+        for key, size in cursor.fetchall():
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            count -= 1
+            total_bytes -= size
+        cursor.executemany("DELETE FROM solutions WHERE key = ?", to_delete)
+
+    def clear(self):
+        """Elimina todas las soluciones almacenadas."""
+        with self._lock:
+            self.connection.execute("DELETE FROM solutions")
+            self.connection.commit()
+
+    def stats(self) -> Dict:
+        """Retorna contadores y tamaño actual de la caché."""
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM solutions")
+            count, total_bytes = cursor.fetchone()
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': count,
+                'size_bytes': total_bytes,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def close(self):
+        """Cierra la conexión."""
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+
+def open_default_cache(engine_version: str, db_path: Optional[str] = None) -> Optional[SolutionCache]:
+    """
+    Abre la caché en la ubicación por defecto.
+
+    Args:
+        engine_version: Versión del motor
+        db_path: Ruta del archivo SQLite; si es None se usa la variable de
+            entorno CALCQUEST_SOLUTION_CACHE o, sin ella, ~/.calcquest/solutions.db
+
+    Returns:
+        SolutionCache, o None si no se pudo abrir (sin permisos, disco lleno, etc.)
+    """
+    if db_path is None:
+        db_path = os.environ.get(CACHE_PATH_ENV) or None
+    try:
+        return SolutionCache(db_path, engine_version=engine_version)
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️ No se pudo abrir la caché de soluciones: {e}")
+        return None
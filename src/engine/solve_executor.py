@@ -0,0 +1,425 @@
+"""
+Ejecutor de resoluciones en procesos trabajadores.
+
+SymPy no se puede interrumpir desde otro hilo, así que cada resolución
+corre en un proceso aparte con presupuesto de tiempo y memoria. Si la
+resolución excede su presupuesto o se cancela, el proceso se termina y
+se reemplaza, sin bloquear la aplicación.
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+from src.engine.step_engine import Step
+
+
+# Presupuestos por defecto de cada resolución
+DEFAULT_TIMEOUT = 20.0          # segundos de reloj
+DEFAULT_MEMORY_LIMIT_MB = 2048  # memoria virtual del proceso trabajador
+
+# Intervalo con el que los hilos revisan cancelaciones y plazos
+_POLL_INTERVAL = 0.05
+
+# Espera máxima al calentamiento de un trabajador recién creado
+_WARM_UP_TIMEOUT = 60.0
+
+# Variable de entorno: directorio donde guardar una traza por resolución
+TRACE_DIR_ENV = "CALCQUEST_TRACE_DIR"
+
+
+def _apply_memory_limit(memory_limit_mb: Optional[int]):
+    """Limita la memoria del proceso actual (solo en sistemas POSIX)."""
+    if not memory_limit_mb:
+        return
+    try:
+        import resource
+        limit = int(memory_limit_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError):
+        # Windows o límite no permitido: se confía solo en el plazo de tiempo
+        pass
+
+
+@contextmanager
+def _maybe_trace(engine, equation: str):
+    """
+    Si CALCQUEST_TRACE_DIR está definida, guarda una traza (formato Chrome)
+    de cada resolución en ese directorio para diagnosticar lentitud.
+    """
+    trace_dir = os.environ.get(TRACE_DIR_ENV)
+    if not trace_dir:
+        yield
+        return
+    with engine.trace() as tracer:
+        yield
+    try:
+        os.makedirs(trace_dir, exist_ok=True)
+        name = f"solve_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{len(equation)}.json"
+        tracer.dump_chrome_trace(os.path.join(trace_dir, name))
+    except OSError as e:
+        print(f"⚠️ No se pudo guardar la traza: {e}")
+
+
+def _worker_main(conn, memory_limit_mb: Optional[int], use_solution_cache: bool,
+                 warm_up: bool = False, solution_cache_path: Optional[str] = None):
+    """Bucle principal de un proceso trabajador."""
+    _apply_memory_limit(memory_limit_mb)
+
+    from src.engine.step_engine import ENGINE_VERSION
+    from src.engine.service import get_engine, warm_up_engine
+
+    engine = get_engine()
+    if warm_up:
+        # Antes de activar la caché persistente, para que SymPy calcule de verdad
+        warm_up_engine(engine)
+    if use_solution_cache:
+        from src.engine.solution_cache import open_default_cache
+        engine.solution_cache = open_default_cache(ENGINE_VERSION, solution_cache_path)
+    if warm_up:
+        try:
+            conn.send(("ready", None))
+        except (BrokenPipeError, OSError):
+            return
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        equation = message
+        try:
+            # Cada paso se envía en cuanto el motor lo genera
+            with _maybe_trace(engine, equation):
+                for step in engine.solve_steps_iter(equation):
+                    conn.send(("step", step.to_dict()))
+            reply = ("done", None)
+        except MemoryError:
+            reply = ("memory", None)
+        except (BrokenPipeError, OSError):
+            # El proceso principal ya no espera la respuesta
+            break
+        except Exception as e:
+            reply = ("failed", str(e))
+        
+        try:
+            conn.send(reply)
+        except (BrokenPipeError, OSError):
+            break
+
+
+class SolveTask:
+    """
+    Solicitud de resolución enviada a un SolveExecutor.
+
+    Attributes:
+        equation: Ecuación a resolver
+        timeout: Presupuesto de tiempo en segundos
+        status: pending, running, done, timeout, memory, cancelled o failed
+    """
+
+    def __init__(self, equation: str, timeout: float):
+        self.equation = equation
+        self.timeout = timeout
+        self.status = "pending"
+        self._steps: List[Step] = []
+        self._stream: "queue.Queue[Optional[Step]]" = queue.Queue()
+        self._cancel_requested = threading.Event()
+        self._finished = threading.Event()
+
+    def cancel(self):
+        """Solicita la cancelación; el ejecutor la atiende en su próxima revisión."""
+        self._cancel_requested.set()
+
+    def cancel_requested(self) -> bool:
+        return self._cancel_requested.is_set()
+
+    def done(self) -> bool:
+        """Indica si la solicitud ya terminó (con éxito o no)."""
+        return self._finished.is_set()
+
+    def result(self, timeout: Optional[float] = None) -> Optional[List[Step]]:
+        """
+        Espera el resultado.
+
+        Args:
+            timeout: Segundos máximos de espera (None = sin límite)
+
+        Returns:
+            Lista de Step, o None si no terminó dentro de la espera
+        """
+        if not self._finished.wait(timeout):
+            return None
+        return list(self._steps)
+
+    def iter_steps(self):
+        """
+        Entrega los pasos a medida que llegan del proceso trabajador.
+
+        Termina cuando la solicitud finaliza; si se agotó el tiempo o se
+        canceló, el último paso lo indica. Pensado para un único consumidor.
+
+        Yields:
+            Objetos Step en orden
+        """
+        while True:
+            step = self._stream.get()
+            if step is None:
+                return
+            yield step
+
+    def _add_step(self, step: Step):
+        self._steps.append(step)
+        self._stream.put(step)
+
+    def _finish(self, status: str, steps: List[Step] = ()):
+        for step in steps:
+            self._add_step(step)
+        self.status = status
+        self._finished.set()
+        self._stream.put(None)
+
+
+class _WorkerSlot:
+    """Un proceso trabajador y el hilo que le despacha solicitudes."""
+
+    def __init__(self, executor: "SolveExecutor", prestart: bool = False):
+        self.executor = executor
+        self.process = None
+        self.conn = None
+        self.current_task: Optional[SolveTask] = None
+        self._prestart = prestart
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _ensure_process(self, warm_up: bool = False):
+        if self.process is not None and self.process.is_alive():
+            return
+        ctx = self.executor.context
+        parent_conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.executor.memory_limit_mb,
+                  self.executor.use_solution_cache, warm_up,
+                  self.executor.solution_cache_path),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+    def kill(self):
+        """Termina el proceso trabajador (se recrea en la siguiente solicitud)."""
+        if self.process is not None:
+            self.process.kill()
+            self.process.join(timeout=1.0)
+        if self.conn is not None:
+            self.conn.close()
+        self.process = None
+        self.conn = None
+
+    def _warm_up(self):
+        """
+        Crea el proceso con calentamiento y espera a que termine, antes de
+        tomar solicitudes: así el presupuesto de tiempo de la primera no
+        incluye el calentamiento.
+        """
+        try:
+            self._ensure_process(warm_up=True)
+            if self.conn.poll(_WARM_UP_TIMEOUT):
+                status, _ = self.conn.recv()
+                if status == "ready":
+                    return
+        except Exception:
+            pass
+        # Se recreará (sin calentamiento) con la primera solicitud
+        self.kill()
+
+    def _run(self):
+        if self._prestart:
+            self._warm_up()
+        while True:
+            task = self.executor._queue.get()
+            if task is None:
+                self.kill()
+                break
+            if task.cancel_requested():
+                task._finish("cancelled", [_cancelled_step()])
+                continue
+            self.current_task = task
+            self._execute(task)
+            self.current_task = None
+
+    def _execute(self, task: SolveTask):
+        task.status = "running"
+        try:
+            self._ensure_process()
+            self.conn.send(task.equation)
+        except Exception as e:
+            self.kill()
+            task._finish("failed", [_failed_step(str(e))])
+            return
+
+        deadline = time.monotonic() + task.timeout
+        while True:
+            if task.cancel_requested():
+                self.kill()
+                task._finish("cancelled", [_cancelled_step()])
+                return
+            if time.monotonic() >= deadline:
+                self.kill()
+                task._finish("timeout", [_timeout_step(task.timeout)])
+                return
+            try:
+                if self.conn.poll(_POLL_INTERVAL):
+                    status, payload = self.conn.recv()
+                    if status == "step":
+                        task._add_step(Step.from_dict(payload))
+                        continue
+                    break
+            except (EOFError, OSError):
+                # El proceso murió (p. ej. lo terminó el sistema por memoria)
+                self.kill()
+                task._finish("failed", [_failed_step("el proceso de resolución terminó inesperadamente")])
+                return
+
+        if status == "done":
+            task._finish("done")
+        elif status == "memory":
+            self.kill()
+            task._finish("memory", [_memory_step(self.executor.memory_limit_mb)])
+        else:
+            task._finish("failed", [_failed_step(payload)])
+
+
+class SolveExecutor:
+    """
+    Pool de procesos trabajadores para resolver ecuaciones con presupuesto
+    de tiempo y memoria por solicitud.
+
+    Los procesos se crean bajo demanda en la primera solicitud.
+
+    Uso:
+        executor = SolveExecutor()
+        task = executor.submit("y' + 2y = e^x")
+        steps = task.result()
+    """
+
+    def __init__(self, max_workers: int = 2, timeout: float = DEFAULT_TIMEOUT,
+                 memory_limit_mb: Optional[int] = DEFAULT_MEMORY_LIMIT_MB,
+                 use_solution_cache: bool = False,
+                 solution_cache_path: Optional[str] = None):
+        """
+        Args:
+            max_workers: Número de procesos trabajadores
+            timeout: Presupuesto de tiempo por defecto (segundos)
+            memory_limit_mb: Límite de memoria de cada trabajador (None = sin límite)
+            use_solution_cache: Si los trabajadores usan la caché persistente de soluciones
+            solution_cache_path: Archivo de esa caché (None = ubicación por
+                defecto, ver open_default_cache)
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers debe ser mayor que 0")
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.use_solution_cache = use_solution_cache
+        self.solution_cache_path = solution_cache_path
+        # 'spawn' evita heredar el estado de Qt del proceso principal
+        self.context = multiprocessing.get_context("spawn")
+        self._queue: "queue.Queue[Optional[SolveTask]]" = queue.Queue()
+        self._slots: List[_WorkerSlot] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, equation: str, timeout: Optional[float] = None) -> SolveTask:
+        """
+        Envía una ecuación a resolver.
+
+        Args:
+            equation: Ecuación en formato string
+            timeout: Presupuesto de tiempo de esta solicitud (None = el del ejecutor)
+
+        Returns:
+            SolveTask para consultar, esperar o cancelar la resolución
+        """
+        task = SolveTask(equation, timeout if timeout is not None else self.timeout)
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("El ejecutor ya fue cerrado")
+            if len(self._slots) < self.max_workers:
+                self._slots.append(_WorkerSlot(self))
+            self._queue.put(task)
+        return task
+
+    def prestart(self):
+        """
+        Crea ya todos los procesos trabajadores y los calienta con un corpus
+        corto (ver service.warm_up_engine), para que la primera solicitud
+        real no pague el arranque de SymPy.
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            while len(self._slots) < self.max_workers:
+                self._slots.append(_WorkerSlot(self, prestart=True))
+
+    def solve(self, equation: str, timeout: Optional[float] = None) -> List[Step]:
+        """Resuelve una ecuación y espera el resultado (respetando el presupuesto)."""
+        return self.submit(equation, timeout).result()
+
+    def shutdown(self):
+        """Cancela las resoluciones en curso y detiene los procesos trabajadores."""
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            slots = list(self._slots)
+        for slot in slots:
+            task = slot.current_task
+            if task is not None:
+                task.cancel()
+            self._queue.put(None)
+        for slot in slots:
+            slot.thread.join(timeout=2.0)
+
+
+def _timeout_step(timeout: float) -> Step:
+    return Step(
+        latex="",
+        explanation=f"⏱️ La resolución superó el tiempo límite ({timeout:g} s) y fue detenida.",
+        hint="Intenta simplificar la ecuación o revisa que esté bien escrita.",
+        step_type="timeout"
+    )
+
+
+def _memory_step(memory_limit_mb: Optional[int]) -> Step:
+    return Step(
+        latex="",
+        explanation=f"💾 La resolución superó el límite de memoria ({memory_limit_mb} MB) y fue detenida.",
+        hint="Intenta simplificar la ecuación o revisa que esté bien escrita.",
+        step_type="memory"
+    )
+
+
+def _cancelled_step() -> Step:
+    return Step(
+        latex="",
+        explanation="🛑 Resolución cancelada.",
+        step_type="cancelled"
+    )
+
+
+def _failed_step(message: str) -> Step:
+    return Step(
+        latex="",
+        explanation=f"❌ Error al procesar la ecuación: {message}",
+        step_type="error"
+    )
@@ -2,13 +2,57 @@ import sympy
 from sympy import (
     symbols, Function, Derivative, exp, dsolve, Eq, 
     integrate, simplify, latex, parse_expr, sin, cos, tan, log, sqrt,
-    Add, Mul, Pow, Symbol, sympify
+    Add, Mul, Pow, Symbol, sympify, Integral
 )
+from sympy.core.function import AppliedUndef
 from sympy.parsing.sympy_parser import (
     parse_expr, standard_transformations, 
     implicit_multiplication_application, convert_xor
 )
 import re
+import os
+import time
+import hashlib
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Optional
+
+from src.core.lru_cache import LRUCache
+from src.engine.expr_memo import ExpressionMemo, shared_memo
+from src.engine.verification import verify_solution
+from src.engine.parser import EquationParser, ParseError
+from src.engine.fingerprint import fingerprint, leading_coefficient
+from src.engine.tracing import Tracer
+
+# Solucionadores individuales de SymPy: permiten comprobar si una pista de
+# dsolve aplica sin ejecutar el clasificador completo (API interna de SymPy)
+try:
+    from sympy.solvers.ode.single import (
+        SingleODEProblem, FirstLinear, Separable, Bernoulli, FirstExact,
+        HomogeneousCoeffBest, NthLinearConstantCoeffHomogeneous,
+        NthLinearConstantCoeffUndeterminedCoefficients,
+        NthLinearConstantCoeffVariationOfParameters,
+        NthLinearEulerEqHomogeneous, NthOrderReducible
+    )
+    _HINT_MATCHERS = {
+        solver.hint: solver for solver in (
+            FirstLinear, Separable, Bernoulli, FirstExact, HomogeneousCoeffBest,
+            NthLinearConstantCoeffHomogeneous,
+            NthLinearConstantCoeffUndeterminedCoefficients,
+            NthLinearConstantCoeffVariationOfParameters,
+            NthLinearEulerEqHomogeneous, NthOrderReducible
+        )
+    }
+except ImportError:
+    SingleODEProblem = None
+    _HINT_MATCHERS = {}
+
+
+# Versión del motor. Cambiarla invalida las soluciones guardadas en caché
+# cuando cambia la forma en que se generan los pasos.
+ENGINE_VERSION = "11"
 
 
 class Step:
@@ -20,15 +64,72 @@ class Step:
         explanation: Explicación en lenguaje natural del paso
         hint: Pista opcional para el estudiante
         step_type: Tipo de paso (identification, calculation, solution, etc.)
+        verified: En pasos de solución, resultado de la verificación numérica
+                  (True, False o None si no se verificó)
     """
-    def __init__(self, latex: str, explanation: str, hint: str = "", step_type: str = "general"):
+    def __init__(self, latex: str, explanation: str, hint: str = "", step_type: str = "general",
+                 verified: Optional[bool] = None):
         self.latex = latex
         self.explanation = explanation
         self.hint = hint
         self.step_type = step_type
+        self.verified = verified
     
     def __repr__(self):
         return f"Step(type={self.step_type}, latex='{self.latex[:30]}...')"
+    
+    def to_dict(self) -> dict:
+        """Serializa el paso a un diccionario (JSON compatible)."""
+        return {
+            'latex': self.latex,
+            'explanation': self.explanation,
+            'hint': self.hint,
+            'step_type': self.step_type,
+            'verified': self.verified
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Step":
+        """Reconstruye un paso a partir de un diccionario."""
+        return cls(
+            latex=data.get('latex', ''),
+            explanation=data.get('explanation', ''),
+            hint=data.get('hint', ''),
+            step_type=data.get('step_type', 'general'),
+            verified=data.get('verified')
+        )
+
+
+class AnalyzedEquation:
+    """
+    Resultado de analizar una ecuación una sola vez.
+    
+    Todas las rutas del motor (clasificación y solucionadores) reutilizan
+    este objeto en lugar de volver a parsear la cadena original.
+    
+    Attributes:
+        source: Ecuación original ingresada por el usuario
+        lhs: Lado izquierdo parseado
+        rhs: Lado derecho parseado
+        eq: Igualdad SymPy Eq(lhs, rhs)
+        expr: Ecuación con todo en un lado (lhs - rhs), con la escala que
+            escribió el estudiante: los pasos se muestran a partir de ella
+        derivatives: Conjunto de derivadas presentes en la ecuación
+        order: Orden de la ecuación (0 si no hay derivadas)
+        eq_type: Tipo de ecuación identificado
+    """
+    def __init__(self, source: str, lhs, rhs, expr, derivatives, order: int, eq_type: str):
+        self.source = source
+        self.lhs = lhs
+        self.rhs = rhs
+        self.eq = Eq(lhs, rhs)
+        self.expr = expr
+        self.derivatives = derivatives
+        self.order = order
+        self.eq_type = eq_type
+    
+    def __repr__(self):
+        return f"AnalyzedEquation(type={self.eq_type}, order={self.order}, eq={self.eq})"
 
 
 class StepEngine:
@@ -44,17 +145,71 @@ class StepEngine:
     - Ecuaciones Homogéneas
     """
     
-    def __init__(self):
+    # Número máximo de ecuaciones parseadas que se conservan en memoria
+    PARSE_CACHE_SIZE = 512
+    
+    # Tiempo (segundos) tras el cual dsolve deja de probar pistas alternativas
+    DSOLVE_BUDGET = 10.0
+    
+    # Pistas de dsolve que corresponden a cada tipo identificado
+    TYPE_HINTS = {
+        "Lineal de Primer Orden": ("1st_linear",),
+        "Variables Separables": ("separable",),
+        "Segundo Orden Homogénea (Coeficientes Constantes)": (
+            "nth_linear_constant_coeff_homogeneous",),
+        "Segundo Orden No Homogénea (Coeficientes Constantes)": (
+            "nth_linear_constant_coeff_undetermined_coefficients",
+            "nth_linear_constant_coeff_variation_of_parameters"),
+    }
+    
+    # Pistas de respaldo por orden, de la más barata a la más general
+    FALLBACK_HINTS = {
+        1: ("1st_linear", "separable", "Bernoulli", "1st_exact",
+            "1st_homogeneous_coeff_best"),
+        2: ("nth_linear_constant_coeff_homogeneous",
+            "nth_linear_constant_coeff_undetermined_coefficients",
+            "nth_linear_constant_coeff_variation_of_parameters",
+            "nth_linear_euler_eq_homogeneous", "nth_order_reducible"),
+    }
+    
+    def __init__(self, parse_cache_size: int = PARSE_CACHE_SIZE, solution_cache=None,
+                 memo: Optional[ExpressionMemo] = None, tracer: Optional[Tracer] = None):
+        """
+        Args:
+            parse_cache_size: Número máximo de ecuaciones parseadas en memoria
+            solution_cache: SolutionCache persistente opcional para los pasos calculados
+            memo: Memoización de integrate/simplify/latex (por defecto, la compartida del proceso)
+            tracer: Tracer opcional que mide cada etapa (ver trace())
+        """
         self.x = symbols('x')
         self.y_func = Function('y')
         self.y = self.y_func(self.x)
         self.dy = Derivative(self.y, self.x)
+        # Símbolo para y cuando se trata como variable (p. ej. al separar variables)
+        self.y_symbol = symbols('y')
         
-        # Transformaciones para el parser
+        # Parser propio de la notación de CalcQuest
+        self._parser = EquationParser(self.x, self.y_func)
+        
+        # Transformaciones para parse_expr (entradas que el parser propio no acepta)
         self.transformations = (
             standard_transformations + 
             (implicit_multiplication_application, convert_xor)
         )
+        
+        # Caché de ecuaciones ya parseadas (clave: entrada preprocesada)
+        self._parse_cache = LRUCache(maxsize=parse_cache_size)
+        
+        # Caché persistente de soluciones (opcional)
+        self.solution_cache = solution_cache
+        
+        # Resultados de integrate/simplify/latex ya calculados
+        self.memo = memo if memo is not None else shared_memo()
+        
+        # Instrumentación por etapas (desactivada por defecto). El motor se
+        # comparte entre hilos, así que el tracer de trace() es de cada hilo
+        self._default_tracer = tracer
+        self._local = threading.local()
     
     def _preprocess_input(self, equation_str: str) -> str:
         """
@@ -80,32 +235,181 @@ class StepEngine:
         processed = re.sub(r"dy/dx", "Derivative(y(x), x)", processed)
         processed = re.sub(r"d²y/dx²", "Derivative(y(x), x, x)", processed)
         
+        # Constante pegada a lo que multiplica: C1cos(2x) -> C1*cos(2x), Ce^x -> C*e^x
+        processed = re.sub(r"(?<![a-zA-Z])(C\d*)(?=[a-z])", r"\1*", processed)
+        
         # e^(...) -> exp(...)
         processed = re.sub(r"e\^([a-zA-Z0-9]+)", r"exp(\1)", processed)
         processed = re.sub(r"e\^\(([^)]+)\)", r"exp(\1)", processed)
         
         # Reemplazar 'y' sola (sin derivada) por y(x)
-        # Cuidado: no reemplazar la 'y' dentro de Derivative o y(x)
-        processed = re.sub(r"(?<![a-zA-Z_])y(?!\(|'|[a-zA-Z])", "y(x)", processed)
+        # Cuidado: no reemplazar la 'y' dentro de Derivative o y(x);
+        # sí se reemplaza en productos implícitos como 'xy'
+        processed = re.sub(r"(?:(?<![a-zA-Z_])|(?<=x))y(?!\(|'|[a-zA-Z])", "y(x)", processed)
         
         return processed
     
+    def _normalize_whitespace(self, processed: str) -> str:
+        """
+        Normaliza los espacios de una entrada ya preprocesada para usarla
+        como clave de caché: colapsa espacios repetidos y elimina los que
+        rodean operadores ("y' + 2y" y "y'+2y" producen la misma clave).
+        """
+        collapsed = " ".join(processed.split())
+        return re.sub(r"\s*([+\-*/=^(),])\s*", r"\1", collapsed)
+    
     def _parse_equation(self, equation_str: str):
         """
         Parsea la ecuación del usuario a una expresión SymPy.
         
+        Usa el parser propio de CalcQuest (EquationParser); si la entrada
+        usa sintaxis que este no conoce (p. ej. Derivative(y(x), x)), se
+        recurre a parse_expr. Los resultados se guardan en una caché LRU
+        indexada por la entrada normalizada, de modo que las ecuaciones
+        repetidas no se vuelven a parsear.
+        
         Args:
             equation_str: Ecuación en formato string
             
         Returns:
             Tuple (lhs, rhs) si hay '=', o (expr, 0) si no hay
+        
+        Raises:
+            ParseError: Si ninguno de los dos parsers acepta la entrada
         """
-        processed = self._preprocess_input(equation_str)
+        key = self._normalize_whitespace(equation_str)
         
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            parsed = self._parser.parse(equation_str)
+        except ParseError as error:
+            try:
+                parsed = self._parse_processed(
+                    self._normalize_whitespace(self._preprocess_input(equation_str))
+                )
+            except ValueError:
+                raise error
+        self._parse_cache.put(key, parsed)
+        return parsed
+    
+    def parse(self, equation_str: str):
+        """
+        Parsea una ecuación o expresión con la notación de CalcQuest
+        (con la caché de parseo del motor).
+        
+        Args:
+            equation_str: Ecuación en formato string
+            
+        Returns:
+            Tuple (lhs, rhs) si hay '=', o (expr, 0) si no hay
+        
+        Raises:
+            ParseError: Si la entrada no es válida
+        """
+        return self._parse_equation(equation_str)
+    
+    def fingerprint(self, equation_str: str) -> str:
+        """
+        Huella canónica de una ecuación: igual para formas equivalentes
+        (orden de términos, lado del '=', escala constante).
+        
+        Args:
+            equation_str: Ecuación en formato string
+            
+        Returns:
+            Hash hexadecimal, apto como clave de caché
+        """
+        lhs, rhs = self._parse_equation(equation_str)
+        return fingerprint(lhs, rhs)
+    
+    def parse_cache_stats(self) -> dict:
+        """Retorna los contadores (aciertos, fallos, desalojos) de la caché de parseo."""
+        return self._parse_cache.stats()
+    
+    def memo_stats(self) -> dict:
+        """Retorna los contadores de la memoización de integrate, simplify y latex."""
+        return self.memo.stats()
+    
+    @property
+    def tracer(self) -> Optional[Tracer]:
+        """Tracer activo en el hilo actual (el de trace() o el del constructor)."""
+        return getattr(self._local, "tracer", self._default_tracer)
+    
+    @tracer.setter
+    def tracer(self, tracer: Optional[Tracer]):
+        self._default_tracer = tracer
+    
+    @contextmanager
+    def trace(self, callback=None):
+        """
+        Activa la instrumentación mientras dura el bloque, solo en el hilo
+        que lo abre: las demás llamadas al motor compartido no se miden.
+        
+        Args:
+            callback: Función opcional que recibe cada Span al cerrarse
+            
+        Yields:
+            Tracer con las etapas medidas (ver src/engine/tracing.py)
+        """
+        tracer = Tracer(callback)
+        previous = getattr(self._local, "tracer", None)
+        had_previous = hasattr(self._local, "tracer")
+        self._local.tracer = tracer
+        try:
+            yield tracer
+        finally:
+            if had_previous:
+                self._local.tracer = previous
+            else:
+                del self._local.tracer
+    
+    def _span(self, name: str, **args):
+        """Etapa medida si hay un tracer activo; sin costo si no lo hay."""
+        tracer = self.tracer
+        if tracer is None:
+            return nullcontext()
+        return tracer.span(name, **args)
+    
+    def _traced(self, name: str, steps):
+        """Mide un generador de pasos si hay un tracer activo."""
+        tracer = self.tracer
+        if tracer is None:
+            return steps
+        return tracer.iterate(name, steps)
+    
+    def _integrate(self, expr, var):
+        tracer = self.tracer
+        if tracer is None:
+            return self.memo.integrate(expr, var)
+        with tracer.span("integrate"):
+            tracer.count("integrate")
+            return self.memo.integrate(expr, var)
+    
+    def _simplify(self, expr):
+        tracer = self.tracer
+        if tracer is None:
+            return self.memo.simplify(expr)
+        with tracer.span("simplify"):
+            tracer.count("simplify")
+            return self.memo.simplify(expr)
+    
+    def _latex(self, expr) -> str:
+        tracer = self.tracer
+        if tracer is None:
+            return self.memo.latex(expr)
+        with tracer.span("latex"):
+            tracer.count("latex")
+            return self.memo.latex(expr)
+    
+    def _parse_processed(self, processed: str):
+        """Parsea con parse_expr una entrada ya preprocesada."""
         # Definir símbolos locales para el parser
         local_dict = {
             'x': self.x,
-            'y': self.y,
+            'y': self.y_func,
             'exp': exp,
             'sin': sin,
             'cos': cos,
@@ -115,6 +419,9 @@ class StepEngine:
             'Derivative': Derivative,
             'Function': Function
         }
+        # Constantes de integración (C, C1, C2...): sin esto 'C1' se parte en C*1
+        for name in set(re.findall(r"\bC\d*\b", processed)):
+            local_dict[name] = Symbol(name)
         
         try:
             if '=' in processed:
@@ -131,6 +438,69 @@ class StepEngine:
         except Exception as e:
             raise ValueError(f"No se pudo parsear la ecuación: {e}")
     
+    def analyze(self, equation_str: str) -> "AnalyzedEquation":
+        """
+        Analiza una ecuación en una sola pasada: parsea, busca derivadas,
+        determina el orden y la clasifica.
+        
+        Args:
+            equation_str: Ecuación en formato string
+            
+        Returns:
+            AnalyzedEquation con toda la información de la ecuación
+            
+        Raises:
+            ValueError: Si la ecuación no se puede parsear
+        """
+        with self._span("parse"):
+            lhs, rhs = self._parse_equation(equation_str)
+        
+        # Mover todo a un lado (lhs - rhs = 0). No se normaliza: los pasos
+        # deben mostrar los coeficientes tal como los escribió el estudiante
+        expr = lhs - rhs
+        
+        # Buscar derivadas y determinar el orden
+        derivatives = expr.atoms(Derivative)
+        order = max((deriv.derivative_count for deriv in derivatives), default=0)
+        
+        with self._span("classify"):
+            eq_type = self._classify(lhs, rhs, expr, derivatives, order)
+        
+        return AnalyzedEquation(
+            source=equation_str,
+            lhs=lhs,
+            rhs=rhs,
+            expr=expr,
+            derivatives=derivatives,
+            order=order,
+            eq_type=eq_type
+        )
+    
+    def _classify(self, lhs, rhs, expr, derivatives, order: int) -> str:
+        """Clasifica la ecuación a partir de sus partes ya parseadas."""
+        if order == 0:
+            return "No es una Ecuación Diferencial"
+        
+        # Intentar clasificar
+        if order == 1:
+            # Verificar si es lineal de primer orden
+            # Forma: y' + P(x)*y = Q(x)
+            if self._is_first_order_linear(expr, derivatives):
+                return "Lineal de Primer Orden"
+            elif self._is_separable(expr):
+                return "Variables Separables"
+            else:
+                return "Primer Orden (tipo por determinar)"
+        elif order == 2:
+            coefficients = self._extract_second_order_coefficients(expr)
+            if coefficients is not None:
+                if coefficients[3] == 0:
+                    return "Segundo Orden Homogénea (Coeficientes Constantes)"
+                return "Segundo Orden No Homogénea (Coeficientes Constantes)"
+            return "Segundo Orden"
+        else:
+            return f"Orden {order}"
+    
     def identify_type(self, equation_str: str) -> str:
         """
         Identifica el tipo de ecuación diferencial.
@@ -142,44 +512,11 @@ class StepEngine:
             Tipo de ecuación identificado
         """
         try:
-            lhs, rhs = self._parse_equation(equation_str)
-            eq = Eq(lhs, rhs)
-            
-            # Mover todo a un lado: lhs - rhs = 0
-            expr = lhs - rhs
-            
-            # Buscar derivadas
-            derivatives = expr.atoms(Derivative)
-            
-            if not derivatives:
-                return "No es una Ecuación Diferencial"
-            
-            # Determinar el orden
-            max_order = 0
-            for deriv in derivatives:
-                order = len(deriv.args) - 1  # Número de variables de diferenciación
-                if order > max_order:
-                    max_order = order
-            
-            # Intentar clasificar
-            if max_order == 1:
-                # Verificar si es lineal de primer orden
-                # Forma: y' + P(x)*y = Q(x)
-                if self._is_first_order_linear(expr):
-                    return "Lineal de Primer Orden"
-                elif self._is_separable(lhs, rhs):
-                    return "Variables Separables"
-                else:
-                    return "Primer Orden (tipo por determinar)"
-            elif max_order == 2:
-                return "Segundo Orden"
-            else:
-                return f"Orden {max_order}"
-                
+            return self.analyze(equation_str).eq_type
         except Exception as e:
             return f"No identificado: {str(e)}"
     
-    def _is_first_order_linear(self, expr) -> bool:
+    def _is_first_order_linear(self, expr, derivatives=None) -> bool:
         """Verifica si la expresión es una EDO lineal de primer orden."""
         try:
             # Una EDO lineal de primer orden tiene la forma:
@@ -188,30 +525,60 @@ class StepEngine:
             # Verificar que y' aparece con coeficiente 1 o función de x
             # y que y aparece multiplicado solo por funciones de x
             
-            # Simplificación: si tiene Derivative y y(x), y los exponentes son 1
-            has_derivative = any(isinstance(term, Derivative) for term in expr.atoms(Derivative))
+            if derivatives is None:
+                derivatives = expr.atoms(Derivative)
+            if not derivatives:
+                return False
             
-            # Verificar que y no aparece con potencias > 1
-            y_terms = [term for term in expr.atoms(Pow) if self.y in term.free_symbols]
-            for term in y_terms:
-                if term.exp != 1:
+            # Con y' e y como símbolos, la expresión debe ser de grado 1 en
+            # ambos: sus derivadas parciales no pueden depender de y ni de y'
+            dy_symbol = symbols('dy')
+            plain = expr.subs(self.dy, dy_symbol).subs(self.y, self.y_symbol)
+            for var in (dy_symbol, self.y_symbol):
+                partial = sympy.diff(plain, var)
+                if partial.has(dy_symbol) or partial.has(self.y_symbol):
                     return False
             
-            return has_derivative
+            return True
         except:
             return False
     
-    def _is_separable(self, lhs, rhs) -> bool:
+    def _is_separable(self, expr) -> bool:
         """Verifica si la ecuación es de variables separables."""
         # dy/dx = f(x) * g(y)
+        return self._separate_variables(expr) is not None
+    
+    def _separate_variables(self, expr):
+        """
+        Escribe la ecuación como y' = f(x)·g(y) usando separatevars.
+        
+        Returns:
+            Tuple (f, g) con g expresada en el símbolo y, o None si la
+            ecuación no es de variables separables
+        """
         try:
-            if isinstance(lhs, Derivative):
-                # rhs debe ser producto de funciones de x y y separables
-                # Simplificación por ahora
-                return True
-            return False
-        except:
-            return False
+            expanded = sympy.expand(expr)
+            dy_coeff = expanded.coeff(self.dy)
+            rest = expanded - dy_coeff * self.dy
+            if dy_coeff == 0 or dy_coeff.has(self.dy) or rest.has(self.dy):
+                return None
+            
+            # y' = F(x, y), con y(x) reemplazada por el símbolo y
+            rhs = (-rest / dy_coeff).subs(self.y, self.y_symbol)
+            parts = sympy.separatevars(rhs, symbols=[self.x, self.y_symbol], dict=True)
+            if parts is None:
+                return None
+            
+            f = parts['coeff'] * parts[self.x]
+            g = parts[self.y_symbol]
+            if g.has(self.x) or f.has(self.y_symbol):
+                return None
+            # Funciones sin definir (p. ej. y aplicada a otra cosa que x) no se integran
+            if f.atoms(AppliedUndef) or g.atoms(AppliedUndef):
+                return None
+            return f, g
+        except Exception:
+            return None
     
     def _extract_linear_coefficients(self, expr):
         """
@@ -222,28 +589,63 @@ class StepEngine:
             # Recolectar términos
             expr_expanded = sympy.expand(expr)
             
-            # El coeficiente de y'
+            # Los coeficientes de y' y de y(x), sobre la expresión expandida
             dy_coeff = expr_expanded.coeff(self.dy)
+            y_coeff = expr_expanded.coeff(self.y)
+            
+            # El término independiente (Q(x) pero con signo cambiado porque está del lado izquierdo)
+            # expr = a(x)*y' + b(x)*y - g(x) = 0
+            # Entonces g(x) = -(términos sin y ni y')
+            remaining = sympy.expand(expr_expanded - dy_coeff * self.dy - y_coeff * self.y)
             if dy_coeff == 0:
                 dy_coeff = 1
             
-            # Normalizar dividiendo por el coeficiente de y'
-            if dy_coeff != 1:
-                expr_expanded = expr_expanded / dy_coeff
-            
-            # El coeficiente de y(x)
-            p_x = expr_expanded.coeff(self.y)
+            # Si quedan y o y' fuera de los coeficientes, la ecuación no es lineal
+            if any(term.has(self.y) for term in (dy_coeff, y_coeff, remaining)):
+                return None, None
             
-            # El término independiente (Q(x) pero con signo cambiado porque está del lado izquierdo)
-            # expr = y' + P(x)*y - Q(x) = 0
-            # Entonces Q(x) = -(términos sin y ni y')
-            remaining = expr_expanded - self.dy - p_x * self.y
+            p_x = y_coeff
             q_x = -remaining
+            # Normalizar dividiendo por el coeficiente de y' (que puede depender de x)
+            if dy_coeff != 1:
+                p_x = sympy.cancel(p_x / dy_coeff)
+                q_x = sympy.cancel(q_x / dy_coeff)
             
             return p_x, q_x
         except Exception as e:
             return None, None
     
+    def _extract_second_order_coefficients(self, expr):
+        """
+        Extrae a, b, c y g(x) de una EDO lineal de segundo orden con
+        coeficientes constantes: a·y'' + b·y' + c·y = g(x)
+        
+        Returns:
+            Tuple (a, b, c, g), o None si la ecuación no tiene esa forma
+        """
+        try:
+            d2y = Derivative(self.y, (self.x, 2))
+            expanded = sympy.expand(expr)
+            
+            a = expanded.coeff(d2y)
+            b = expanded.coeff(self.dy)
+            c = expanded.coeff(self.y)
+            g = -(expanded - a * d2y - b * self.dy - c * self.y)
+            
+            if a == 0:
+                return None
+            # Los coeficientes no pueden depender de x ni de y
+            for coeff in (a, b, c):
+                if coeff.has(self.x) or coeff.has(self.y):
+                    return None
+            # El término independiente no puede contener y ni sus derivadas
+            if g.has(self.y):
+                return None
+            
+            return a, b, c, self._simplify(g)
+        except Exception:
+            return None
+    
     def solve_steps(self, equation_str: str) -> list:
         """
         Genera los pasos de solución para una ecuación diferencial.
@@ -254,221 +656,665 @@ class StepEngine:
         Returns:
             Lista de objetos Step con la solución paso a paso
         """
-        steps = []
+        return list(self.solve_steps_iter(equation_str))
+    
+    def solve_steps_iter(self, equation_str: str):
+        """
+        Genera los pasos de solución de forma incremental.
         
-        try:
-            # Paso 0: Mostrar la ecuación original
-            steps.append(Step(
-                latex=equation_str,
-                explanation="📝 Ecuación original ingresada por el usuario.",
-                step_type="input"
-            ))
-            
-            # Parsear la ecuación
-            lhs, rhs = self._parse_equation(equation_str)
-            eq = Eq(lhs, rhs)
-            expr = lhs - rhs
+        Cada Step se entrega en cuanto se calcula, de modo que los pasos
+        costosos del final (integrales, simplificación) no retrasan los
+        primeros pasos que ve el estudiante.
+        
+        Args:
+            equation_str: Ecuación en formato string del usuario
             
-            # Identificar el tipo
-            eq_type = self.identify_type(equation_str)
+        Returns:
+            Iterador de objetos Step en orden
+        """
+        return self._traced("solve_steps", self._generate_steps(equation_str))
+    
+    def _generate_steps(self, equation_str: str):
+        """Generador de pasos detrás de solve_steps_iter."""
+        # Paso 0: Mostrar la ecuación original
+        yield Step(
+            latex=equation_str,
+            explanation="📝 Ecuación original ingresada por el usuario.",
+            step_type="input"
+        )
+        
+        try:
+            # Parsear e identificar el tipo en una sola pasada
+            analysis = self.analyze(equation_str)
+            eq_type = analysis.eq_type
             
-            steps.append(Step(
-                latex=latex(eq),
+            yield Step(
+                latex=latex(analysis.eq),
                 explanation=f"🔍 Identificamos el tipo de ecuación: **{eq_type}**",
                 hint="Observa la estructura de la ecuación para identificar su tipo.",
                 step_type="identification"
-            ))
+            )
             
-            # Generar pasos según el tipo
-            if eq_type == "Lineal de Primer Orden":
-                steps.extend(self._solve_linear_first_order(expr, eq))
-            elif eq_type == "Variables Separables":
-                steps.extend(self._solve_separable(lhs, rhs, eq))
-            else:
-                steps.append(Step(
-                    latex="",
-                    explanation=f"⚠️ Aún no tenemos implementada la solución paso a paso para ecuaciones de tipo '{eq_type}'. ¡Próximamente!",
-                    step_type="warning"
-                ))
-                
-                # Intentar resolver con dsolve de todas formas
-                try:
-                    solution = dsolve(eq, self.y)
-                    steps.append(Step(
-                        latex=latex(solution),
-                        explanation="✨ Solución general obtenida (sin pasos detallados):",
-                        step_type="solution"
-                    ))
-                except:
-                    pass
+            yield from self._solution_body(analysis)
             
+        except ParseError as e:
+            yield Step(
+                latex="",
+                explanation=f"❌ Error de sintaxis: {str(e)}",
+                hint=f"{e.pointer()}\nEjemplos válidos: y' + 2y = e^x, dy/dx = xy",
+                step_type="error"
+            )
         except Exception as e:
-            steps.append(Step(
+            yield Step(
                 latex="",
                 explanation=f"❌ Error al procesar la ecuación: {str(e)}",
                 hint="Verifica la sintaxis de tu ecuación. Ejemplos válidos: y' + 2y = e^x, dy/dx = xy",
                 step_type="error"
-            ))
+            )
+    
+    def solve_many(self, equations, workers: int = None, timeout: float = None) -> list:
+        """
+        Resuelve muchas ecuaciones en paralelo usando un pool de procesos.
+        
+        Args:
+            equations: Iterable de ecuaciones en formato string
+            workers: Número de procesos (None = todos los núcleos)
+            timeout: Presupuesto de tiempo por ecuación en segundos (None = sin límite).
+                Si se indica, las ecuaciones que lo excedan terminan con un paso 'timeout'.
+            
+        Returns:
+            Lista con la lista de Step de cada ecuación, en el mismo orden
+        """
+        equations = list(equations)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(equations) or 1))
+        
+        if timeout is not None:
+            # Import diferido: solve_executor depende de este módulo
+            from src.engine.solve_executor import SolveExecutor
+            executor = SolveExecutor(max_workers=workers, timeout=timeout)
+            try:
+                tasks = [executor.submit(equation) for equation in equations]
+                return [task.result() for task in tasks]
+            finally:
+                executor.shutdown()
+        
+        if workers == 1:
+            return [self.solve_steps(equation) for equation in equations]
+        
+        chunksize = max(1, len(equations) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_batch_worker) as pool:
+            return list(pool.map(_solve_in_batch_worker, equations, chunksize=chunksize))
+    
+    def _solution_key(self, analysis: "AnalyzedEquation") -> str:
+        """
+        Clave de caché: huella canónica de la ecuación, su escala y la versión
+        del motor.
+        
+        Los pasos muestran los coeficientes tal como se escribieron, así que
+        2y' + 4y = 2e^x no puede reutilizar los pasos de y' + 2y = e^x; sí
+        los comparten las formas reordenadas con la misma escala.
+        """
+        scale = leading_coefficient(analysis.expr)
+        canonical = f"{ENGINE_VERSION}:{fingerprint(analysis.expr)}:{scale}"
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    def _solution_body(self, analysis: "AnalyzedEquation"):
+        """
+        Genera los pasos de resolución posteriores a la identificación,
+        consultando primero la caché persistente si está disponible.
+        """
+        key = None
+        if self.solution_cache is not None:
+            with self._span("solution_cache"):
+                key = self._solution_key(analysis)
+                cached = self.solution_cache.get(key)
+            if cached is not None:
+                for data in cached:
+                    yield Step.from_dict(data)
+                return
+        
+        body = []
+        for step in self._solve_by_type(analysis):
+            body.append(step)
+            yield step
         
-        return steps
+        # Solo se guardan soluciones completas: un aviso (p. ej. dsolve sin
+        # resultado o sin presupuesto de tiempo) puede no repetirse
+        step_types = {step.step_type for step in body}
+        if key is not None and "solution" in step_types and "error" not in step_types:
+            self.solution_cache.put(key, [step.to_dict() for step in body])
+    
+    def _solve_by_type(self, analysis: "AnalyzedEquation"):
+        """Genera los pasos según el tipo de ecuación identificado."""
+        eq_type = analysis.eq_type
+        
+        if eq_type == "Lineal de Primer Orden":
+            yield from self._traced("solve_linear_first_order",
+                                    self._solve_linear_first_order(analysis))
+        elif eq_type == "Variables Separables":
+            yield from self._traced("solve_separable", self._solve_separable(analysis))
+        elif eq_type in ("Segundo Orden Homogénea (Coeficientes Constantes)",
+                         "Segundo Orden No Homogénea (Coeficientes Constantes)"):
+            yield from self._traced("solve_second_order_constant",
+                                    self._solve_second_order_constant(analysis))
+        else:
+            yield Step(
+                latex="",
+                explanation=f"⚠️ Aún no tenemos implementada la solución paso a paso para ecuaciones de tipo '{eq_type}'. ¡Próximamente!",
+                step_type="warning"
+            )
+            
+            # Intentar resolver con dsolve de todas formas
+            solution = self._dsolve_hinted(analysis)
+            
+            if solution is not None:
+                yield Step(
+                    latex=latex(solution),
+                    explanation="✨ Solución general obtenida (sin pasos detallados):",
+                    step_type="solution"
+                )
+    
+    def _ranked_hints(self, analysis: "AnalyzedEquation") -> list:
+        """Pistas de dsolve a probar, empezando por la del tipo identificado."""
+        ranked = list(self.TYPE_HINTS.get(analysis.eq_type, ()))
+        fallback = self.FALLBACK_HINTS.get(min(analysis.order, 2), ())
+        ranked.extend(hint for hint in fallback if hint not in ranked)
+        return ranked
     
-    def _solve_linear_first_order(self, expr, eq) -> list:
+    def _hint_applies(self, problem, hint: str) -> bool:
+        """Comprueba con el solucionador de SymPy si la pista aplica a la ecuación."""
+        matcher = _HINT_MATCHERS.get(hint)
+        if matcher is None or problem is None:
+            # Sin comprobación previa: dsolve dirá si la pista no aplica
+            return True
+        try:
+            return matcher(problem).matches()
+        except Exception:
+            return False
+    
+    def _dsolve_hinted(self, analysis: "AnalyzedEquation", budget: float = None):
+        """
+        Resuelve con dsolve usando pistas en lugar del clasificador completo.
+        
+        Prueba primero la pista del tipo identificado y luego una lista
+        ordenada de pistas de respaldo. Solo si queda presupuesto se recurre
+        a dsolve sin pista. El presupuesto se revisa entre intentos (SymPy no
+        se puede interrumpir a mitad de un cálculo; el límite estricto lo
+        impone SolveExecutor).
+        
+        Args:
+            analysis: Ecuación ya analizada
+            budget: Segundos disponibles (None = DSOLVE_BUDGET)
+            
+        Returns:
+            Solución de dsolve, o None si no se encontró
+        """
+        if budget is None:
+            budget = self.DSOLVE_BUDGET
+        deadline = time.monotonic() + budget
+        
+        problem = None
+        if SingleODEProblem is not None:
+            try:
+                problem = SingleODEProblem(analysis.expr, self.y, self.x)
+            except Exception:
+                problem = None
+        
+        for hint in self._ranked_hints(analysis):
+            if time.monotonic() >= deadline:
+                return None
+            if not self._hint_applies(problem, hint):
+                continue
+            try:
+                with self._span("dsolve", hint=hint):
+                    return dsolve(Eq(analysis.expr, 0), self.y, hint=hint)
+            except (ValueError, NotImplementedError, TypeError):
+                continue
+        
+        if time.monotonic() >= deadline:
+            return None
+        try:
+            with self._span("dsolve", hint="default"):
+                return dsolve(Eq(analysis.expr, 0), self.y)
+        except Exception:
+            return None
+    
+    def _verify(self, analysis: "AnalyzedEquation", solutions, constants) -> Optional[bool]:
+        """
+        Verifica numéricamente una o varias soluciones explícitas y = f(x, C).
+        
+        Returns:
+            True si todas satisfacen la EDO, False si alguna no, o None si
+            alguna no se pudo evaluar
+        """
+        with self._span("verify"):
+            results = [
+                verify_solution(analysis.lhs, analysis.rhs, self.y, solution, self.x, constants)
+                for solution in solutions
+            ]
+        if False in results:
+            return False
+        if None in results:
+            return None
+        return True
+    
+    def _solve_linear_first_order(self, analysis: "AnalyzedEquation"):
         """
         Resuelve una EDO lineal de primer orden paso a paso.
         Forma: y' + P(x)y = Q(x)
         Método: Factor Integrante
         """
-        steps = []
-        
         # Paso 1: Forma estándar
-        steps.append(Step(
+        yield Step(
             latex=r"y' + P(x) \cdot y = Q(x)",
             explanation="📐 La forma estándar de una EDO lineal de primer orden es: y' + P(x)·y = Q(x)",
             hint="Necesitamos identificar P(x) y Q(x) de nuestra ecuación.",
             step_type="theory"
-        ))
+        )
         
         # Extraer coeficientes
-        p_x, q_x = self._extract_linear_coefficients(expr)
+        p_x, q_x = self._extract_linear_coefficients(analysis.expr)
         
         if p_x is not None:
-            steps.append(Step(
-                latex=f"P(x) = {latex(p_x)}, \\quad Q(x) = {latex(q_x)}",
-                explanation=f"🔎 Identificamos los coeficientes:\n• P(x) = {latex(p_x)} (coeficiente de y)\n• Q(x) = {latex(q_x)} (término independiente)",
+            yield Step(
+                latex=f"P(x) = {self._latex(p_x)}, \\quad Q(x) = {self._latex(q_x)}",
+                explanation=f"🔎 Identificamos los coeficientes:\n• P(x) = {self._latex(p_x)} (coeficiente de y)\n• Q(x) = {self._latex(q_x)} (término independiente)",
                 step_type="calculation"
-            ))
+            )
             
             # Paso 2: Factor Integrante
-            steps.append(Step(
+            yield Step(
                 latex=r"\mu(x) = e^{\int P(x) \, dx}",
                 explanation="🔧 El **Factor Integrante** es la clave para resolver esta ecuación. Se calcula como μ(x) = e^(∫P(x)dx)",
                 hint="El factor integrante 'mágicamente' convierte el lado izquierdo en una derivada de un producto.",
                 step_type="theory"
-            ))
+            )
             
             # Calcular la integral de P(x)
             try:
-                integral_p = integrate(p_x, self.x)
+                integral_p = self._integrate(p_x, self.x)
                 mu = exp(integral_p)
                 
-                steps.append(Step(
-                    latex=f"\\int P(x) \\, dx = \\int {latex(p_x)} \\, dx = {latex(integral_p)}",
-                    explanation=f"📊 Integramos P(x) = {latex(p_x)}",
+                yield Step(
+                    latex=f"\\int P(x) \\, dx = \\int {self._latex(p_x)} \\, dx = {self._latex(integral_p)}",
+                    explanation=f"📊 Integramos P(x) = {self._latex(p_x)}",
                     step_type="calculation"
-                ))
+                )
                 
-                steps.append(Step(
-                    latex=f"\\mu(x) = e^{{{latex(integral_p)}}} = {latex(mu)}",
-                    explanation=f"✨ El factor integrante es: μ(x) = {latex(mu)}",
+                yield Step(
+                    latex=f"\\mu(x) = e^{{{self._latex(integral_p)}}} = {self._latex(mu)}",
+                    explanation=f"✨ El factor integrante es: μ(x) = {self._latex(mu)}",
                     step_type="calculation"
-                ))
+                )
                 
                 # Paso 3: Multiplicar por el factor integrante
-                steps.append(Step(
-                    latex=f"{latex(mu)} \\cdot y' + {latex(mu)} \\cdot {latex(p_x)} \\cdot y = {latex(mu)} \\cdot {latex(q_x)}",
+                yield Step(
+                    latex=f"{self._latex(mu)} \\cdot y' + {self._latex(mu)} \\cdot {self._latex(p_x)} \\cdot y = {self._latex(mu)} \\cdot {self._latex(q_x)}",
                     explanation="🔄 Multiplicamos ambos lados de la ecuación por el factor integrante μ(x)",
                     step_type="calculation"
-                ))
+                )
                 
                 # Paso 4: Reconocer la derivada del producto
-                steps.append(Step(
-                    latex=f"\\frac{{d}}{{dx}}\\left[ {latex(mu)} \\cdot y \\right] = {latex(simplify(mu * q_x))}",
+                mu_q = self._simplify(mu * q_x)
+                yield Step(
+                    latex=f"\\frac{{d}}{{dx}}\\left[ {self._latex(mu)} \\cdot y \\right] = {self._latex(mu_q)}",
                     explanation="🎯 ¡El lado izquierdo ahora es la derivada de un producto! d/dx[μ(x)·y]",
                     hint="Esta es la 'magia' del factor integrante.",
                     step_type="insight"
-                ))
+                )
                 
                 # Paso 5: Integrar ambos lados
-                rhs_integral = integrate(mu * q_x, self.x)
+                rhs_integral = self._integrate(mu * q_x, self.x)
                 
-                steps.append(Step(
-                    latex=f"{latex(mu)} \\cdot y = \\int {latex(simplify(mu * q_x))} \\, dx",
+                yield Step(
+                    latex=f"{self._latex(mu)} \\cdot y = \\int {self._latex(mu_q)} \\, dx",
                     explanation="📐 Integramos ambos lados respecto a x",
                     step_type="calculation"
-                ))
+                )
                 
-                steps.append(Step(
-                    latex=f"{latex(mu)} \\cdot y = {latex(rhs_integral)} + C",
+                yield Step(
+                    latex=f"{self._latex(mu)} \\cdot y = {self._latex(rhs_integral)} + C",
                     explanation="📊 Resultado de la integral (no olvidar la constante C)",
                     step_type="calculation"
-                ))
+                )
                 
                 # Paso 6: Despejar y
-                y_solution = simplify(rhs_integral / mu)
+                y_solution = self._simplify(rhs_integral / mu)
                 C = symbols('C')
                 y_general = y_solution + C / mu
                 
-                steps.append(Step(
-                    latex=f"y = \\frac{{{latex(rhs_integral)} + C}}{{{latex(mu)}}}",
+                yield Step(
+                    latex=f"y = \\frac{{{self._latex(rhs_integral)} + C}}{{{self._latex(mu)}}}",
                     explanation="🎉 Despejamos y dividiendo entre μ(x)",
                     step_type="calculation"
-                ))
+                )
                 
                 # Simplificar si es posible
-                y_simplified = simplify(y_general)
+                y_simplified = self._simplify(y_general)
                 
-                steps.append(Step(
-                    latex=f"y = {latex(y_simplified)}",
+                if y_simplified.has(self.y) or y_simplified.has(Integral):
+                    # Sin forma cerrada (o con y dentro): no es una solución explícita
+                    yield Step(
+                        latex=f"y = {self._latex(y_simplified)}",
+                        explanation="⚠️ No se obtuvo una solución explícita: la integral no tiene forma cerrada",
+                        hint="La expresión queda en términos de una integral sin resolver.",
+                        step_type="warning"
+                    )
+                    return
+                
+                yield Step(
+                    latex=f"y = {self._latex(y_simplified)}",
                     explanation="✅ **Solución General** de la ecuación diferencial",
                     hint="C es la constante de integración. Su valor se determina con condiciones iniciales.",
-                    step_type="solution"
-                ))
+                    step_type="solution",
+                    verified=self._verify(analysis, [y_simplified], [C])
+                )
                 
             except Exception as e:
-                steps.append(Step(
+                yield Step(
                     latex="",
                     explanation=f"⚠️ No se pudo completar el cálculo: {str(e)}",
                     step_type="error"
-                ))
+                )
         else:
-            steps.append(Step(
+            yield Step(
                 latex="",
                 explanation="⚠️ No se pudieron extraer los coeficientes P(x) y Q(x) de la ecuación.",
                 hint="Intenta escribir la ecuación en forma estándar: y' + P(x)y = Q(x)",
                 step_type="error"
-            ))
-        
-        return steps
+            )
     
-    def _solve_separable(self, lhs, rhs, eq) -> list:
+    def _solve_separable(self, analysis: "AnalyzedEquation"):
         """
         Resuelve una EDO de variables separables paso a paso.
         Forma: dy/dx = f(x)·g(y)
+        Método: Separación de variables e integración directa
         """
-        steps = []
-        
-        steps.append(Step(
+        yield Step(
             latex=r"\frac{dy}{dx} = f(x) \cdot g(y)",
             explanation="📐 Una ecuación de **variables separables** tiene la forma: dy/dx = f(x)·g(y)",
             hint="Podemos 'separar' las variables x e y a cada lado de la ecuación.",
             step_type="theory"
-        ))
+        )
+        
+        separated = self._separate_variables(analysis.expr)
+        if separated is None:
+            yield from self._separable_fallback(analysis)
+            return
         
-        steps.append(Step(
-            latex=r"\frac{dy}{g(y)} = f(x) \, dx",
+        f, g = separated
+        y = self.y_symbol
+        
+        yield Step(
+            latex=f"f(x) = {self._latex(f)}, \\quad g(y) = {self._latex(g)}",
+            explanation=f"🔎 Identificamos las funciones:\n• f(x) = {self._latex(f)}\n• g(y) = {self._latex(g)}",
+            step_type="calculation"
+        )
+        
+        # Paso 1: Separar variables
+        yield Step(
+            latex=f"{self._latex(1 / g)} \\, dy = {self._latex(f)} \\, dx",
             explanation="🔄 Separamos las variables: todo lo que tiene 'y' a un lado, todo lo que tiene 'x' al otro.",
+            hint="Al dividir entre g(y) suponemos g(y) ≠ 0; las raíces de g(y) = 0 son soluciones constantes.",
             step_type="calculation"
-        ))
+        )
         
-        steps.append(Step(
-            latex=r"\int \frac{dy}{g(y)} = \int f(x) \, dx",
+        # Paso 2: Integrar cada lado una sola vez
+        try:
+            integral_y = self._integrate(1 / g, y)
+            integral_x = self._integrate(f, self.x)
+        except Exception as e:
+            yield Step(
+                latex="",
+                explanation=f"⚠️ No se pudo completar el cálculo: {str(e)}",
+                step_type="error"
+            )
+            return
+        
+        # Una integral sin resolver no es una solución: se recurre a dsolve
+        if integral_y.has(Integral) or integral_x.has(Integral):
+            yield from self._separable_fallback(analysis)
+            return
+        
+        C = symbols('C')
+        
+        yield Step(
+            latex=f"\\int {self._latex(1 / g)} \\, dy = \\int {self._latex(f)} \\, dx",
             explanation="📊 Integramos ambos lados",
             step_type="calculation"
-        ))
+        )
         
-        # Intentar resolver con dsolve
+        yield Step(
+            latex=f"{self._latex(integral_y)} = {self._latex(integral_x)} + C",
+            explanation="📊 Resultado de las integrales (una sola constante C basta)",
+            step_type="calculation"
+        )
+        
+        # Paso 3: Despejar y
         try:
-            solution = dsolve(eq, self.y)
-            steps.append(Step(
-                latex=latex(solution),
-                explanation="✅ **Solución General** obtenida:",
+            # Sin checksol simbólico: la solución se verifica numéricamente
+            solutions = sympy.solve(Eq(integral_y, integral_x + C), y, check=False)
+        except Exception:
+            solutions = []
+        
+        if solutions:
+            solutions_latex = ", \\quad ".join(f"y = {self._latex(self._simplify(sol))}" for sol in solutions)
+            verified = self._verify(analysis, solutions, [C])
+            # Al despejar una raíz par se pierde el signo: la solución solo
+            # vale donde el otro lado tiene el signo de la raíz
+            condition = None if verified else self._root_domain_condition(integral_y, integral_x + C)
+            if condition is not None:
+                explanation = f"✅ **Solución General**: despejamos y (válida donde {condition})"
+                hint = ("Al despejar y elevamos al cuadrado, así que la fórmula solo satisface "
+                        f"la ecuación donde se cumple {condition}.")
+            elif verified is False:
+                explanation = ("⚠️ **Solución obtenida al despejar y**, pero la comprobación numérica "
+                               "falló: puede ser válida solo en parte del dominio")
+                hint = "Sustituye la solución en la ecuación para ver dónde se cumple."
+            else:
+                explanation = "✅ **Solución General**: despejamos y"
+                hint = "C es la constante de integración. Su valor se determina con condiciones iniciales."
+            yield Step(
+                latex=solutions_latex,
+                explanation=explanation,
+                hint=hint,
+                step_type="solution",
+                verified=verified
+            )
+        else:
+            yield Step(
+                latex=f"{self._latex(integral_y)} = {self._latex(integral_x)} + C",
+                explanation="✅ **Solución General** en forma implícita (no se puede despejar y)",
+                hint="C es la constante de integración. Su valor se determina con condiciones iniciales.",
                 step_type="solution"
-            ))
-        except Exception as e:
-            steps.append(Step(
+            )
+    
+    def _separable_fallback(self, analysis: "AnalyzedEquation"):
+        """Resuelve con dsolve cuando la separación o las integrales no se completan."""
+        solution = self._dsolve_hinted(analysis)
+        if solution is not None:
+            explanation = "✅ **Solución General** obtenida:"
+            if solution.has(Integral):
+                explanation = "✅ **Solución General** obtenida (expresada con una integral que no tiene forma elemental):"
+            yield Step(
+                latex=self._latex(solution),
+                explanation=explanation,
+                step_type="solution"
+            )
+        else:
+            yield Step(
                 latex="",
-                explanation=f"⚠️ La integración completa requiere más trabajo: {str(e)}",
+                explanation="⚠️ La integración completa requiere más trabajo.",
                 step_type="warning"
-            ))
+            )
+    
+    def _root_domain_condition(self, integral_y, other_side) -> Optional[str]:
+        """
+        Condición de dominio al despejar G(y) = k·y^(p/q) con q par.
+        
+        Returns:
+            La condición en LaTeX (p. ej. "\\frac{x^{2}}{2} + C \\geq 0"), o None
+            si G(y) no tiene esa forma
+        """
+        coefficient, power = integral_y.as_coeff_Mul()
+        if not (power.is_Pow and power.base == self.y_symbol and power.exp.is_Rational
+                and power.exp.q % 2 == 0 and coefficient != 0):
+            return None
+        relation = "\\geq" if coefficient > 0 else "\\leq"
+        return f"{self._latex(other_side)} {relation} 0"
+    
+    def _solve_second_order_constant(self, analysis: "AnalyzedEquation"):
+        """
+        Resuelve una EDO lineal de segundo orden con coeficientes constantes.
+        Forma: a·y'' + b·y' + c·y = g(x)
+        Método: Ecuación característica (y variación de parámetros si g(x) ≠ 0)
+        """
+        a, b, c, g = self._extract_second_order_coefficients(analysis.expr)
+        r = symbols('r')
+        C1, C2 = symbols('C1 C2')
+        
+        yield Step(
+            latex=r"a \, y'' + b \, y' + c \, y = g(x)",
+            explanation="📐 Es una EDO lineal de segundo orden con **coeficientes constantes**. Proponemos soluciones de la forma y = e^(rx).",
+            hint="Al sustituir y = e^(rx), cada derivada solo multiplica por r.",
+            step_type="theory"
+        )
+        
+        yield Step(
+            latex=f"a = {self._latex(a)}, \\quad b = {self._latex(b)}, \\quad c = {self._latex(c)}",
+            explanation=f"🔎 Identificamos los coeficientes:\n• a = {self._latex(a)} (coeficiente de y'')\n• b = {self._latex(b)} (coeficiente de y')\n• c = {self._latex(c)} (coeficiente de y)",
+            step_type="calculation"
+        )
+        
+        # Paso 1: Ecuación característica
+        yield Step(
+            latex=f"{self._latex(a * r**2 + b * r + c)} = 0",
+            explanation="🔧 Escribimos la **ecuación característica** a·r² + b·r + c = 0",
+            step_type="calculation"
+        )
+        
+        # Paso 2: Discriminante y raíces con la fórmula cuadrática
+        discriminant = sympy.expand(b**2 - 4 * a * c)
+        
+        yield Step(
+            latex=f"\\Delta = b^2 - 4ac = {self._latex(discriminant)}",
+            explanation="📊 Calculamos el discriminante para saber qué tipo de raíces tiene.",
+            step_type="calculation"
+        )
+        
+        if discriminant.is_positive:
+            root_1 = sympy.radsimp((-b + sqrt(discriminant)) / (2 * a))
+            root_2 = sympy.radsimp((-b - sqrt(discriminant)) / (2 * a))
+            y1, y2 = exp(root_1 * self.x), exp(root_2 * self.x)
+            
+            yield Step(
+                latex=f"r_1 = {self._latex(root_1)}, \\quad r_2 = {self._latex(root_2)}",
+                explanation="✨ Δ > 0: dos **raíces reales distintas** r = (-b ± √Δ) / 2a",
+                step_type="calculation"
+            )
+        elif discriminant.is_zero:
+            root = sympy.radsimp(-b / (2 * a))
+            y1, y2 = exp(root * self.x), self.x * exp(root * self.x)
+            
+            yield Step(
+                latex=f"r_1 = r_2 = {self._latex(root)}",
+                explanation="✨ Δ = 0: una **raíz real repetida** r = -b / 2a",
+                hint="Con raíz repetida, la segunda solución se obtiene multiplicando por x.",
+                step_type="calculation"
+            )
+        elif discriminant.is_negative:
+            alpha = sympy.radsimp(-b / (2 * a))
+            beta = sympy.radsimp(sqrt(-discriminant) / (2 * a))
+            y1 = exp(alpha * self.x) * cos(beta * self.x)
+            y2 = exp(alpha * self.x) * sin(beta * self.x)
+            
+            imaginary = self._latex(beta * sympy.I)
+            roots_latex = f"{self._latex(alpha)} \\pm {imaginary}" if alpha != 0 else f"\\pm {imaginary}"
+            
+            yield Step(
+                latex=f"r = {roots_latex}",
+                explanation="✨ Δ < 0: **raíces complejas conjugadas** r = α ± βi, con α = -b/2a y β = √(-Δ)/2a",
+                hint="Por la fórmula de Euler, e^(βix) da lugar a cos(βx) y sin(βx).",
+                step_type="calculation"
+            )
+        else:
+            # El signo del discriminante depende de parámetros desconocidos
+            solution = self._dsolve_hinted(analysis)
+            if solution is not None:
+                yield Step(
+                    latex=self._latex(solution),
+                    explanation="✨ Solución general obtenida (sin pasos detallados):",
+                    step_type="solution"
+                )
+            return
+        
+        # Paso 3: Solución homogénea
+        y_h = C1 * y1 + C2 * y2
+        
+        yield Step(
+            latex=f"y_h = {self._latex(y_h)}",
+            explanation="🎯 La **solución homogénea** combina las dos soluciones independientes.",
+            hint="C1 y C2 son constantes arbitrarias.",
+            step_type="solution" if g == 0 else "calculation"
+        )
         
-        return steps
\ No newline at end of file
+        if g == 0:
+            return
+        
+        # Paso 4: Solución particular por variación de parámetros
+        try:
+            wronskian = self._simplify(y1 * y2.diff(self.x) - y1.diff(self.x) * y2)
+            
+            yield Step(
+                latex=f"W(y_1, y_2) = {self._latex(wronskian)}",
+                explanation=f"🔄 Para g(x) = {self._latex(g)} usamos **variación de parámetros**. Calculamos el Wronskiano de y₁ = {self._latex(y1)} y y₂ = {self._latex(y2)}",
+                step_type="calculation"
+            )
+            
+            u1 = self._integrate(self._simplify(-y2 * g / (a * wronskian)), self.x)
+            u2 = self._integrate(self._simplify(y1 * g / (a * wronskian)), self.x)
+            
+            yield Step(
+                latex=f"u_1 = -\\int \\frac{{y_2 \\, g(x)}}{{a \\, W}} \\, dx = {self._latex(u1)}, \\quad u_2 = \\int \\frac{{y_1 \\, g(x)}}{{a \\, W}} \\, dx = {self._latex(u2)}",
+                explanation="📊 Integramos para obtener las funciones u₁ y u₂",
+                step_type="calculation"
+            )
+            
+            y_p = self._simplify(u1 * y1 + u2 * y2)
+            
+            yield Step(
+                latex=f"y_p = u_1 y_1 + u_2 y_2 = {self._latex(y_p)}",
+                explanation="✨ Solución particular",
+                step_type="calculation"
+            )
+            
+            yield Step(
+                latex=f"y = {self._latex(y_h + y_p)}",
+                explanation="✅ **Solución General**: y = y_h + y_p",
+                hint="C1 y C2 se determinan con condiciones iniciales.",
+                step_type="solution"
+            )
+        except Exception as e:
+            yield Step(
+                latex="",
+                explanation=f"⚠️ No se pudo completar el cálculo: {str(e)}",
+                step_type="error"
+            )
+
+
+# Motor de cada proceso del pool de solve_many (uno por proceso)
+_batch_engine = None
+
+
+def _init_batch_worker():
+    global _batch_engine
+    from src.engine.service import get_engine
+    _batch_engine = get_engine()
+
+
+def _solve_in_batch_worker(equation: str) -> list:
+    return _batch_engine.solve_steps(equation)
@@ -0,0 +1,175 @@
+"""
+Instrumentación por etapas del motor de pasos.
+
+Un Tracer registra, para cada etapa de una resolución (parseo,
+clasificación, rama del solucionador, integrate, simplify...), el tiempo
+de reloj, el tiempo de CPU y cuántas operaciones de SymPy se ejecutaron.
+Los resultados se consultan con summary(), se reciben en un callback al
+cerrar cada etapa o se exportan en el formato de eventos de Chrome
+(chrome://tracing, Perfetto).
+
+Uso:
+    with engine.trace() as tracer:
+        engine.solve_steps("y' + 2y = e^x")
+    tracer.dump_chrome_trace("traza.json")
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+class Span:
+    """
+    Una etapa medida.
+
+    Attributes:
+        name: Nombre de la etapa
+        args: Datos adicionales (p. ej. la pista de dsolve)
+        start: Inicio, en segundos desde la creación del Tracer
+        wall: Duración en segundos de reloj
+        cpu: Tiempo de CPU del hilo, en segundos
+        ops: Operaciones de SymPy ejecutadas dentro de la etapa (incluye subetapas)
+        depth: Nivel de anidamiento (0 = etapa raíz)
+        thread_id: Hilo que ejecutó la etapa
+    """
+
+    __slots__ = ("name", "args", "start", "wall", "cpu", "ops", "depth", "thread_id")
+
+    def __init__(self, name: str, args: Dict, start: float, depth: int, thread_id: int):
+        self.name = name
+        self.args = args
+        self.start = start
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.ops: Dict[str, int] = defaultdict(int)
+        self.depth = depth
+        self.thread_id = thread_id
+
+    def __repr__(self):
+        return f"Span({self.name}, wall={self.wall * 1000:.2f} ms, cpu={self.cpu * 1000:.2f} ms)"
+
+
+class Tracer:
+    """
+    Registro de etapas de una o varias resoluciones (seguro para hilos).
+
+    Args:
+        callback: Función opcional que recibe cada Span al cerrarse
+    """
+
+    def __init__(self, callback: Optional[Callable[[Span], None]] = None):
+        self.callback = callback
+        self.spans: List[Span] = []
+        self._origin = time.perf_counter()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **args):
+        """Mide el bloque como una etapa (anidable)."""
+        stack = self._stack()
+        span = Span(name, args, time.perf_counter() - self._origin, len(stack),
+                    threading.get_ident())
+        stack.append(span)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield span
+        finally:
+            span.wall = time.perf_counter() - wall_start
+            span.cpu = time.thread_time() - cpu_start
+            stack.pop()
+            if stack:
+                parent_ops = stack[-1].ops
+                for op, count in span.ops.items():
+                    parent_ops[op] += count
+            with self._lock:
+                self.spans.append(span)
+            if self.callback is not None:
+                self.callback(span)
+
+    def iterate(self, name: str, iterable, **args):
+        """
+        Recorre un generador midiendo solo el tiempo que pasa dentro de él.
+
+        Cada reanudación se registra como un tramo de la etapa, de modo que
+        el tiempo que el consumidor tarda entre pasos (p. ej. la interfaz
+        renderizando) no se atribuye al motor.
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.span(name, **args):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def count(self, op: str, n: int = 1):
+        """Cuenta una operación de SymPy en la etapa abierta del hilo actual."""
+        stack = self._stack()
+        if stack:
+            stack[-1].ops[op] += n
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Totales por etapa.
+
+        Returns:
+            Dict nombre -> {'count', 'wall_ms', 'cpu_ms', 'ops'}; los tramos
+            de una misma etapa se suman
+        """
+        totals: Dict[str, Dict] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            entry = totals.setdefault(span.name, {
+                'count': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0, 'ops': defaultdict(int)
+            })
+            entry['count'] += 1
+            entry['wall_ms'] += span.wall * 1000
+            entry['cpu_ms'] += span.cpu * 1000
+            for op, count in span.ops.items():
+                entry['ops'][op] += count
+        for entry in totals.values():
+            entry['ops'] = dict(entry['ops'])
+        return totals
+
+    def to_chrome_trace(self) -> Dict:
+        """Eventos en el formato JSON de Chrome (eventos completos, 'ph': 'X')."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        events = []
+        for span in spans:
+            args = {str(k): str(v) for k, v in span.args.items()}
+            args['cpu_ms'] = round(span.cpu * 1000, 3)
+            args.update({f"ops.{op}": count for op, count in span.ops.items()})
+            events.append({
+                'name': span.name,
+                'cat': 'engine',
+                'ph': 'X',
+                'ts': round(span.start * 1e6, 1),
+                'dur': round(span.wall * 1e6, 1),
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': args,
+            })
+        events.sort(key=lambda event: event['ts'])
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump_chrome_trace(self, path: str):
+        """Guarda la traza en un archivo JSON que se abre en chrome://tracing o Perfetto."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
@@ -0,0 +1,106 @@
+"""
+Verificación numérica de soluciones generales.
+
+En lugar de checkodesol (simbólico y costoso), se sustituye la solución
+en la EDO y se evalúa el residuo con lambdify + NumPy sobre un lote de
+puntos x y valores de las constantes elegidos al azar.
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+from sympy import lambdify
+
+# Parámetros por defecto de la verificación
+DEFAULT_SAMPLES = 64
+DEFAULT_TOLERANCE = 1e-6
+# Fracción mínima de puntos evaluables para emitir un veredicto
+_MIN_VALID_FRACTION = 0.25
+
+# Intervalos de muestreo (se evita x = 0, donde suelen aparecer singularidades)
+_X_RANGE = (0.1, 2.0)
+_CONSTANT_RANGE = (-2.0, 2.0)
+
+
+def verify_solution(lhs, rhs, y, solution, x, constants: Iterable = (),
+                    samples: int = DEFAULT_SAMPLES,
+                    tolerance: float = DEFAULT_TOLERANCE,
+                    seed: int = 0) -> Optional[bool]:
+    """
+    Comprueba numéricamente que y = solution satisface lhs = rhs.
+
+    Args:
+        lhs, rhs: Lados de la EDO, en términos de y(x) y sus derivadas
+        y: La función incógnita, p. ej. y(x)
+        solution: Expresión explícita de y en x y las constantes
+        x: Variable independiente
+        constants: Constantes arbitrarias de la solución (C, C1, C2...)
+        samples: Número de puntos de muestreo
+        tolerance: Error relativo máximo admitido
+        seed: Semilla del generador (la verificación es reproducible)
+
+    Returns:
+        True si el residuo es despreciable en todos los puntos evaluables,
+        False si no lo es en ninguno, o None si no se pudo evaluar (p. ej.
+        la solución no es numérica o casi todos los puntos son singulares)
+        o si solo se cumple en parte de los puntos
+    """
+    constants = list(constants)
+    if solution.has(y):
+        # Solución implícita o con integrales sin resolver
+        return None
+    try:
+        lhs_sub = lhs.subs(y, solution).doit()
+        rhs_sub = rhs.subs(y, solution).doit()
+        if lhs_sub.has(y) or rhs_sub.has(y):
+            return None
+        args = [x] + constants
+        f_lhs = lambdify(args, lhs_sub, modules="numpy")
+        f_rhs = lambdify(args, rhs_sub, modules="numpy")
+    except Exception:
+        return None
+
+    rng = np.random.default_rng(seed)
+    x_values = rng.uniform(*_X_RANGE, samples)
+    constant_values = [rng.uniform(*_CONSTANT_RANGE, samples) for _ in constants]
+
+    # Primero en los reales, donde la solución tiene sentido para el
+    # estudiante: los puntos donde alguna expresión no está definida (raíz o
+    # logaritmo de un negativo) se descartan. Si casi ninguno es evaluable,
+    # se repite con entradas complejas.
+    verdict = _compare([x_values] + constant_values, f_lhs, f_rhs, samples, tolerance)
+    if verdict is None:
+        complex_points = [values.astype(complex) for values in [x_values] + constant_values]
+        verdict = _compare(complex_points, f_lhs, f_rhs, samples, tolerance)
+    return verdict
+
+
+def _compare(points, f_lhs, f_rhs, samples: int, tolerance: float) -> Optional[bool]:
+    """
+    Evalúa ambos lados en los puntos y compara.
+
+    Returns:
+        True si coinciden en todos los puntos evaluables, False si no
+        coinciden en ninguno, o None si hay pocos puntos evaluables o la
+        igualdad solo se cumple en parte de ellos (solución válida en una
+        parte del dominio)
+    """
+    try:
+        with np.errstate(all="ignore"):
+            left = np.broadcast_to(np.asarray(f_lhs(*points), dtype=complex), (samples,))
+            right = np.broadcast_to(np.asarray(f_rhs(*points), dtype=complex), (samples,))
+            valid = np.isfinite(left) & np.isfinite(right)
+            if valid.sum() < max(1, int(samples * _MIN_VALID_FRACTION)):
+                return None
+            left, right = left[valid], right[valid]
+            error = np.abs(left - right)
+            scale = 1.0 + np.abs(left) + np.abs(right)
+    except Exception:
+        return None
+
+    matches = error <= tolerance * scale
+    if np.all(matches):
+        return True
+    if not np.any(matches):
+        return False
+    return None
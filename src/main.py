@@ -4,10 +4,35 @@ import os
 # Add the project root to the Python path to allow absolute imports from src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from PyQt6.QtCore import QRunnable, QThread, QThreadPool, QTimer
 from PyQt6.QtWidgets import QApplication, QMessageBox
 from src.ui.main_window import MainWindow
 
 
+class WarmUpRunnable(QRunnable):
+    """Calienta el motor de SymPy en segundo plano (ver service.warm_up)."""
+
+    def run(self):
+        try:
+            from src.engine.service import warm_up
+            warm_up()
+        except Exception as e:
+            print(f"⚠️ No se pudo precalentar el motor: {e}")
+
+
+def start_warm_up():
+    """
+    Lanza el calentamiento del motor en un hilo de prioridad mínima.
+
+    Usa un pool propio de un solo hilo para no ocupar el pool global, que
+    es el que atiende las resoluciones de las vistas.
+    """
+    pool = QThreadPool(QApplication.instance())
+    pool.setMaxThreadCount(1)
+    pool.setThreadPriority(QThread.Priority.LowestPriority)
+    pool.start(WarmUpRunnable())
+
+
 def init_database():
     """
     Inicializa la conexión a MySQL.
@@ -145,6 +170,10 @@ def main():
     window = MainWindow(db=db, user_id=user_id)
     window.show()
     
+    # Precalentar SymPy cuando la ventana ya se muestra, para que la primera
+    # resolución del estudiante no pague la inicialización
+    QTimer.singleShot(0, start_warm_up)
+    
     sys.exit(app.exec())
 
 
@@ -717,6 +717,12 @@ class ExerciseDialog(QDialog):
             for ans_norm in normalized_correct
         )
         
+        # Respuestas de tipo ecuación: se comparan matemáticamente, no como texto
+        if not is_correct and self.exercise_data.get('tipo_respuesta') == 'ecuacion':
+            # Importación diferida: carga SymPy solo al corregir la primera ecuación
+            from src.engine.equivalence import answers_equivalent
+            is_correct = any(answers_equivalent(user_answer, ans) for ans in correct_answers)
+        
         # Calcular XP
         elapsed_time = int(time.time() - self.start_time)
         xp_base = self.exercise_data.get('xp_base', 25)
@@ -0,0 +1,106 @@
+"""
+Rasterizado directo de fórmulas LaTeX con el mathtext de Matplotlib.
+
+En lugar de crear una figura de pyplot, guardarla como PNG (con el cálculo
+del recorte ajustado y la compresión) y volver a decodificarla, se usa el
+parser de mathtext con el backend Agg, que entrega directamente la máscara
+de cobertura de la fórmula. Con ella se compone un búfer RGBA que QImage
+envuelve sin copiarlo.
+
+Matplotlib se importa en el primer renderizado, no al cargar el módulo.
+"""
+
+import importlib.util
+import threading
+from functools import lru_cache
+from typing import Optional
+
+from PyQt6.QtGui import QImage
+
+
+# Margen alrededor de la fórmula, en pulgadas (el pad_inches de savefig)
+PAD_INCHES = 0.1
+
+# El parser de mathtext y las fuentes de FreeType no son seguros para hilos
+_lock = threading.Lock()
+_parser = None
+_matplotlib_checked = False
+
+
+def _load_parser():
+    """
+    Crea el parser de mathtext (backend Agg) la primera vez que se necesita.
+
+    Returns:
+        MathTextParser, o None si matplotlib no está instalado
+    """
+    global _parser, _matplotlib_checked
+    if not _matplotlib_checked:
+        try:
+            from matplotlib.mathtext import MathTextParser
+            _parser = MathTextParser("agg")
+        except ImportError:
+            _parser = None
+        _matplotlib_checked = True
+    return _parser
+
+
+@lru_cache(maxsize=None)
+def is_available() -> bool:
+    """
+    Indica si matplotlib está instalado (y, por tanto, si se puede renderizar).
+
+    Solo busca el paquete, sin importarlo, para no bloquear a quien pregunta.
+    """
+    return importlib.util.find_spec("matplotlib") is not None
+
+
+def render_formula(latex_expr: str, fontsize: int = 14, dpi: float = 150,
+                   background: str = "white") -> Optional[QImage]:
+    """
+    Renderiza una expresión LaTeX en una imagen RGBA.
+
+    Args:
+        latex_expr: Expresión en formato LaTeX (sin delimitadores $ $)
+        fontsize: Tamaño de fuente en puntos
+        dpi: Resolución (ya multiplicada por la densidad de la pantalla)
+        background: Color de fondo
+
+    Returns:
+        QImage (formato RGBA8888) que comparte memoria con el búfer de NumPy,
+        o None si matplotlib no está instalado
+
+    Raises:
+        ValueError: Si mathtext no puede interpretar la expresión
+    """
+    import numpy as np
+    from matplotlib import rcParams
+    from matplotlib.colors import to_rgba
+    from matplotlib.font_manager import FontProperties
+
+    with _lock:
+        parser = _load_parser()
+        if parser is None:
+            return None
+        result = parser.parse(f"${latex_expr}$", dpi=dpi, prop=FontProperties(size=fontsize))
+        # Cobertura de cada píxel (0 = fondo, 255 = tinta)
+        coverage = np.asarray(result.image, dtype=np.float32) / 255.0
+
+    pad = int(round(PAD_INCHES * dpi))
+    height, width = coverage.shape
+    text_color = np.array(to_rgba(rcParams["text.color"]), dtype=np.float32) * 255.0
+    background_color = np.array(to_rgba(background), dtype=np.float32) * 255.0
+
+    # Mezcla de la tinta sobre el fondo; el margen queda del color de fondo
+    pixels = np.empty((height + 2 * pad, width + 2 * pad, 4), dtype=np.uint8)
+    pixels[...] = background_color.astype(np.uint8)
+    alpha = coverage[..., np.newaxis]
+    pixels[pad:pad + height, pad:pad + width] = (
+        background_color * (1.0 - alpha) + text_color * alpha + 0.5
+    ).astype(np.uint8)
+
+    image = QImage(pixels.data, pixels.shape[1], pixels.shape[0], pixels.strides[0],
+                   QImage.Format.Format_RGBA8888)
+    # QImage no copia los datos: el búfer debe vivir tanto como la imagen
+    image._buffer = pixels
+    return image
@@ -218,37 +218,76 @@ class MainWindow(QMainWindow):
         layout.addWidget(footer)
     
     def _setup_views(self):
-        """Configura las vistas del contenido."""
-        # Importar vistas
+        """
+        Configura las vistas del contenido.
+
+        Solo el Dashboard se construye al arrancar. Las demás vistas importan
+        módulos pesados (SymPy en el Solucionador y los ejercicios,
+        Matplotlib/NumPy en el Graficador), así que cada índice empieza con
+        un contenedor vacío y la vista real se crea la primera vez que se
+        navega a ella.
+        """
         from src.ui.dashboard_view import DashboardView
-        from src.ui.exercises_view import ExercisesView
-        from src.ui.progress_view import ProgressView
-        from src.ui.solver_view import SolverView
-        from src.ui.visualizer_view import VisualizerView
-        from src.ui.module_detail_view import ModuleDetailView
+        
+        # Índice -> función que construye la vista
+        self._view_factories = {
+            1: self._create_exercises_view,
+            2: self._create_progress_view,
+            3: self._create_solver_view,
+            4: self._create_visualizer_view,
+            5: self._create_theory_view,
+        }
         
         # 0. Dashboard
         self.dashboard_view = DashboardView()
         self.content_area.addWidget(self.dashboard_view)
         
-        # 1. Ejercicios
+        # 1-5. Contenedores vacíos hasta el primer uso
+        for _ in self._view_factories:
+            self.content_area.addWidget(QWidget())
+    
+    def _ensure_view(self, index: int) -> bool:
+        """
+        Construye la vista del índice si aún no existe.
+        
+        Returns:
+            True si la vista se acaba de crear
+        """
+        factory = self._view_factories.pop(index, None)
+        if factory is None:
+            return False
+        
+        placeholder = self.content_area.widget(index)
+        view = factory()
+        self.content_area.insertWidget(index, view)
+        self.content_area.removeWidget(placeholder)
+        placeholder.deleteLater()
+        return True
+    
+    def _create_exercises_view(self):
+        from src.ui.exercises_view import ExercisesView
         self.exercises_view = ExercisesView(db=self.db, user_id=self.user_id)
         self.exercises_view.exercise_completed.connect(self._on_exercise_completed)
-        self.content_area.addWidget(self.exercises_view)
-        
-        # 2. Progreso
+        return self.exercises_view
+    
+    def _create_progress_view(self):
+        from src.ui.progress_view import ProgressView
         self.progress_view = ProgressView(db=self.db, user_id=self.user_id)
-        self.content_area.addWidget(self.progress_view)
-        
-        # 3. Solucionador
+        return self.progress_view
+    
+    def _create_solver_view(self):
+        from src.ui.solver_view import SolverView
         self.solver_view = SolverView()
-        self.content_area.addWidget(self.solver_view)
-        
-        # 4. Visualizador
+        return self.solver_view
+    
+    def _create_visualizer_view(self):
+        from src.ui.visualizer_view import VisualizerView
         self.visualizer_view = VisualizerView()
-        self.content_area.addWidget(self.visualizer_view)
-        
-        # 5. Teoría (usa ModuleDetailView)
+        return self.visualizer_view
+    
+    def _create_theory_view(self):
+        """Teoría (usa ModuleDetailView)."""
+        from src.ui.module_detail_view import ModuleDetailView
         theory_data = {
             "title": "Fundamentos de Ecuaciones Diferenciales",
             "description": "Aprende los conceptos básicos de las ecuaciones diferenciales, su clasificación y métodos de solución.",
@@ -265,7 +304,7 @@ class MainWindow(QMainWindow):
             ]
         }
         self.theory_view = ModuleDetailView(theory_data)
-        self.content_area.addWidget(self.theory_view)
+        return self.theory_view
 
     def _on_exercise_completed(self, result: dict):
         """Refresca vistas de progreso y dashboard tras completar un ejercicio."""
@@ -283,9 +322,10 @@ class MainWindow(QMainWindow):
         for i, btn in enumerate(self.nav_buttons):
             btn.setChecked(i == index)
         
-        # Cambiar vista
+        # Cambiar vista (construyéndola si es la primera visita)
+        created = self._ensure_view(index)
         self.content_area.setCurrentIndex(index)
         
-        # Refrescar si es necesario
-        if index == 2 and hasattr(self, 'progress_view'):
+        # Refrescar si es necesario (una vista recién creada ya está al día)
+        if index == 2 and not created and hasattr(self, 'progress_view'):
             self.progress_view.refresh()
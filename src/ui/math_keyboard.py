@@ -4,18 +4,11 @@ from PyQt6.QtWidgets import (
     QScrollArea, QSizePolicy
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QPixmap, QImage
-import io
+from PyQt6.QtGui import QFont, QPixmap
+from typing import Optional
 
-# Intentar importar matplotlib para renderizado LaTeX
-try:
-    import matplotlib
-    matplotlib.use('Agg')  # Backend sin GUI para renderizado
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_agg import FigureCanvasAgg
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+from src.ui import latex_renderer
+from src.ui.render_service import render_service
 
 
 class MathSymbolButton(QPushButton):
@@ -516,7 +509,7 @@ class MathKeyboard(QWidget):
 class MathRenderWidget(QLabel):
     """
     Widget para renderizar y mostrar expresiones matemáticas en formato LaTeX.
-    Utiliza matplotlib para convertir LaTeX a imagen.
+    Utiliza el mathtext de matplotlib para convertir LaTeX a imagen.
     """
     
     def __init__(self, parent=None):
@@ -535,14 +528,15 @@ class MathRenderWidget(QLabel):
     
     def render_latex(self, latex_expr: str, fontsize: int = 14, dpi: int = 150):
         """
-        Renderiza una expresión LaTeX y la muestra como imagen.
+        Renderiza una expresión LaTeX y la muestra como imagen (en segundo
+        plano si no está en caché, ver RenderService).
         
         Args:
             latex_expr: Expresión en formato LaTeX (sin delimitadores $ $)
             fontsize: Tamaño de fuente para el renderizado
             dpi: Resolución de la imagen generada
         """
-        if not MATPLOTLIB_AVAILABLE:
+        if not latex_renderer.is_available():
             self.setText(f"[LaTeX]: {latex_expr}")
             return
         
@@ -551,54 +545,43 @@ class MathRenderWidget(QLabel):
         
         self._last_latex = latex_expr
         
-        try:
-            # Crear figura de matplotlib
-            fig = plt.figure(figsize=(8, 1))
-            fig.patch.set_facecolor('white')
-            
-            # Renderizar LaTeX
-            fig.text(
-                0.5, 0.5,
-                f"${latex_expr}$",
-                fontsize=fontsize,
-                ha='center',
-                va='center',
-                transform=fig.transFigure
-            )
-            
-            # Convertir a imagen
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', dpi=dpi, 
-                       bbox_inches='tight', pad_inches=0.1,
-                       facecolor='white', edgecolor='none')
-            buf.seek(0)
-            plt.close(fig)
-            
-            # Cargar en QPixmap
-            image = QImage()
-            image.loadFromData(buf.getvalue())
-            pixmap = QPixmap.fromImage(image)
-            
-            # Escalar si es muy grande
-            if pixmap.width() > self.width() - 20:
-                pixmap = pixmap.scaledToWidth(
-                    self.width() - 20,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-            
-            self.setPixmap(pixmap)
-            
-        except Exception as e:
+        # Las mismas fórmulas se repiten entre vistas: si ya se renderizó se
+        # muestra al instante; si no, se renderiza en segundo plano y
+        # mientras tanto se muestra el texto de la fórmula
+        pixmap = render_service().request(self, latex_expr, fontsize, dpi,
+                                          self.devicePixelRatioF())
+        if pixmap is not None:
+            self._show_pixmap(pixmap)
+        else:
+            self.setText(f"⏳ {latex_expr}")
+    
+    def _on_render_ready(self, pixmap: Optional[QPixmap]):
+        """Recibe el resultado del servicio de renderizado."""
+        if pixmap is None:
             # Si falla el renderizado, mostrar texto plano
-            self.setText(f"[LaTeX]: {latex_expr}")
+            self.setText(f"[LaTeX]: {self._last_latex}")
+        else:
+            self._show_pixmap(pixmap)
+    
+    def _show_pixmap(self, pixmap: QPixmap):
+        """Muestra la imagen, escalándola si es muy grande (en píxeles lógicos)."""
+        max_width = self.width() - 20
+        if pixmap.deviceIndependentSize().width() > max_width:
+            pixmap = pixmap.scaledToWidth(
+                int(max_width * pixmap.devicePixelRatio()),
+                Qt.TransformationMode.SmoothTransformation
+            )
+        self.setPixmap(pixmap)
     
     def clear_render(self):
         """Limpia el renderizado actual."""
+        render_service().cancel(self)
         self.clear()
         self._last_latex = ""
     
     def set_plain_text(self, text: str):
         """Muestra texto plano sin renderizado LaTeX."""
+        render_service().cancel(self)
         self.setText(text)
         self._last_latex = ""
 
@@ -0,0 +1,268 @@
+"""
+Caché de fórmulas LaTeX ya renderizadas.
+
+Las mismas fórmulas aparecen en el Solucionador, los ejercicios y los
+módulos de teoría. Renderizar una con Matplotlib cuesta decenas de
+milisegundos, así que se guardan en dos niveles:
+
+- En memoria: los QPixmap, en una caché LRU compartida por todo el
+  proceso y acotada por el total de bytes de las imágenes.
+- En disco: las imágenes en PNG bajo ~/.calcquest/render_cache, para que
+  las fórmulas fijas (p. ej. los enunciados de los ejercicios) no se
+  vuelvan a renderizar tras reiniciar la aplicación.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Hashable, Optional
+
+from PyQt6.QtGui import QImage, QPixmap
+
+from src.core.lru_cache import LRUCache
+
+
+# Memoria máxima de las imágenes guardadas (32 MB)
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+# Versión del formato de las imágenes en disco; se incrementa cuando cambia
+# la forma de renderizar (márgenes, fondo...) para descartar las anteriores
+RENDER_FORMAT_VERSION = "2"
+
+# Variable de entorno que reemplaza la carpeta por defecto de la caché en disco
+RENDER_CACHE_DIR_ENV = "CALCQUEST_RENDER_CACHE"
+
+
+def render_key(latex_expr: str, fontsize: int, dpi: int, device_pixel_ratio: float) -> Hashable:
+    """Clave de un renderizado: la misma fórmula cambia de imagen con cada parámetro."""
+    return (latex_expr, fontsize, dpi, round(device_pixel_ratio, 2))
+
+
+def pixmap_bytes(pixmap: QPixmap) -> int:
+    """Memoria aproximada que ocupa un QPixmap."""
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+def create_pixmap_cache(max_bytes: int = DEFAULT_MAX_BYTES) -> LRUCache:
+    """
+    Args:
+        max_bytes: Suma máxima de los tamaños de las imágenes guardadas
+
+    Returns:
+        LRUCache de QPixmap cuyo límite son bytes, no entradas
+    """
+    return LRUCache(maxsize=max_bytes, weigher=pixmap_bytes)
+
+
+# Instancia compartida por todas las vistas del proceso (solo hilo de la GUI:
+# los QPixmap no se pueden usar desde otros hilos)
+_shared_cache: Optional[LRUCache] = None
+
+
+def shared_pixmap_cache() -> LRUCache:
+    """Retorna la caché de imágenes compartida del proceso (se crea al primer uso)."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = create_pixmap_cache()
+    return _shared_cache
+
+
+class DiskRenderCache:
+    """
+    Caché persistente de imágenes de fórmulas (segura para hilos).
+
+    Cada imagen se guarda en un PNG cuyo nombre es el hash de su clave de
+    renderizado. Un índice JSON registra el tamaño y el último acceso de
+    cada archivo para desalojar por LRU cuando se supera el tamaño máximo.
+    Si cambia la versión (la de Matplotlib o la del formato), las imágenes
+    anteriores se descartan.
+    """
+
+    DEFAULT_MAX_BYTES = 50 * 1024 * 1024  # 50 MB
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: Optional[str] = None, version: str = "",
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory: Carpeta de la caché. Si es None, usa ~/.calcquest/render_cache
+            version: Versión de las imágenes; las de otras versiones se descartan
+            max_bytes: Tamaño máximo total (en bytes) de los archivos
+        """
+        if directory is None:
+            directory = str(Path.home() / ".calcquest" / "render_cache")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.version = version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        # Nombre de archivo -> {'size': bytes, 'last_access': timestamp}
+        self._entries: Dict[str, Dict] = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """Lee el índice; si es de otra versión o está dañado, vacía la carpeta."""
+        try:
+            with open(self.directory / self.INDEX_FILE, encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == self.version:
+                return {
+                    name: entry for name, entry in index.get("entries", {}).items()
+                    if (self.directory / name).exists()
+                }
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        for path in self.directory.glob("*.png"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._dirty = True
+        return {}
+
+    @staticmethod
+    def _file_name(key: Hashable) -> str:
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest() + ".png"
+
+    def get(self, key: Hashable) -> Optional[QImage]:
+        """
+        Busca la imagen de una clave de renderizado.
+
+        Returns:
+            QImage, o None si no está (o el archivo no se pudo leer)
+        """
+        name = self._file_name(key)
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                self.misses += 1
+                return None
+
+        image = QImage(str(self.directory / name))
+        with self._lock:
+            if image.isNull():
+                self._entries.pop(name, None)
+                self._dirty = True
+                self.misses += 1
+                return None
+            entry['last_access'] = time.time()
+            self._dirty = True
+            self.hits += 1
+        return image
+
+    def put(self, key: Hashable, image: QImage):
+        """Guarda la imagen de una clave y aplica el límite de tamaño."""
+        name = self._file_name(key)
+        path = self.directory / name
+        # Se escribe en un temporal y se renombra: un lector nunca ve un PNG a medias
+        temp_path = self.directory / f"{name}.{threading.get_ident()}.tmp"
+        if not image.save(str(temp_path), "PNG"):
+            return
+        try:
+            os.replace(temp_path, path)
+            size = path.stat().st_size
+        except OSError:
+            return
+
+        with self._lock:
+            self._entries[name] = {'size': size, 'last_access': time.time()}
+            self._evict()
+            self._dirty = True
+            self._save_index()
+
+    def _evict(self):
+        """Borra los archivos menos usados hasta cumplir el límite de tamaño."""
+        total_bytes = sum(entry['size'] for entry in self._entries.values())
+        if total_bytes <= self.max_bytes:
+            return
+        for name, entry in sorted(self._entries.items(), key=lambda item: item[1]['last_access']):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                (self.directory / name).unlink()
+            except OSError:
+                pass
+            del self._entries[name]
+            total_bytes -= entry['size']
+
+    def _save_index(self):
+        if not self._dirty:
+            return
+        index = {"version": self.version, "entries": self._entries}
+        temp_path = self.directory / f"{self.INDEX_FILE}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(temp_path, self.directory / self.INDEX_FILE)
+            self._dirty = False
+        except OSError:
+            pass
+
+    def flush(self):
+        """Guarda el índice (los accesos solo se escriben al guardar una imagen o aquí)."""
+        with self._lock:
+            self._save_index()
+
+    def clear(self):
+        """Elimina todas las imágenes almacenadas."""
+        with self._lock:
+            for name in self._entries:
+                try:
+                    (self.directory / name).unlink()
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._dirty = True
+            self._save_index()
+
+    def stats(self) -> Dict:
+        """Retorna contadores y tamaño actual de la caché."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'size_bytes': sum(entry['size'] for entry in self._entries.values()),
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+_disk_cache: Optional[DiskRenderCache] = None
+_disk_cache_opened = False
+_disk_lock = threading.Lock()
+
+
+def shared_disk_cache() -> Optional[DiskRenderCache]:
+    """
+    Caché en disco compartida del proceso (se abre al primer uso).
+
+    Su versión combina la de Matplotlib y RENDER_FORMAT_VERSION, así que
+    actualizar Matplotlib invalida las imágenes anteriores. La carpeta es
+    la de CALCQUEST_RENDER_CACHE si está definida.
+
+    Returns:
+        DiskRenderCache, o None si no se pudo abrir (sin permisos, disco lleno, etc.)
+    """
+    global _disk_cache, _disk_cache_opened
+    with _disk_lock:
+        if not _disk_cache_opened:
+            _disk_cache_opened = True
+            try:
+                import matplotlib
+                _disk_cache = DiskRenderCache(
+                    directory=os.environ.get(RENDER_CACHE_DIR_ENV) or None,
+                    version=f"{matplotlib.__version__}-{RENDER_FORMAT_VERSION}")
+                atexit.register(_disk_cache.flush)
+            except (ImportError, OSError) as e:
+                print(f"⚠️ No se pudo abrir la caché de fórmulas: {e}")
+                _disk_cache = None
+        return _disk_cache
@@ -0,0 +1,211 @@
+"""
+Renderizado asíncrono de fórmulas LaTeX.
+
+Rasterizar una fórmula con mathtext cuesta entre 10 y 30 ms; una solución
+de diez pasos bloquearía la interfaz todo ese tiempo. Con este servicio los
+widgets piden el renderizado, muestran un marcador ligero y reciben el
+QPixmap cuando un hilo de fondo lo termina:
+
+- Las fórmulas que ya están en la caché en memoria se entregan al instante.
+- Varias peticiones de la misma fórmula comparten un único renderizado.
+- Las peticiones de widgets destruidos (o que cambiaron de fórmula) se
+  descartan antes de renderizar.
+
+Los QPixmap solo se crean en el hilo de la interfaz; el hilo de fondo
+produce QImage (desde la caché en disco o con latex_renderer).
+"""
+
+import weakref
+from typing import Dict, Hashable, Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+from src.ui import latex_renderer
+from src.ui.render_cache import render_key, shared_disk_cache, shared_pixmap_cache
+
+
+def load_or_render(key: Hashable, latex_expr: str, fontsize: int, dpi: float) -> Optional[QImage]:
+    """
+    Imagen de la fórmula desde la caché en disco, renderizándola si no está.
+
+    Se puede llamar desde cualquier hilo.
+    """
+    disk_cache = shared_disk_cache()
+    image = disk_cache.get(key) if disk_cache is not None else None
+    if image is None:
+        image = latex_renderer.render_formula(latex_expr, fontsize, dpi)
+        if image is not None and disk_cache is not None:
+            disk_cache.put(key, image)
+    return image
+
+
+class _RenderJob:
+    """Renderizado pendiente de una fórmula (compartido por todos sus widgets)."""
+
+    __slots__ = ("key", "latex_expr", "fontsize", "dpi", "device_pixel_ratio",
+                 "cancelled", "skipped")
+
+    def __init__(self, key, latex_expr: str, fontsize: int, dpi: int, device_pixel_ratio: float):
+        self.key = key
+        self.latex_expr = latex_expr
+        self.fontsize = fontsize
+        self.dpi = dpi
+        self.device_pixel_ratio = device_pixel_ratio
+        self.cancelled = False  # Ya no hay widgets esperándolo
+        self.skipped = False    # El hilo lo descartó sin renderizar
+
+
+class _RenderRunnable(QRunnable):
+    """Renderiza un trabajo en el QThreadPool del servicio."""
+
+    def __init__(self, service: "RenderService", job: _RenderJob):
+        super().__init__()
+        self.service = service
+        self.job = job
+
+    def run(self):
+        job = self.job
+        image = None
+        if job.cancelled:
+            job.skipped = True
+        else:
+            try:
+                image = load_or_render(job.key, job.latex_expr, job.fontsize,
+                                       job.dpi * job.device_pixel_ratio)
+            except Exception:
+                image = None
+        self.service.job_done.emit(job, image)
+
+
+class RenderService(QObject):
+    """
+    Cola de renderizados en segundo plano para MathRenderWidget.
+
+    Debe crearse y usarse desde el hilo de la interfaz. Los widgets
+    reciben el resultado en _on_render_ready(pixmap) (None si falló).
+    """
+
+    # Emitida desde el hilo de fondo; se atiende en el de la interfaz
+    job_done = pyqtSignal(object, object)
+
+    def __init__(self, parent=None, max_threads: int = 1):
+        """
+        Args:
+            parent: QObject padre
+            max_threads: Hilos de renderizado (mathtext no es seguro para
+                hilos, así que más de uno apenas aporta)
+        """
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._jobs: Dict[Hashable, _RenderJob] = {}
+        # Clave -> {id del widget: referencia débil al widget}
+        self._waiting: Dict[Hashable, Dict[int, weakref.ref]] = {}
+        # id del widget -> clave que espera
+        self._widget_keys: Dict[int, Hashable] = {}
+        self._watched = set()
+        self.rendered = 0
+        self.dropped = 0
+        self.job_done.connect(self._on_job_done)
+
+    def request(self, widget, latex_expr: str, fontsize: int, dpi: int,
+                device_pixel_ratio: float) -> Optional[QPixmap]:
+        """
+        Pide el renderizado de una fórmula para un widget.
+
+        Reemplaza cualquier petición anterior del mismo widget.
+
+        Returns:
+            El QPixmap si ya estaba en la caché en memoria; si no, None y el
+            resultado llegará más tarde a widget._on_render_ready
+        """
+        widget_id = id(widget)
+        self._detach(widget_id)
+
+        key = render_key(latex_expr, fontsize, dpi, device_pixel_ratio)
+        pixmap = shared_pixmap_cache().get(key)
+        if pixmap is not None:
+            return pixmap
+
+        if widget_id not in self._watched:
+            self._watched.add(widget_id)
+            widget.destroyed.connect(lambda _=None, wid=widget_id: self._on_widget_destroyed(wid))
+        self._waiting.setdefault(key, {})[widget_id] = weakref.ref(widget)
+        self._widget_keys[widget_id] = key
+
+        job = self._jobs.get(key)
+        if job is None:
+            job = _RenderJob(key, latex_expr, fontsize, dpi, device_pixel_ratio)
+            self._jobs[key] = job
+            self._pool.start(_RenderRunnable(self, job))
+        else:
+            # Un trabajo cancelado que aún no empezó vuelve a ser útil
+            job.cancelled = False
+        return None
+
+    def cancel(self, widget):
+        """Descarta la petición pendiente del widget, si la hay."""
+        self._detach(id(widget))
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Espera a que terminen los renderizados en curso (para pruebas y cierre)."""
+        return self._pool.waitForDone(msecs)
+
+    def _on_widget_destroyed(self, widget_id: int):
+        self._watched.discard(widget_id)
+        self._detach(widget_id)
+
+    def _detach(self, widget_id: int):
+        """Quita al widget de su fórmula; si nadie más la espera, cancela el trabajo."""
+        key = self._widget_keys.pop(widget_id, None)
+        if key is None:
+            return
+        waiters = self._waiting.get(key, {})
+        waiters.pop(widget_id, None)
+        if not waiters:
+            self._waiting.pop(key, None)
+            job = self._jobs.get(key)
+            if job is not None:
+                job.cancelled = True
+
+    def _on_job_done(self, job: _RenderJob, image: Optional[QImage]):
+        """Convierte el resultado en QPixmap y lo entrega a los widgets que siguen vivos."""
+        waiters = self._waiting.get(job.key, {})
+        if job.skipped:
+            if waiters:
+                # Se volvió a pedir después de que el hilo lo descartara
+                job.cancelled = job.skipped = False
+                self._pool.start(_RenderRunnable(self, job))
+            else:
+                self._jobs.pop(job.key, None)
+                self.dropped += 1
+            return
+
+        self._jobs.pop(job.key, None)
+        self._waiting.pop(job.key, None)
+        pixmap = None
+        if image is not None and not image.isNull():
+            self.rendered += 1
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(job.device_pixel_ratio)
+            shared_pixmap_cache().put(job.key, pixmap)
+
+        for widget_id, ref in waiters.items():
+            self._widget_keys.pop(widget_id, None)
+            widget = ref()
+            if widget is not None and not sip.isdeleted(widget):
+                widget._on_render_ready(pixmap)
+
+
+# Instancia compartida por todas las vistas del proceso
+_service: Optional[RenderService] = None
+
+
+def render_service() -> RenderService:
+    """Retorna el servicio de renderizado del proceso (se crea al primer uso)."""
+    global _service
+    if _service is None:
+        _service = RenderService()
+    return _service
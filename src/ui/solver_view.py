@@ -3,9 +3,10 @@ from PyQt6.QtWidgets import (
     QPushButton, QLabel, QScrollArea, QFrame, QSplitter,
     QListWidgetItem, QSizePolicy
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
-from src.engine.step_engine import StepEngine
+from collections import deque
+from src.engine.service import get_executor
 from src.ui.math_keyboard import MathKeyboard, MathRenderWidget
 
 
@@ -103,10 +104,93 @@ class ChatMessageWidget(QFrame):
         layout.addWidget(msg_label)
 
 
+class TypingIndicatorWidget(QFrame):
+    """Indicador animado de que el Solver está trabajando."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet("""
+            QFrame {
+                background-color: #ffffff;
+                border: 1px solid #e2e8f0;
+                border-radius: 12px;
+                margin: 2px 2px 2px 40px;
+            }
+        """)
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(12, 8, 12, 8)
+        
+        self.label = QLabel()
+        self.label.setStyleSheet("""
+            font-size: 13px;
+            font-style: italic;
+            color: #059669;
+        """)
+        layout.addWidget(self.label)
+        layout.addStretch()
+        
+        self._dots = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(400)
+        self._timer.timeout.connect(self._animate)
+        self._animate()
+    
+    def _animate(self):
+        self._dots = self._dots % 3 + 1
+        self.label.setText("Solver está resolviendo" + "." * self._dots)
+    
+    def start(self):
+        self._timer.start()
+        self.show()
+    
+    def stop(self):
+        self._timer.stop()
+        self.hide()
+
+
+class SolveSignals(QObject):
+    """Señales emitidas por SolveRunnable desde el hilo trabajador."""
+    step_ready = pyqtSignal(object)  # Step
+    finished = pyqtSignal(str)       # Estado final de la solicitud
+
+
+class SolveRunnable(QRunnable):
+    """
+    Consume en un hilo del QThreadPool los pasos de una SolveTask y
+    emite cada uno por señales en cuanto llega, sin bloquear el hilo de
+    la interfaz.
+    """
+    
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+        self.signals = SolveSignals()
+    
+    def run(self):
+        for step in self.task.iter_steps():
+            self.signals.step_ready.emit(step)
+        self.signals.finished.emit(self.task.status)
+
+
 class SolverView(QWidget):
     def __init__(self):
         super().__init__()
-        self.engine = StepEngine()
+        # Las resoluciones corren en procesos aparte con límite de tiempo y
+        # memoria; el ejecutor (y sus cachés calientes) lo comparten todas las vistas
+        self.executor = get_executor()
+        self._current_task = None
+        self._current_runnable = None
+        self._solve_finished = True
+        self._step_count = 0
+        
+        # Los pasos recibidos se renderizan de uno en uno, devolviendo el
+        # control al bucle de eventos entre pasos
+        self._pending_steps = deque()
+        self._render_timer = QTimer(self)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_next_step)
+        
         self._setup_ui()
 
     def _setup_ui(self):
@@ -183,7 +267,18 @@ class SolverView(QWidget):
         self.chat_layout.setSpacing(8)
         self.chat_layout.addStretch()
         
+        # Indicador de "resolviendo" (siempre al final del chat)
+        self.typing_indicator = TypingIndicatorWidget()
+        self.typing_indicator.hide()
+        self.chat_layout.addWidget(self.typing_indicator)
+        
         self.chat_scroll.setWidget(self.chat_widget)
+        
+        # Seguir el final del chat solo si el usuario no se desplazó hacia arriba
+        self._follow_chat = True
+        scrollbar = self.chat_scroll.verticalScrollBar()
+        scrollbar.valueChanged.connect(self._on_chat_scrolled)
+        scrollbar.rangeChanged.connect(self._on_chat_range_changed)
         chat_layout.addWidget(self.chat_scroll)
         
         self.main_splitter.addWidget(chat_container)
@@ -254,6 +349,27 @@ class SolverView(QWidget):
         self.send_btn.clicked.connect(self._handle_send)
         input_layout.addWidget(self.send_btn)
         
+        self.cancel_btn = QPushButton("Cancelar ✕")
+        self.cancel_btn.setObjectName("cancel_btn")
+        self.cancel_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #f1f5f9;
+                color: #ef4444;
+                font-weight: bold;
+                font-size: 14px;
+                padding: 10px 20px;
+                border-radius: 8px;
+                border: 1px solid #fecaca;
+            }
+            QPushButton:hover {
+                background-color: #fee2e2;
+            }
+        """)
+        self.cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.cancel_btn.clicked.connect(self._handle_cancel)
+        self.cancel_btn.hide()
+        input_layout.addWidget(self.cancel_btn)
+        
         layout.addWidget(input_frame)
         
         # Mantener compatibilidad con tests existentes (oculto pero parte del árbol de widgets)
@@ -276,13 +392,8 @@ class SolverView(QWidget):
         """Añade un mensaje al historial del chat."""
         msg_widget = ChatMessageWidget(sender, message, is_user)
         
-        # Insertar antes del stretch
-        self.chat_layout.insertWidget(self.chat_layout.count() - 1, msg_widget)
-        
-        # Scroll al final
-        self.chat_scroll.verticalScrollBar().setValue(
-            self.chat_scroll.verticalScrollBar().maximum()
-        )
+        # Insertar antes del stretch y del indicador
+        self.chat_layout.insertWidget(self.chat_layout.count() - 2, msg_widget)
         
         # Mantener compatibilidad con tests
         self.chat_history.addItem(f"{sender}: {message}")
@@ -291,41 +402,105 @@ class SolverView(QWidget):
         """Añade un paso de solución con renderizado matemático."""
         step_widget = SolutionStepWidget(step_number, explanation, latex)
         
-        # Insertar antes del stretch
-        self.chat_layout.insertWidget(self.chat_layout.count() - 1, step_widget)
-        
-        # Scroll al final
-        self.chat_scroll.verticalScrollBar().setValue(
-            self.chat_scroll.verticalScrollBar().maximum()
-        )
+        # Insertar antes del stretch y del indicador
+        self.chat_layout.insertWidget(self.chat_layout.count() - 2, step_widget)
         
         # Mantener compatibilidad con tests
         self.chat_history.addItem(f"Solver: {explanation}")
         self.chat_history.addItem(f"        [ {latex} ]")
 
     def _handle_send(self):
+        if self._current_task is not None:
+            # Ya hay una resolución en curso
+            return
         text = self.input_field.text().strip()
         if text:
             # Add User message
             self._add_message("Tú", text, is_user=True)
             self.input_field.clear()
             
-            # Simple heuristic to transform user input to Engine format
-            # This is a basic integration for demonstration
-            # In a real app, we'd need a robust parser from 'y' + 2y' to SymPy objects
+            # El motor entiende la notación del estudiante (y', dy/dx, e^x...)
             engine_input = text
-            if "y'" in text:
-                engine_input = text.replace("y'", "Derivative(y(x), x)").replace("e^x", "exp(x)")
-                # Remove spaces and normalize multiplication for basic parsing if needed
             
             self._add_message("Solver", "¡Entendido! Analizando tu ecuación...", is_user=False)
             
             try:
-                steps = self.engine.solve_steps(engine_input)
-                if steps:
-                    for i, step in enumerate(steps, 1):
-                        self._add_solution_step(i, step.explanation, step.latex)
-                else:
-                    self._add_message("Solver", "No pude encontrar pasos para esta ecuación aún. Intenta con otro formato.", is_user=False)
+                task = self.executor.submit(engine_input)
             except Exception as e:
-                self._add_message("Solver", f"Ocurrió un error al procesar: {str(e)}", is_user=False)
\ No newline at end of file
+                self._add_message("Solver", f"Ocurrió un error al procesar: {str(e)}", is_user=False)
+                return
+            
+            self._current_task = task
+            self._solve_finished = False
+            self._step_count = 0
+            
+            runnable = SolveRunnable(task)
+            runnable.signals.step_ready.connect(self._on_step_ready)
+            runnable.signals.finished.connect(self._on_solve_finished)
+            self._current_runnable = runnable
+            
+            self._set_solving(True)
+            self._follow_chat = True
+            self.typing_indicator.start()
+            QThreadPool.globalInstance().start(runnable)
+    
+    def _handle_cancel(self):
+        """Cancela la resolución en curso."""
+        if self._current_task is not None:
+            self._current_task.cancel()
+            self.cancel_btn.setEnabled(False)
+    
+    def _set_solving(self, solving: bool):
+        """Alterna los controles entre 'resolviendo' y 'listo'."""
+        self.send_btn.setVisible(not solving)
+        self.cancel_btn.setVisible(solving)
+        self.cancel_btn.setEnabled(solving)
+    
+    def _on_step_ready(self, step):
+        """Encola un paso recibido del trabajador para renderizarlo."""
+        self._pending_steps.append(step)
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+    
+    def _on_solve_finished(self, status: str):
+        """Marca la resolución como terminada (pueden quedar pasos por renderizar)."""
+        self._solve_finished = True
+        self._current_runnable = None
+        if not self._render_timer.isActive():
+            self._finish_solving()
+    
+    def _render_next_step(self):
+        """Renderiza un solo paso por vuelta del bucle de eventos."""
+        if self._pending_steps:
+            step = self._pending_steps.popleft()
+            self._step_count += 1
+            explanation = step.explanation
+            if step.verified is True:
+                explanation += "\n✔️ Verificada numéricamente"
+            elif step.verified is False:
+                explanation += "\n⚠️ La comprobación numérica no coincide: revisa esta solución"
+            self._add_solution_step(self._step_count, explanation, step.latex)
+        
+        if not self._pending_steps:
+            self._render_timer.stop()
+            if self._solve_finished:
+                self._finish_solving()
+    
+    def _finish_solving(self):
+        """Restaura los controles cuando terminó la resolución y el renderizado."""
+        self.typing_indicator.stop()
+        self._set_solving(False)
+        self._current_task = None
+        
+        if self._step_count == 0:
+            self._add_message("Solver", "No pude encontrar pasos para esta ecuación aún. Intenta con otro formato.", is_user=False)
+    
+    def _on_chat_scrolled(self, value: int):
+        """Deja de seguir el final del chat si el usuario se desplaza hacia arriba."""
+        scrollbar = self.chat_scroll.verticalScrollBar()
+        self._follow_chat = value >= scrollbar.maximum() - 20
+    
+    def _on_chat_range_changed(self, minimum: int, maximum: int):
+        """Mantiene visible el último mensaje mientras el usuario esté siguiendo el chat."""
+        if self._follow_chat:
+            self.chat_scroll.verticalScrollBar().setValue(maximum)
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from src.engine.solution_cache import CACHE_PATH_ENV
+from src.ui.render_cache import RENDER_CACHE_DIR_ENV
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_caches(tmp_path_factory):
+    """
+    Apunta las cachés persistentes a un directorio temporal, para que las
+    pruebas no escriban en las del usuario (~/.calcquest). Los procesos
+    trabajadores heredan las variables de entorno.
+    """
+    cache_dir = tmp_path_factory.mktemp("calcquest")
+    overrides = {
+        CACHE_PATH_ENV: str(cache_dir / "solutions.db"),
+        RENDER_CACHE_DIR_ENV: str(cache_dir / "render_cache"),
+    }
+    previous = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    yield cache_dir
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
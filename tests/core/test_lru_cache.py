@@ -0,0 +1,42 @@
+import pytest
+from src.core.lru_cache import LRUCache
+
+def test_get_and_put():
+    cache = LRUCache(maxsize=2)
+    assert cache.get("a") is None
+    
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert "a" in cache
+    
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "b" pasa a ser la menos usada
+    cache.put("c", 3)
+    
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.stats()['evictions'] == 1
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+def test_bounded_by_weight():
+    cache = LRUCache(maxsize=10, weigher=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    cache.put("c", "xxxx")  # 12 > 10: se desaloja "a"
+    
+    assert "a" not in cache
+    assert cache.stats()['weight'] == 8
+    
+    # Un valor más pesado que el límite no se guarda
+    cache.put("d", "x" * 11)
+    assert "d" not in cache and len(cache) == 2
@@ -0,0 +1,31 @@
+import json
+import pytest
+from src.engine.batch import main, read_equations
+from src.engine.step_engine import StepEngine
+
+def test_read_text_and_jsonl(tmp_path):
+    txt = tmp_path / "problemas.txt"
+    txt.write_text("# comentario\ny' + 2y = e^x\n\ny' = x*y^2\n", encoding="utf-8")
+    assert [r["equation"] for r in read_equations(str(txt))] == ["y' + 2y = e^x", "y' = x*y^2"]
+    
+    jsonl = tmp_path / "problemas.jsonl"
+    jsonl.write_text('{"id": 7, "ecuacion": "y\' = x*y^2"}\n', encoding="utf-8")
+    assert read_equations(str(jsonl)) == [{"id": 7, "ecuacion": "y' = x*y^2", "equation": "y' = x*y^2"}]
+
+def test_batch_cli_writes_jsonl(tmp_path):
+    source = tmp_path / "problemas.jsonl"
+    source.write_text('{"id": 1, "equation": "y\' + 2y = e^x"}\n', encoding="utf-8")
+    output = tmp_path / "soluciones.jsonl"
+    
+    assert main([str(source), "-o", str(output), "--workers", "1"]) == 0
+    
+    results = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert results[0]["id"] == 1
+    assert results[0]["steps"][-1]["step_type"] == "solution"
+
+def test_solve_many_keeps_order():
+    equations = ["y' + 2y = e^x", "y' = x*y^2", "x^2 + 1"]
+    results = StepEngine().solve_many(equations, workers=2)
+    
+    assert [steps[0].latex for steps in results] == equations
+    assert results[0][-1].step_type == "solution"
@@ -0,0 +1,16 @@
+from src.engine.equivalence import answers_equivalent
+
+def test_reordered_terms_and_renamed_constants_are_equivalent():
+    assert answers_equivalent("C1cos(2x)+C2sin(2x)", "y = C2 sin(2x) + C1 cos(2x)")
+    assert answers_equivalent("C1cos(2x)+C2sin(2x)", "C2cos(2x)+C1sin(2x)")
+    assert answers_equivalent("y = Ce^(-2x) + e^x/3", "y = e^x/3 + C*exp(-2*x)")
+
+def test_different_solutions_are_not_equivalent():
+    assert answers_equivalent("y = Ce^(-2x) + e^x/2", "y = Ce^(-2x) + e^x/3") is False
+    assert answers_equivalent("C1 e^x", "C1 e^x + C2 e^(-x)") is False
+
+def test_constant_names_are_normalized():
+    assert answers_equivalent("y = Ae^x + Be^(-x)", "y = C1 e^x + C2 e^(-x)")
+    assert answers_equivalent("y = A e^x + B e^(-x)", "y = C1 e^x + C2 e^(-x)")
+    assert answers_equivalent("y = C e^{-2x}", "y = C1 e^(-2x)")
+    assert answers_equivalent("y = Ae^x", "y = C1 e^(-x)") is False
@@ -0,0 +1,12 @@
+from src.engine.step_engine import StepEngine
+
+def test_equivalent_forms_share_fingerprint():
+    engine = StepEngine()
+    reference = engine.fingerprint("y' + 2y = e^x")
+    for variant in ("2y + y' - e^x = 0", "2y' + 4y = 2e^x", "e^x = y' + 2y", "-y' - 2y = -e^x"):
+        assert engine.fingerprint(variant) == reference
+
+def test_different_equations_have_different_fingerprints():
+    engine = StepEngine()
+    assert engine.fingerprint("y' + 2y = e^x") != engine.fingerprint("y' + 2y = e^(2x)")
+    assert engine.fingerprint("y' + 2y = e^x") != engine.fingerprint("y' + 2xy = e^x")
@@ -0,0 +1,78 @@
+import pytest
+from sympy import symbols, Function, Derivative, exp, sin, cos, Symbol
+from src.engine.parser import EquationParser, ParseError
+from src.engine.step_engine import StepEngine
+
+x = symbols('x')
+y_func = Function('y')
+y = y_func(x)
+
+@pytest.fixture
+def parser():
+    return EquationParser(x, y_func)
+
+@pytest.mark.parametrize("text, expected", [
+    ("y' + 2y = e^x", (Derivative(y, x) + 2 * y, exp(x))),
+    ("dy/dx = xy", (Derivative(y, x), x * y)),
+    ("y'' + 4y = 0", (Derivative(y, (x, 2)) + 4 * y, 0)),
+    ("C1cos(2x)+C2sin(2x)", (Symbol('C1') * cos(2 * x) + Symbol('C2') * sin(2 * x), 0)),
+    ("y' = -x^2", (Derivative(y, x), -x ** 2)),
+    ("y' = e^-x", (Derivative(y, x), exp(-x))),
+])
+def test_parses_calcquest_notation(parser, text, expected):
+    assert parser.parse(text) == expected
+
+def test_reports_error_position(parser):
+    with pytest.raises(ParseError) as info:
+        parser.parse("y' + * 2")
+    assert info.value.position == 5
+    assert info.value.pointer() == "y' + * 2\n     ^"
+
+def test_unclosed_parenthesis(parser):
+    with pytest.raises(ParseError) as info:
+        parser.parse("y' = (2y")
+    assert info.value.position == len("y' = (2y")
+
+@pytest.mark.parametrize("text, expected", [
+    # y( solo es llamada explícita con el argumento x
+    ("y' = y(1-y)", (Derivative(y, x), y * (1 - y))),
+    ("2y(x+1)", (2 * y * (x + 1), 0)),
+    ("y' = x y(x)", (Derivative(y, x), x * y)),
+])
+def test_y_followed_by_parenthesis(parser, text, expected):
+    assert parser.parse(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("cos 2x", (cos(2 * x), 0)),
+    ("sin x + 1", (sin(x) + 1, 0)),
+    ("sin x cos x", (sin(x) * cos(x), 0)),
+    ("sin x^2", (sin(x ** 2), 0)),
+])
+def test_implicit_function_argument(parser, text, expected):
+    assert parser.parse(text) == expected
+
+@pytest.mark.parametrize("text", [
+    "y' + 2y = e^2x",
+    "y' = e^3x",
+    "y' + y = x e^2x + 1",
+    "e^xy",
+    "e^2 x",
+    "e^(2x)",
+    "e^2*x",
+])
+def test_exponent_of_e_matches_preprocessing(text):
+    # Mismo resultado que la ruta anterior (preprocesado + parse_expr)
+    engine = StepEngine()
+    assert engine._parser.parse(text) == engine._parse_processed(engine._preprocess_input(text))
+
+@pytest.mark.parametrize("text, expected", [
+    ("Ae^x + Be^(-x)", (Symbol('A') * exp(x) + Symbol('B') * exp(-x), 0)),
+    ("C e^{-2x}", (Symbol('C') * exp(-2 * x), 0)),
+    ("Asin(x)", (Symbol('A') * sin(x), 0)),
+])
+def test_uppercase_constants_and_braces(parser, text, expected):
+    assert parser.parse(text) == expected
+
+def test_rejects_sympy_names(parser):
+    with pytest.raises(ParseError):
+        parser.parse("Derivative(y(x), x) = y")
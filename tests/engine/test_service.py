@@ -0,0 +1,51 @@
+import threading
+from src.engine import service
+
+def test_engine_is_shared_across_threads():
+    engines = []
+    threads = [threading.Thread(target=lambda: engines.append(service.get_engine())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert all(engine is engines[0] for engine in engines)
+
+def test_parse_cache_is_shared():
+    engine = service.get_engine()
+    engine.solve_steps("y' + 3y = x")
+    hits = engine.parse_cache_stats()['hits']
+    
+    # Otra herramienta del mismo proceso reutiliza lo ya parseado
+    service.get_engine().analyze("y' + 3y = x")
+    assert service.get_engine().parse_cache_stats()['hits'] == hits + 1
+
+def test_executor_is_shared_and_restartable():
+    executor = service.get_executor()
+    assert service.get_executor() is executor
+    
+    service.shutdown()
+    assert service.get_executor() is not executor
+    service.shutdown()
+
+def test_warm_up_engine_ignores_errors():
+    # Una ecuación inválida en el corpus no interrumpe el calentamiento
+    service.warm_up_engine(service.get_engine(), ["y' + 3y = x", "y' = = x"])
+
+def test_prestarted_executor_solves():
+    executor = service.get_executor()
+    executor.prestart()
+    try:
+        steps = executor.solve("y' + 2y = 4")
+        assert steps[-1].step_type == "solution"
+    finally:
+        service.shutdown()
+
+def test_executor_cache_stays_out_of_home(isolated_caches):
+    executor = service.get_executor()
+    try:
+        executor.solve("y' + 5y = x")
+    finally:
+        service.shutdown()
+    
+    assert (isolated_caches / "solutions.db").exists()
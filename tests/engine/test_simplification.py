@@ -0,0 +1,18 @@
+from sympy import symbols, exp, sin, cos, log, count_ops
+from src.engine.simplification import budgeted_simplify
+
+x = symbols('x')
+
+def test_cheap_rewrites_simplify_without_escalating():
+    # powsimp combina las exponenciales y cancel reduce la fracción
+    expr = exp(x) * exp(2 * x) / (x ** 2 - 1) * (x - 1)
+    assert budgeted_simplify(expr, max_ops=0) == exp(3 * x) / (x + 1)
+
+def test_escalates_to_full_simplify_within_budget():
+    assert budgeted_simplify(sin(x) ** 2 + cos(x) ** 2) == 1
+
+def test_exhausted_budget_returns_input_form():
+    expr = sin(x) ** 2 + cos(x) ** 2 + log(x)
+    result = budgeted_simplify(expr, time_budget=0)
+    assert result == expr
+    assert count_ops(result) <= count_ops(expr)
@@ -0,0 +1,74 @@
+import pytest
+from src.engine.solution_cache import SolutionCache
+from src.engine.step_engine import StepEngine, Step
+
+def test_put_and_get(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.db"), engine_version="test")
+    steps = [{"latex": "y = C", "explanation": "Solución", "hint": "", "step_type": "solution"}]
+    
+    assert cache.get("k") is None
+    cache.put("k", steps)
+    assert cache.get("k") == steps
+    
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['entries'] == 1
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.db"), engine_version="test", max_entries=2)
+    cache.put("a", [])
+    cache.put("b", [])
+    cache.get("a")
+    cache.put("c", [])
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == []
+    assert cache.get("c") == []
+
+def test_other_engine_version_is_discarded(tmp_path):
+    db_path = str(tmp_path / "solutions.db")
+    SolutionCache(db_path, engine_version="1").put("k", [])
+    
+    cache = SolutionCache(db_path, engine_version="2")
+    assert cache.get("k") is None
+
+def test_engine_reuses_cached_solution(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.db"), engine_version="test")
+    steps = StepEngine(solution_cache=cache).solve_steps("y' + 2y = e^x")
+    
+    # Un motor nuevo (p. ej. tras reiniciar la app) obtiene los pasos de la caché
+    cached_steps = StepEngine(solution_cache=cache).solve_steps("y'+2y=e^x")
+    
+    assert cache.stats()['hits'] == 1
+    assert [s.latex for s in cached_steps[1:]] == [s.latex for s in steps[1:]]
+    assert cached_steps[0].latex == "y'+2y=e^x"
+
+def test_equivalent_forms_share_cached_solution(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.db"), engine_version="test")
+    steps = StepEngine(solution_cache=cache).solve_steps("y' + 2y = e^x")
+    
+    # Misma ecuación reordenada: solo cambian la entrada y su identificación
+    reordered_steps = StepEngine(solution_cache=cache).solve_steps("2y + y' - e^x = 0")
+    assert cache.stats()['hits'] == 1
+    assert [s.latex for s in reordered_steps[2:]] == [s.latex for s in steps[2:]]
+    
+    # Escalada: los pasos muestran otros coeficientes, así que no se reutilizan
+    StepEngine(solution_cache=cache).solve_steps("4y + 2y' - 2e^x = 0")
+    assert cache.stats()['hits'] == 1
+
+def test_only_complete_solutions_are_stored(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.db"), engine_version="test")
+    steps = StepEngine(solution_cache=cache).solve_steps("y' + y^2 = x")
+    
+    assert "solution" not in [s.step_type for s in steps]
+    assert cache.stats()['entries'] == 0
+
+def test_database_errors_are_misses(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.db"), engine_version="test")
+    cache.connection.close()  # Cualquier consulta falla con sqlite3.Error
+    
+    assert cache.get("k") is None
+    cache.put("k", [])
+    steps = StepEngine(solution_cache=cache).solve_steps("y' + 2y = e^x")
+    assert steps[-1].step_type == "solution"
@@ -0,0 +1,46 @@
+import pytest
+from src.engine.solve_executor import SolveExecutor, _memory_step
+
+@pytest.fixture
+def executor():
+    executor = SolveExecutor(max_workers=1, timeout=30)
+    yield executor
+    executor.shutdown()
+
+def test_solve_in_worker_process(executor):
+    steps = executor.solve("y' + 2y = e^x")
+    
+    assert steps[-1].step_type == "solution"
+
+def test_timeout_returns_timeout_step(executor):
+    # Un presupuesto mínimo no alcanza ni para arrancar el trabajador
+    task = executor.submit("y' + 2y = e^x", timeout=0.01)
+    steps = task.result()
+    
+    assert task.status == "timeout"
+    assert steps[-1].step_type == "timeout"
+    
+    # El ejecutor sigue funcionando tras terminar el proceso
+    assert executor.solve("y' = x*y^2")[-1].step_type == "solution"
+
+def test_cancel(executor):
+    task = executor.submit("y' + 2y = e^x")
+    task.cancel()
+    steps = task.result()
+    
+    assert task.status == "cancelled"
+    assert steps[-1].step_type == "cancelled"
+
+def test_iter_steps_streams_results(executor):
+    task = executor.submit("y' + 2y = e^x")
+    steps = list(task.iter_steps())
+    
+    assert steps[0].step_type == "input"
+    assert steps[-1].step_type == "solution"
+    assert [s.latex for s in steps] == [s.latex for s in task.result()]
+
+def test_memory_step_is_distinct_from_timeout():
+    step = _memory_step(512)
+    
+    assert step.step_type == "memory"
+    assert "512 MB" in step.explanation
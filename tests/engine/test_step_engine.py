@@ -1,5 +1,5 @@
 import pytest
-from src.engine.step_engine import StepEngine, Step
+from src.engine.step_engine import StepEngine, Step, AnalyzedEquation
 
 def test_identify_linear_first_order():
     # Input: y' + 2y = e^x
@@ -29,4 +29,144 @@ def test_solve_linear_steps():
     
     # 2. Integrating Factor
     has_mu_step = any("Factor Integrante" in s.explanation for s in steps)
-    assert has_mu_step
\ No newline at end of file
+    assert has_mu_step
+
+def test_analyze_parses_once():
+    # El análisis debe contener todo lo que necesitan los solucionadores
+    engine = StepEngine()
+    analysis = engine.analyze("y'' + 3y' + 2y = 0")
+    
+    assert isinstance(analysis, AnalyzedEquation)
+    assert analysis.order == 2
+    assert analysis.eq_type == "Segundo Orden Homogénea (Coeficientes Constantes)"
+    assert analysis.expr == analysis.lhs - analysis.rhs
+    assert len(analysis.derivatives) == 2
+
+def test_parse_cache_normalizes_whitespace():
+    engine = StepEngine()
+    first = engine._parse_equation("y' + 2y = e^x")
+    second = engine._parse_equation("y'+2y  =e^x")
+    
+    assert first == second
+    stats = engine.parse_cache_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+def test_solve_steps_iter_is_incremental():
+    engine = StepEngine()
+    steps_iter = engine.solve_steps_iter("y' + 2y = e^x")
+    
+    # El primer paso se entrega sin esperar al resto de la solución
+    first = next(steps_iter)
+    assert first.step_type == "input"
+    
+    rest = list(steps_iter)
+    assert rest[-1].step_type == "solution"
+    assert len(rest) + 1 == len(engine.solve_steps("y' + 2y = e^x"))
+
+def test_dsolve_uses_hint_of_identified_type():
+    engine = StepEngine()
+    analysis = engine.analyze("y' = x*y^2")
+    
+    assert engine._ranked_hints(analysis)[0] == "separable"
+    solution = engine._dsolve_hinted(analysis)
+    assert solution is not None
+    assert solution.lhs == engine.y
+
+@pytest.mark.parametrize("equation, expected", [
+    ("y'' + 3y' + 2y = 0", "C_{1} e^{- x} + C_{2} e^{- 2 x}"),   # raíces reales distintas
+    ("y'' + 2y' + y = 0", "C_{1} e^{- x} + C_{2} x e^{- x}"),    # raíz repetida
+    ("y'' + 4y = 0", r"C_{1} \cos{\left(2 x \right)} + C_{2} \sin{\left(2 x \right)}"),  # complejas
+])
+def test_second_order_constant_coefficients(equation, expected):
+    engine = StepEngine()
+    assert engine.identify_type(equation) == "Segundo Orden Homogénea (Coeficientes Constantes)"
+    
+    steps = engine.solve_steps(equation)
+    assert any("ecuación característica" in s.explanation for s in steps)
+    assert steps[-1].step_type == "solution"
+    assert steps[-1].latex == f"y_h = {expected}"
+
+def test_second_order_nonhomogeneous():
+    engine = StepEngine()
+    steps = engine.solve_steps("y'' - y = e^(2x)")
+    
+    assert steps[-1].step_type == "solution"
+    assert "\\frac{e^{2 x}}{3}" in steps[-1].latex
+
+def test_separable_uses_actual_functions():
+    engine = StepEngine()
+    assert engine.identify_type("dy/dx = e^(x+y)") == "Variables Separables"
+    assert engine.identify_type("y' = y^2 + x^2") == "Primer Orden (tipo por determinar)"
+    
+    steps = engine.solve_steps("y' = x*y^2")
+    latexes = [s.latex for s in steps]
+    assert r"\frac{1}{y^{2}} \, dy = x \, dx" in latexes
+    assert steps[-1].step_type == "solution"
+    assert steps[-1].latex == r"y = - \frac{2}{2 C + x^{2}}"
+
+def test_memo_reuses_expression_results():
+    from src.engine.expr_memo import ExpressionMemo
+    engine = StepEngine(memo=ExpressionMemo())
+    engine.solve_steps("y' + 2y = e^x")
+    first = engine.memo_stats()
+    # μ(x) se muestra varias veces en la misma solución
+    assert first['latex']['hits'] > 0
+    
+    engine.solve_steps("y' + 2y = x")
+    second = engine.memo_stats()
+    # P(x) = 2 ya se había integrado
+    assert second['integrate']['hits'] > first['integrate']['hits']
+
+def test_solution_step_is_numerically_verified():
+    engine = StepEngine()
+    for equation in ("y' + 2y = e^x", "y' = x*y^2"):
+        solution = engine.solve_steps(equation)[-1]
+        assert solution.step_type == "solution"
+        assert solution.verified is True
+        assert Step.from_dict(solution.to_dict()).verified is True
+
+def test_parse_falls_back_to_sympy_syntax():
+    engine = StepEngine()
+    lhs, rhs = engine._parse_equation("Derivative(y(x), x) + 2*y(x) = exp(x)")
+    assert (lhs, rhs) == engine._parse_equation("y' + 2y = e^x")
+    
+    error = engine.solve_steps("y' + * 2")[-1]
+    assert error.step_type == "error"
+    assert "posición 6" in error.explanation
+
+def test_separable_unevaluated_integral_falls_back_to_dsolve():
+    steps = StepEngine().solve_steps("y' = x^x*y^2")
+    
+    # No se presenta "∫ ... = ∫ x^x dx + C" como solución
+    assert not any(r"\int" in step.latex and "+ C" in step.latex for step in steps[:-1])
+    assert steps[-1].step_type == "solution"
+    assert "integral" in steps[-1].explanation
+
+def test_separable_states_domain_of_even_root():
+    solution = StepEngine().solve_steps("y' = x*sqrt(y)")[-1]
+    
+    assert solution.verified is not True
+    assert r"C + \frac{x^{2}}{2} \geq 0" in solution.explanation
+
+def test_steps_keep_the_coefficients_as_written():
+    steps = StepEngine().solve_steps("2y'' + 4y' + 2y = 0")
+    coefficients = next(step for step in steps if step.latex.startswith("a = "))
+    assert coefficients.latex == r"a = 2, \quad b = 4, \quad c = 2"
+
+@pytest.mark.parametrize("equation", [
+    "x*y' + y = x^2",
+    "x^2 y' + 2xy = 1",
+    "x*y' - y = x^3",
+    "(x+1)y' + y = 1",
+])
+def test_linear_with_variable_derivative_coefficient(equation):
+    solution = StepEngine().solve_steps(equation)[-1]
+    assert solution.step_type == "solution"
+    assert solution.verified is True
+    assert "y{\\left(x \\right)}" not in solution.latex and "\\int" not in solution.latex
+
+def test_linear_without_closed_form_is_not_a_solution():
+    last = StepEngine().solve_steps("y' = x^x*y - 1")[-1]
+    assert last.step_type == "warning"
+    assert last.verified is None
@@ -0,0 +1,40 @@
+import json
+import threading
+from src.engine.expr_memo import ExpressionMemo
+from src.engine.step_engine import StepEngine
+
+def test_trace_records_stages_and_operations(tmp_path):
+    engine = StepEngine(memo=ExpressionMemo())
+    closed = []
+    
+    with engine.trace(callback=closed.append) as tracer:
+        engine.solve_steps("y' + 2y = e^x")
+    
+    summary = tracer.summary()
+    for stage in ("solve_steps", "parse", "classify", "solve_linear_first_order", "integrate"):
+        assert stage in summary
+    assert summary["solve_linear_first_order"]["ops"]["integrate"] >= 2
+    assert len(closed) == len(tracer.spans)
+    # Fuera del bloque el motor deja de medir
+    assert engine.tracer is None
+    
+    path = tmp_path / "trace.json"
+    tracer.dump_chrome_trace(str(path))
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert {"name", "ph", "ts", "dur", "pid", "tid"} <= set(events[0])
+
+def test_trace_only_measures_its_own_thread():
+    engine = StepEngine(memo=ExpressionMemo())
+    other_thread_tracers = []
+    
+    def solve_elsewhere():
+        other_thread_tracers.append(engine.tracer)
+        engine.solve_steps("y' = 3y")
+    
+    with engine.trace() as tracer:
+        worker = threading.Thread(target=solve_elsewhere)
+        worker.start()
+        worker.join()
+    
+    assert other_thread_tracers == [None]
+    assert tracer.spans == []
@@ -0,0 +1,27 @@
+from sympy import symbols, Function, Derivative, exp, sqrt
+from src.engine.verification import verify_solution
+
+x, C = symbols('x C')
+y = Function('y')(x)
+
+def test_correct_solution_is_verified():
+    # y' + 2y = e^x
+    lhs = Derivative(y, x) + 2 * y
+    assert verify_solution(lhs, exp(x), y, C * exp(-2 * x) + exp(x) / 3, x, [C]) is True
+
+def test_wrong_solution_is_rejected():
+    lhs = Derivative(y, x) + 2 * y
+    assert verify_solution(lhs, exp(x), y, C * exp(-2 * x) + exp(x) / 2, x, [C]) is False
+
+def test_implicit_solution_is_not_evaluated():
+    lhs = Derivative(y, x)
+    assert verify_solution(lhs, x * y, y, y + C, x, [C]) is None
+
+def test_solution_valid_on_part_of_domain_is_inconclusive():
+    # y' = x·sqrt(y): y = (x²/2 + C)²/4 solo vale donde x²/2 + C ≥ 0
+    lhs = Derivative(y, x)
+    solution = (x ** 2 / 2 + C) ** 2 / 4
+    assert verify_solution(lhs, x * sqrt(y), y, solution, x, [C]) is None
+    
+    # Con C ≥ 0 vale en todos los puntos muestreados
+    assert verify_solution(lhs, x * sqrt(y), y, (x ** 2 / 2 + 3) ** 2 / 4, x) is True
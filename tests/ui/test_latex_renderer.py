@@ -0,0 +1,23 @@
+import pytest
+from PyQt6.QtGui import QImage
+from src.ui.latex_renderer import render_formula
+
+def test_renders_rgba_image_with_padding(qtbot):
+    image = render_formula(r"y = C e^{-2x}", fontsize=14, dpi=100)
+    
+    assert image.format() == QImage.Format.Format_RGBA8888
+    assert image.width() > image.height() > 20
+    # Margen blanco (0.1 pulgadas) y tinta oscura en el centro de la fórmula
+    assert image.pixelColor(2, 2).name() == "#ffffff"
+    darkest = min(image.pixelColor(x, image.height() // 2).lightness()
+                  for x in range(image.width()))
+    assert darkest < 100
+
+def test_higher_dpi_gives_larger_image(qtbot):
+    small = render_formula("x^2", dpi=100)
+    large = render_formula("x^2", dpi=200)
+    assert large.width() > 1.8 * small.width()
+
+def test_invalid_expression_raises(qtbot):
+    with pytest.raises(ValueError):
+        render_formula(r"\frac{")
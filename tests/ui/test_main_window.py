@@ -19,4 +19,21 @@ def test_initial_layout(qtbot):
     # and "5. Estrategia de Interfaz" -> "Barra lateral icónica simple"
     
     assert window.findChild(object, "sidebar") is not None
-    assert window.findChild(object, "content_area") is not None
\ No newline at end of file
+    assert window.findChild(object, "content_area") is not None
+
+def test_views_are_built_on_first_navigation(qtbot):
+    window = MainWindow()
+    qtbot.addWidget(window)
+    
+    # Al arrancar solo existe el Dashboard
+    assert not hasattr(window, 'solver_view')
+    
+    window._navigate_to(3)
+    assert window.content_area.currentWidget() is window.solver_view
+    assert window.content_area.count() == 6
+    
+    # Volver a la vista no la reconstruye
+    solver_view = window.solver_view
+    window._navigate_to(0)
+    window._navigate_to(3)
+    assert window.solver_view is solver_view
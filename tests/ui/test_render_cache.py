@@ -0,0 +1,74 @@
+from PyQt6.QtGui import QImage, QPixmap
+from src.ui.math_keyboard import MathRenderWidget
+from src.ui.render_cache import (
+    DiskRenderCache, create_pixmap_cache, render_key, shared_disk_cache, shared_pixmap_cache
+)
+
+def test_cache_is_bounded_by_bytes(qtbot):
+    pixmap = QPixmap(100, 100)
+    size = pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    cache = create_pixmap_cache(max_bytes=2 * size)
+    
+    for i in range(3):
+        cache.put(("f", i), QPixmap(100, 100))
+    
+    assert len(cache) == 2
+    assert cache.stats()['weight'] <= 2 * size
+
+def test_same_formula_is_rendered_once_across_widgets(qtbot):
+    cache = shared_pixmap_cache()
+    first = MathRenderWidget()
+    second = MathRenderWidget()
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+    
+    first.render_latex(r"y = C e^{-2x} + \frac{e^x}{3}")
+    qtbot.waitUntil(lambda: not first.pixmap().isNull())
+    hits = cache.stats()['hits']
+    
+    # El segundo widget la obtiene de la caché, sin esperar al renderizado
+    second.render_latex(r"y = C e^{-2x} + \frac{e^x}{3}")
+    assert cache.stats()['hits'] == hits + 1
+    assert not second.pixmap().isNull()
+
+def _image(width=40, height=20):
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(0xFFFFFF)
+    return image
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    key = render_key("y' + 2y = e^x", 14, 150, 1.0)
+    DiskRenderCache(str(tmp_path), version="1").put(key, _image())
+    
+    # Una instancia nueva (p. ej. tras reiniciar la app) encuentra la imagen
+    cache = DiskRenderCache(str(tmp_path), version="1")
+    image = cache.get(key)
+    assert image is not None and image.width() == 40
+    assert cache.get(render_key("y' + 2y = e^x", 16, 150, 1.0)) is None
+
+def test_disk_cache_discards_other_versions(tmp_path):
+    key = render_key("x^2", 14, 150, 1.0)
+    DiskRenderCache(str(tmp_path), version="3.8.0-1").put(key, _image())
+    
+    cache = DiskRenderCache(str(tmp_path), version="3.9.0-1")
+    assert cache.get(key) is None
+    assert not list(tmp_path.glob("*.png"))
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskRenderCache(str(tmp_path), version="1")
+    cache.put("a", _image())
+    size = cache.stats()['size_bytes']
+    cache.max_bytes = 2 * size
+    
+    cache.put("b", _image())
+    cache.get("a")  # "b" pasa a ser la menos usada
+    cache.put("c", _image())
+    
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+def test_shared_disk_cache_uses_isolated_directory(isolated_caches):
+    disk_cache = shared_disk_cache()
+    
+    assert disk_cache is not None
+    assert disk_cache.directory == isolated_caches / "render_cache"
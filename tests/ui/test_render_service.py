@@ -0,0 +1,47 @@
+import uuid
+from PyQt6 import sip
+from src.ui.math_keyboard import MathRenderWidget
+from src.ui.render_service import RenderService
+
+def _formula():
+    # Fórmula nueva en cada prueba, para no encontrarla en las cachés
+    return rf"y = \mathrm{{{uuid.uuid4().hex[:8]}}} e^{{-2x}}"
+
+def test_placeholder_then_pixmap(qtbot):
+    widget = MathRenderWidget()
+    qtbot.addWidget(widget)
+    
+    formula = _formula()
+    widget.render_latex(formula)
+    assert widget.text() == f"⏳ {formula}"
+    
+    qtbot.waitUntil(lambda: not widget.pixmap().isNull())
+
+def test_requests_for_destroyed_widgets_are_dropped(qtbot):
+    service = RenderService()
+    first = MathRenderWidget()
+    second = MathRenderWidget()
+    qtbot.addWidget(first)
+    
+    # Un solo hilo: el segundo trabajo espera mientras se renderiza el primero
+    assert service.request(first, _formula(), 14, 150, 1.0) is None
+    assert service.request(second, _formula(), 14, 150, 1.0) is None
+    sip.delete(second)
+    
+    service.wait_for_done()
+    qtbot.waitUntil(lambda: service.rendered + service.dropped == 2)
+    assert service.rendered == 1
+    assert service.dropped == 1
+
+def test_same_formula_is_rendered_once(qtbot):
+    service = RenderService()
+    widgets = [MathRenderWidget() for _ in range(3)]
+    for widget in widgets:
+        qtbot.addWidget(widget)
+    
+    formula = _formula()
+    for widget in widgets:
+        service.request(widget, formula, 14, 150, 1.0)
+    
+    qtbot.waitUntil(lambda: all(not w.pixmap().isNull() for w in widgets))
+    assert service.rendered == 1
@@ -1,7 +1,8 @@
 import pytest
-from PyQt6.QtWidgets import QLineEdit, QPushButton, QListWidget
+from PyQt6.QtWidgets import QLineEdit, QPushButton, QListWidget, QLabel
 from PyQt6.QtCore import Qt
 from src.ui.solver_view import SolverView
+from src.engine.step_engine import Step
 
 def test_solver_interface_elements(qtbot):
     view = SolverView()
@@ -46,4 +47,36 @@ def test_send_message_flow(qtbot):
     assert found_user_msg
     
     # Check if input cleared
-    assert input_field.text() == ""
\ No newline at end of file
+    assert input_field.text() == ""
+
+def test_solution_arrives_asynchronously(qtbot):
+    view = SolverView()
+    qtbot.addWidget(view)
+    
+    input_field = view.findChild(QLineEdit, "input_field")
+    chat_history = view.findChild(QListWidget, "chat_history")
+    
+    qtbot.keyClicks(input_field, "y' + 2y = e^x")
+    qtbot.keyClick(input_field, Qt.Key.Key_Return)
+    
+    # Mientras se resuelve, se muestra el indicador y se puede cancelar
+    assert view.typing_indicator.isVisibleTo(view)
+    assert view.cancel_btn.isVisibleTo(view)
+    
+    def has_solution():
+        texts = [chat_history.item(i).text() for i in range(chat_history.count())]
+        assert any("Solución General" in text for text in texts)
+    
+    qtbot.waitUntil(has_solution, timeout=30000)
+    qtbot.waitUntil(lambda: not view.typing_indicator.isVisibleTo(view))
+    assert not view.cancel_btn.isVisibleTo(view)
+
+def test_unverified_solution_is_flagged(qtbot):
+    view = SolverView()
+    qtbot.addWidget(view)
+    
+    view._on_step_ready(Step(latex="y = x", explanation="Solución", step_type="solution", verified=False))
+    
+    def flagged():
+        return any("no coincide" in label.text() for label in view.findChildren(QLabel))
+    qtbot.waitUntil(flagged)